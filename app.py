@@ -9,17 +9,26 @@ Usage (from repo root):
 from __future__ import annotations
 
 import argparse
+from dataclasses import replace
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator
 
 import pandas as pd
 
 from research_data_lib.pipeline import Pipeline
-from research_data_lib.transformers import HeaderNormalizer, PIIRemover, TypeCaster
-from research_data_lib.validators import RulesValidator
+from research_data_lib.research_data_lib import normalize_header
+from research_data_lib.transformers import (
+    Categorizer,
+    HeaderNormalizer,
+    PIIRemover,
+    TypeCaster,
+)
+from research_data_lib.validators import RulesValidator, ValidationReport
 from research_data_lib.io_utils import (
     load_raw_csv,
+    read_csv_header,
     save_cleaned_csv,
+    save_cleaned_parquet,
     save_validation_report,
     save_state,
 )
@@ -58,19 +67,71 @@ def build_pipeline() -> Pipeline:
     1. Normalize headers to snake_case.
     2. Remove PII columns.
     3. Cast selected columns to appropriate types.
+    4. Store low-cardinality text columns as `category`.
     """
     steps = [
         HeaderNormalizer(),
         PIIRemover(columns=DEFAULT_PII_COLUMNS),
         TypeCaster(type_map=DEFAULT_TYPE_MAP),
+        Categorizer(),
     ]
     return Pipeline(steps)
 
 
+def read_options(header: list[str]) -> Dict[str, Any]:
+    """
+    Work out `load_raw_csv` options from the raw CSV header so PII columns
+    are never parsed and columns the TypeCaster will cast skip inference.
+
+    Raw headers are matched through normalize_header, the same way the
+    pipeline sees them. Cast columns are read as plain text rather than
+    strict numeric dtypes: a bad cell would otherwise make read_csv fail
+    before validation could report it.
+    """
+    keep_cols = [h for h in header if normalize_header(h) not in DEFAULT_PII_COLUMNS]
+    dtypes = {h: str for h in keep_cols if normalize_header(h) in DEFAULT_TYPE_MAP}
+    return {
+        "keep_cols": keep_cols if len(keep_cols) < len(header) else None,
+        "dtypes": dtypes or None,
+    }
+
+
+def _run_streaming(
+    chunks: Iterator[pd.DataFrame],
+    cleaned_path: Path,
+    pipe: Pipeline,
+    validator: RulesValidator,
+    chunksize: int,
+) -> ValidationReport:
+    """
+    Clean and validate the CSV chunk by chunk, appending each cleaned chunk
+    to `cleaned_path`. Issue row indices are offset so they refer to rows of
+    the whole file. Note: "unique" rules are only checked within a chunk.
+
+    Raises:
+        ValueError: if a chunk cannot be parsed or the file has no rows.
+    """
+    issues = []
+    n_rows = 0
+    for i, chunk in enumerate(chunks):
+        cleaned = pipe.run(chunk)
+        save_cleaned_csv(cleaned, cleaned_path, append=i > 0)
+        chunk_report = validator.check(cleaned, DEFAULT_VALIDATION_RULES)
+        issues.extend(
+            replace(issue, row_idx=issue.row_idx + n_rows)
+            for issue in chunk_report.issues
+        )
+        n_rows += len(chunk)
+    print(f"[INFO] Pipeline finished. Streamed {n_rows} rows in chunks of {chunksize}")
+    return ValidationReport(issues, rules_configured=bool(DEFAULT_VALIDATION_RULES))
+
+
 def run_workflow(
     input_csv: Path,
     output_dir: Path,
     state_path: Path | None = None,
+    chunksize: int | None = None,
+    output_format: str = "csv",
 ) -> int:
     """
     Run the full survey cleaning + validation workflow.
@@ -82,37 +143,74 @@ def run_workflow(
       4. Save cleaned CSV and validation report.
       5. Optionally save JSON state (config + history).
 
+    If `chunksize` is given, steps 1-4 run on chunks of that many rows so the
+    whole file is never held in memory (see _run_streaming).
+
+    `output_format` selects how the cleaned data is written: "csv" or
+    "parquet" (requires pyarrow; not supported together with chunksize).
+
     Returns:
         Exit code (0 = success, non-zero = error).
     """
+    if output_format not in ("csv", "parquet"):
+        print(f"[ERROR] Unsupported output format: {output_format}")
+        return 1
+    if output_format == "parquet" and chunksize is not None:
+        print("[ERROR] Parquet output cannot be combined with --chunksize")
+        return 1
+
+    pipe = build_pipeline()
+    validator = RulesValidator()
+    cleaned_path = output_dir / f"cleaned_survey.{output_format}"
+
     try:
-        raw_df = load_raw_csv(input_csv)
+        options = read_options(read_csv_header(input_csv))
     except (FileNotFoundError, ValueError) as e:
         print(f"[ERROR] {e}")
         return 1
 
-    print(f"[INFO] Loaded raw CSV with shape: {raw_df.shape}")
+    if chunksize is not None:
+        try:
+            chunks = load_raw_csv(
+                input_csv, keep_cols=options["keep_cols"], chunksize=chunksize
+            )
+            # Ensure output directory exists before chunks are appended
+            output_dir.mkdir(parents=True, exist_ok=True)
+            report = _run_streaming(chunks, cleaned_path, pipe, validator, chunksize)
+        except (FileNotFoundError, ValueError) as e:
+            print(f"[ERROR] {e}")
+            return 1
+    else:
+        try:
+            raw_df = load_raw_csv(input_csv, **options)
+        except (FileNotFoundError, ValueError) as e:
+            print(f"[ERROR] {e}")
+            return 1
 
-    # Build and run pipeline
-    pipe = build_pipeline()
-    cleaned_df = pipe.run(raw_df)
+        print(f"[INFO] Loaded raw CSV with shape: {raw_df.shape}")
 
-    print(f"[INFO] Pipeline finished. Cleaned shape: {cleaned_df.shape}")
+        # Build and run pipeline
+        cleaned_df = pipe.run(raw_df)
 
-    # Run rules-based validation (if any rules are defined)
-    validator = RulesValidator()
-    if DEFAULT_VALIDATION_RULES:
+        print(f"[INFO] Pipeline finished. Cleaned shape: {cleaned_df.shape}")
+
+        # Run rules-based validation. With no rules configured yet this
+        # returns an empty report without scanning the data.
         report = validator.check(cleaned_df, DEFAULT_VALIDATION_RULES)
-    else:
-        # If no rules are configured yet, create a dummy "all good" report.
-        # This keeps the flow working until you define real rules.
-        report = validator.check(cleaned_df, {})
 
-    # Ensure output directory exists
-    output_dir.mkdir(parents=True, exist_ok=True)
+        # Ensure output directory exists
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        if output_format == "parquet":
+            try:
+                save_cleaned_parquet(cleaned_df, cleaned_path)
+            except ImportError as e:
+                print(f"[ERROR] {e}")
+                return 1
+        else:
+            save_cleaned_csv(cleaned_df, cleaned_path)
 
     # Save artifacts
-    cleaned_path = save_cleaned_csv(cleaned_df, output_dir / "cleaned_survey.csv")
     report_path = save_validation_report(report, output_dir / "validation_report.md")
 
     print(f"[INFO] Cleaned dataset saved to: {cleaned_path}")
@@ -129,6 +227,8 @@ def run_workflow(
             "pii_columns": DEFAULT_PII_COLUMNS,
             "type_map": DEFAULT_TYPE_MAP,
             "rules": DEFAULT_VALIDATION_RULES,
+            "chunksize": chunksize,
+            "output_format": output_format,
         }
         save_state(state_path, config=config, history=pipe.history)
         print(f"\n[INFO] State saved to: {state_path}")
@@ -162,6 +262,19 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="If set, do not write a JSON state file.",
     )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=None,
+        help="Stream the CSV in chunks of this many rows (e.g. 50000) "
+             "instead of loading it all at once.",
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=["csv", "parquet"],
+        default="csv",
+        help="File format for the cleaned dataset (parquet requires pyarrow).",
+    )
     return parser.parse_args()
 
 
@@ -171,7 +284,13 @@ def main() -> None:
     output_dir = Path(args.output_dir)
     state_path = None if args.no_state else Path(args.state_file)
 
-    exit_code = run_workflow(input_csv, output_dir, state_path)
+    exit_code = run_workflow(
+        input_csv,
+        output_dir,
+        state_path,
+        chunksize=args.chunksize,
+        output_format=args.output_format,
+    )
     raise SystemExit(exit_code)
 
 
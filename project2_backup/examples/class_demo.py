@@ -36,7 +36,7 @@ print("Snapshot:", ds.snapshot())
 #Sukhman Class demo
 
 import pandas as pd
-from src.data_pipeline import DataPipeline  # adjust import if needed
+from src.DataPipeline_class import DataPipeline
 
 # -- Sample Data --
 
@@ -98,15 +98,15 @@ analysis = DataAnalysis(df)
 
 # -- 1. Validate Email --
 print("Email Validation:")
-emails_to_check = [
+emails_to_check = pd.Series([
     "test@example.com",
     "invalid-email",
     "user@example.com",
     "another@example.com",
     "valid@domain.com"
-]
-for email in emails_to_check:
-    print(f"{email}: {analysis.validate_email(email)}")
+])
+for email, ok in zip(emails_to_check, analysis.validate_email_column(emails_to_check)):
+    print(f"{email}: {ok}")
 
 # -- 2. Filter Rows by Condition (Age > 30) --
 print("\nFiltered Rows (Age > 30):")
@@ -1,12 +1,34 @@
-# Simple 1- Karl
-from src.research_data_lib import normalize_header
+# Shared imports for all demos below (each module is loaded once).
+import os
+
+import numpy as np
+import pandas as pd
 
+from src.research_data_lib import (
+    normalize_header,
+    cast_row_types,
+    rename_columns,
+    validate_dataset,
+    strip_whitespace,
+    merge_datasets,
+    fill_missing_values,
+    generate_data_report,
+    validate_email,
+    filter_rows_by_condition,
+    count_unique_values,
+    pivot_and_aggregate,
+    remove_punctuation,
+    handle_outliers,
+    split_multi_response,
+    generate_data_profile,
+)
+
+
+# Simple 1- Karl
 headers = ["Q3 - Overall Satisfaction (1-5)", "Email Address", "123"]
 print([normalize_header(h) for h in headers])
 
 # Medium 1- Karl
-from src.research_data_lib import cast_row_types
-
 row = {'age': '19', 'score': '3.5', 'consent': 'Yes', 'joined': '2024-10-01', 'note': 'ok'}
 type_map = {
     'age': 'int',
@@ -19,8 +41,6 @@ print(cast_row_types(row, type_map))
 # Expected keys cast: age -> 19, score -> 3.5, consent -> True, joined -> datetime(2024,10,1)
 
 # Medium 2 - Karl
-from src.research_data_lib import rename_columns
-
 row = {"Q1": "19", "Q2": "Yes", "Email Address": "a@b.com", "Note": "ok"}
 rename_map = {
     "Q1": "age",
@@ -35,8 +55,6 @@ print(rename_columns(row, rename_map))
 
 
 # Complex 1 - Karl
-from src.research_data_lib import validate_dataset
-
 rows = [
     {"id": "A1", "age": "19", "consent": "Yes", "score": "3.5", "joined": "2024-10-01"},
     {"id": "A2", "age": "-5", "consent": "no",  "score": "x",   "joined": "2024-13-01"},
@@ -61,9 +79,6 @@ for e in issues:
 
 
 #Sukhman - Simple Function Demo
-from src.research_data_lib import strip_whitespace
-import pandas as pd
-
 raw_df = pd.DataFrame({
     "Name": ["  Sydney  ", " Jordan", "Tommy "],
     "Email": [" alice@email.com ", "bob@email.com ", " charlie@email.com"],
@@ -84,9 +99,6 @@ print("\nCheck original unchanged:", raw_df.equals(clean_df) is False)
 
 
 # Sukhman - Medium Function Demo 1
-from src.research_data_lib import merge_datasets
-import pandas as pd
-
 df1 = pd.DataFrame({
     "ID": [1, 2, 3],
     "Name": ["John", "Jessie", "Andrew"],
@@ -109,10 +121,6 @@ print(merged_df)
 
 
 # Sukhman - Medium Function Demo 2
-from src.research_data_lib import fill_missing_values
-import pandas as pd
-import numpy as np
-
 df = pd.DataFrame({
     "Math": [85, np.nan, 78],
     "Science": [np.nan, 90, np.nan],
@@ -132,10 +140,6 @@ print(filled_df)
 
 
 # Sukhman - Complex Function Demo
-from src.research_data_lib import generate_data_report
-import pandas as pd
-import os
-
 data = {
     "Name": ["Gemma", "Harry", "Jaden", "David"],
     "Score": [85, None, 78, 90],
@@ -156,8 +160,6 @@ print("File exists:", os.path.exists(report_path))
 
 
 # Harrang -  Simple Demo
-from src.research_data_lib import validate_email
-
 # Valid email
 valid_email = "test@example.com"
 print(f"Is '{valid_email}' a valid email? {validate_email(valid_email)}")
@@ -172,9 +174,6 @@ print(f"Is '{invalid_email}' a valid email? {validate_email(invalid_email)}")
 
 
 # Harrang - Medium Demo
-import pandas as pd
-from src.research_data_lib import filter_rows_by_condition
-
 # Sample DataFrame
 data = {
     'name': ['Alice', 'Bob', 'Charlie', 'David'],
@@ -189,6 +188,9 @@ filtered_df = filter_rows_by_condition(df, lambda row: row['age'] > 30)
 print("Filtered DataFrame (age > 30):")
 print(filtered_df)
 
+# Fast form: a (column, op, value) tuple is applied to the whole column at once
+print(filter_rows_by_condition(df, ("age", ">", 30)))
+
 # Expected output:
 # Filtered DataFrame (age > 30):
 #     name  age city
@@ -197,9 +199,6 @@ print(filtered_df)
 
 
 # Harrang - Medium Demo 2
-import pandas as pd
-from src.research_data_lib import count_unique_values
-
 # Sample DataFrame
 data = {
     'name': ['Alice', 'Bob', 'Charlie', 'Alice'],
@@ -220,9 +219,6 @@ print(unique_counts)
 
 
 # Harrang - Complex Demo
-import pandas as pd
-from src.research_data_lib import pivot_and_aggregate
-
 # Sample DataFrame
 data = {
     'category': ['A', 'A', 'B', 'B', 'A', 'B'],
@@ -248,8 +244,6 @@ print(pivot_df)
 
 # Simple 1 - Demo - Removing punctuation from string columns
 
-from src.research_data_lib import remove_punctuation
-import pandas as pd
 
 # Sample DataFrame
 data = {
@@ -274,8 +268,6 @@ print(clean_df)
 
 # Medium 1 - Demo - Handling outliers in numeric columns
 
-from src.research_data_lib import handle_outliers
-import pandas as pd
 
 # Sample DataFrame with outliers
 data = {
@@ -298,8 +290,6 @@ print(clean_df)
 
 # Medium 2 - Demo - Splitting multi-response column into separate binary columns
 
-from src.research_data_lib import split_multi_response
-import pandas as pd
 
 # Sample DataFrame with multi-response column
 data = {
@@ -325,9 +315,6 @@ print(split_df)
 
 # Complex 1 - Demo - Data profiling and report generation
 
-from src.research_data_lib import generate_data_profile
-import pandas as pd
-import os
 
 # Sample DataFrame with missing values and categorical data
 data = {
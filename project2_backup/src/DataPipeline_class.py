@@ -1,3 +1,18 @@
+# src/DataPipeline_class.py
+
+from __future__ import annotations
+from typing import List, Optional
+import pandas as pd
+
+# Reuse your Project 1 functions
+from src.research_data_lib import (
+    strip_whitespace,
+    merge_datasets,
+    fill_missing_values,
+    generate_data_report,
+)
+
+
 class DataPipeline:
     """Encapsulates a research data pipeline for cleaning, merging, and reporting.
 
@@ -24,6 +39,9 @@ class DataPipeline:
         DataPipeline 'survey_batch1' | rows=3, cols=2 | steps=3
     """
 
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = ("_df", "_name", "_history", "_cleaned", "_pending_merges", "_stripped")
+
     # ---------- Initialization & Encapsulation ----------
 
     def __init__(self, df: pd.DataFrame, name: str) -> None:
@@ -42,10 +60,15 @@ class DataPipeline:
         if not isinstance(name, str) or not name.strip():
             raise ValueError("name must be a non-empty string.")
 
-        self._df: pd.DataFrame = df.copy()
+        # Shallow copy: no data is duplicated, and Copy-on-Write copies a
+        # column only if the caller or a later step modifies it in place.
+        self._df: pd.DataFrame = df.copy(deep=False)
         self._name: str = name.strip()
         self._history: List[str] = []
         self._cleaned: bool = False
+        self._pending_merges: List[pd.DataFrame] = []
+        # True while text columns are known to be stripped; merges reset it
+        self._stripped: bool = False
 
     # ---------- Properties ----------
 
@@ -56,13 +79,17 @@ class DataPipeline:
 
     @property
     def df(self) -> pd.DataFrame:
-        """Return a deep copy of the internal DataFrame."""
-        return deepcopy(self._df)
+        """Return a copy of the internal DataFrame.
+
+        The copy is shallow: it shares column buffers with the pipeline, and
+        pandas Copy-on-Write keeps edits on either side from leaking across.
+        """
+        return self._df.copy(deep=False)
 
     @property
     def history(self) -> List[str]:
         """Return a copy of the operation history."""
-        return deepcopy(self._history)
+        return list(self._history)  # entries are immutable strings
 
     @property
     def is_cleaned(self) -> bool:
@@ -77,32 +104,108 @@ class DataPipeline:
     # ---------- Instance Methods integrating Project 1 functions ----------
 
     def strip_text(self) -> None:
-        """Remove leading/trailing whitespace from all string columns."""
-        self._df = strip_whitespace(self._df)
+        """Remove leading/trailing whitespace from all string columns.
+
+        Repeat calls are skipped until a merge brings in new rows or columns.
+        """
+        if not self._stripped:
+            self._df = strip_whitespace(self._df)
+            self._stripped = True
         self._history.append("strip_whitespace")
         self._cleaned = True
 
+    def optimize_dtypes(self, threshold: float = 0.5) -> None:
+        """Store text columns in compact dtypes instead of Python objects.
+
+        Columns whose share of distinct values is below `threshold` become
+        `category` (integer codes plus one copy of each label); other text
+        columns become pandas' string dtype (Arrow-backed when pyarrow is
+        installed). strip_text() and other .str operations then run on
+        these dtypes directly.
+
+        Args:
+            threshold (float): Maximum nunique/len ratio for `category`.
+        """
+        n = len(self._df)
+        if n == 0:
+            return
+        text_cols = self._df.select_dtypes(include=["object", "string"]).columns
+        dtypes = {c: "category" if self._df[c].nunique() / n < threshold else "string"
+                  for c in text_cols}
+        if dtypes:
+            self._df = self._df.astype(dtypes)
+        self._history.append(f"optimize_dtypes({threshold})")
+
     def fill_missing(self, strategy: str = "median") -> None:
         """Fill missing numeric values using the specified strategy.
 
+        The fill is skipped when no numeric column has a missing value.
+
         Args:
             strategy (str): One of 'mean', 'median', 'mode', or 'zero'.
         """
-        self._df = fill_missing_values(self._df, strategy=strategy)
+        if self._df.select_dtypes(include="number").isna().to_numpy().any():
+            self._df = fill_missing_values(self._df, strategy=strategy)
         self._history.append(f"fill_missing_values({strategy})")
         self._cleaned = True
 
-    def merge(self, others: List[pd.DataFrame], how: str = "outer") -> None:
+    def merge(self, others: List[pd.DataFrame], how: str = "outer",
+              validate: Optional[str] = None) -> None:
         """Merge current dataset with one or more others using merge_datasets().
 
+        Frames are joined on their shared columns. To append rows instead,
+        stage them with stage_merge() and call flush_merges() (one pd.concat).
+
         Args:
             others (list[pd.DataFrame]): List of DataFrames to merge.
             how (str): Merge type ('inner', 'outer', 'left', 'right').
+            validate (str | None): Key check passed to merge_datasets()
+                (e.g. 'one_to_one').
         """
         all_dfs = [self._df] + others
-        self._df = merge_datasets(all_dfs, how=how)
+        self._df = merge_datasets(all_dfs, how=how, validate=validate)
+        self._stripped = False
         self._history.append(f"merge_datasets({len(others)} datasets, how={how})")
 
+    def stage_merge(self, other: pd.DataFrame) -> None:
+        """Queue a DataFrame to be combined by the next flush_merges() call.
+
+        Use this instead of calling merge() in a loop: all staged frames are
+        combined in a single concat/merge rather than one merge per frame.
+
+        Args:
+            other (pd.DataFrame): DataFrame to combine with the current dataset.
+
+        Raises:
+            TypeError: If other is not a DataFrame.
+        """
+        if not isinstance(other, pd.DataFrame):
+            raise TypeError("stage_merge requires a pandas DataFrame.")
+        self._pending_merges.append(other)
+
+    def flush_merges(self, *, how: str = "outer", on: Optional[List[str]] = None,
+                     validate: Optional[str] = None) -> None:
+        """Combine all staged DataFrames with the current dataset in one step.
+
+        Args:
+            how (str): Merge type ('inner', 'outer', 'left', 'right'); used with `on`.
+            on (list[str] | None): Key columns. If None, the staged frames are
+                appended as extra rows with a single pd.concat.
+            validate (str | None): Passed to DataFrame.merge (e.g. 'one_to_one')
+                to check the keys; used with `on`.
+        """
+        if not self._pending_merges:
+            return
+        pending, self._pending_merges = self._pending_merges, []
+        self._stripped = False
+        if on is None:
+            self._df = pd.concat([self._df, *pending], ignore_index=True)
+            self._history.append(f"concat({len(pending)} datasets)")
+        else:
+            others = pending[0] if len(pending) == 1 else pd.concat(pending, ignore_index=True)
+            self._df = self._df.merge(others, on=on, how=how, validate=validate)
+            self._history.append(f"merge({len(pending)} datasets, on={on}, how={how})")
+
     def generate_report(self, filename: str = "data_report.txt") -> str:
         """Generate a structured report summarizing dataset stats."""
         path = generate_data_report(self._df, filename)
@@ -110,8 +213,8 @@ class DataPipeline:
         return path
 
     def snapshot(self) -> pd.DataFrame:
-        """Return a deep copy of the dataset (safe read-only view)."""
-        return deepcopy(self._df)
+        """Return a copy of the dataset (safe read-only view; see `df`)."""
+        return self._df.copy(deep=False)
 
     # ---------- Representations ----------
 
@@ -1,10 +1,10 @@
 import pandas as pd
-import re
 
 #Harrang Khalsa
 
 # Reuse your Project 1 functions (already in src/research_data_lib.py)
 from src.research_data_lib import (
+    _EMAIL_RE,
     validate_email,
     filter_rows_by_condition,
     count_unique_values,
@@ -29,6 +29,9 @@ class DataAnalysis:
         >>> analysis.pivot_and_aggregate('age', 'email', 'count')
     """
 
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = ("_df", "_history", "cleaned", "_pivot_cache")
+
     def __init__(self, df: pd.DataFrame) -> None:
         """Initialize the DataAnalysis object with a pandas DataFrame.
 
@@ -41,15 +44,22 @@ class DataAnalysis:
         if not isinstance(df, pd.DataFrame):
             raise TypeError("df must be a pandas DataFrame.")
         
-        self._df: pd.DataFrame = df.copy()
-        self.history: list = []
+        # Shallow copy: no data is duplicated, and Copy-on-Write copies a
+        # column only if the caller or a later step modifies it in place.
+        self._df: pd.DataFrame = df.copy(deep=False)
+        self._history: list = []
         self.cleaned: bool = False
+        # pivot_and_aggregate results by (pivot_column, value_column, agg_func);
+        # _df is never reassigned, so entries stay valid
+        self._pivot_cache: dict = {}
 
     # ---------- Instance Methods ----------
 
     def validate_email(self, email: str) -> bool:
         """Validate an email address using a regular expression.
 
+        Uses the same compiled pattern as validate_email_column().
+
         Args:
             email (str): The email address to validate.
 
@@ -62,26 +72,56 @@ class DataAnalysis:
         if not isinstance(email, str):
             raise TypeError("Input must be a string.")
         
-        email_regex = r"(^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$)"
-        return bool(re.match(email_regex, email))
+        return _EMAIL_RE.match(email) is not None
 
-    def filter_rows_by_condition(self, condition_func) -> pd.DataFrame:
-        """Filter rows in the DataFrame based on a custom condition function.
+    def validate_email_column(self, col) -> pd.Series:
+        """Validate a whole column of email addresses in one regex pass.
 
         Args:
-            condition_func (function): A function that takes a row (as a Series) and returns a boolean.
+            col (str | pd.Series): A column name in the DataFrame, or a Series of emails.
+
+        Returns:
+            pd.Series: Boolean Series, True where the email is valid
+            (missing and non-string values are False).
+
+        Raises:
+            ValueError: If col is a column name not found in the DataFrame.
+            TypeError: If col is neither a column name nor a Series.
+        """
+        if isinstance(col, str):
+            if col not in self._df.columns:
+                raise ValueError(f"Column {col} not found in the DataFrame.")
+            col = self._df[col]
+        if not isinstance(col, pd.Series):
+            raise TypeError("col must be a column name or a pandas Series.")
+        if not (pd.api.types.is_object_dtype(col) or pd.api.types.is_string_dtype(col)):
+            return pd.Series(False, index=col.index)
+
+        return col.str.match(_EMAIL_RE, na=False).astype(bool)
+
+    def filter_rows_by_condition(self, condition_func, engine: str = "series") -> pd.DataFrame:
+        """Filter rows in the DataFrame based on a condition.
+
+        Delegates to filter_rows_by_condition() from the library, so the
+        fast forms work here too: a (column, op, value) tuple or a query
+        string are evaluated on whole columns, and a row function is called
+        once per row.
+
+        Args:
+            condition_func (function | tuple | str): A function that takes a row
+                (as a Series) and returns a boolean, e.g. lambda row: row['age'] > 30,
+                or ("age", ">", 30), or "age > 30".
+            engine (str): "series" (default) or "tuples", which passes row
+                functions a namedtuple instead (use row.age, not row['age']).
 
         Returns:
             pd.DataFrame: A DataFrame with rows that meet the condition.
 
         Raises:
-            TypeError: If condition_func is not callable.
+            TypeError: If condition_func is not callable, a tuple or a string.
         """
-        if not callable(condition_func):
-            raise TypeError("condition_func must be a callable function.")
-        
-        filtered_df = self._df[self._df.apply(condition_func, axis=1)]
-        self.history.append("filter_rows_by_condition")
+        filtered_df = filter_rows_by_condition(self._df, condition_func, engine=engine)
+        self._history.append("filter_rows_by_condition")
         return filtered_df
 
     def count_unique_values(self) -> dict:
@@ -93,8 +133,8 @@ class DataAnalysis:
         Raises:
             TypeError: If df is not a pandas DataFrame.
         """
-        unique_counts = {col: self._df[col].nunique() for col in self._df.columns}
-        self.history.append("count_unique_values")
+        unique_counts = self._df.nunique().to_dict()  # one call for all columns
+        self._history.append("count_unique_values")
         return unique_counts
 
     def pivot_and_aggregate(self, pivot_column: str, value_column: str, agg_func: str = 'sum') -> pd.DataFrame:
@@ -105,24 +145,29 @@ class DataAnalysis:
             value_column (str): The column whose values will be aggregated.
             agg_func (str): The aggregation function to use ('sum', 'mean', 'count', etc.).
 
+        Repeat calls with the same string arguments reuse the first result.
+
         Returns:
             pd.DataFrame: A DataFrame with the pivoted and aggregated values.
 
         Raises:
             ValueError: If the pivot_column or value_column does not exist in the DataFrame.
         """
-        if pivot_column not in self._df.columns or value_column not in self._df.columns:
-            raise ValueError(f"Columns {pivot_column} or {value_column} not found in the DataFrame.")
-        
-        pivot_df = self._df.pivot_table(index=pivot_column, values=value_column, aggfunc=agg_func)
-        self.history.append(f"pivot_and_aggregate({pivot_column}, {value_column}, {agg_func})")
-        return pivot_df
+        key = (pivot_column, value_column, agg_func) if isinstance(agg_func, str) else None
+        pivot_df = self._pivot_cache.get(key) if key else None
+        if pivot_df is None:
+            pivot_df = pivot_and_aggregate(self._df, pivot_column, value_column, agg_func)
+            if key:
+                self._pivot_cache[key] = pivot_df
+        self._history.append(f"pivot_and_aggregate({pivot_column}, {value_column}, {agg_func})")
+        # Shallow copy so edits by the caller never reach the cached frame
+        return pivot_df.copy(deep=False)
 
     # ---------- String Representations ----------
 
     def __str__(self) -> str:
         rows, cols = self._df.shape
-        return f"DataAnalysis | rows={rows}, cols={cols} | cleaned={self.cleaned} | steps={len(self.history)}"
+        return f"DataAnalysis | rows={rows}, cols={cols} | cleaned={self.cleaned} | steps={len(self._history)}"
 
     def __repr__(self) -> str:
         rows, cols = self._df.shape
@@ -132,8 +177,8 @@ class DataAnalysis:
 
     @property
     def df(self) -> pd.DataFrame:
-        """Return a deep copy of the internal DataFrame."""
-        return self._df.copy()
+        """Return a copy of the internal DataFrame (shallow; see __init__)."""
+        return self._df.copy(deep=False)
 
     @property
     def is_cleaned(self) -> bool:
@@ -142,6 +187,6 @@ class DataAnalysis:
 
     @property
     def history(self) -> list:
-        """Return the history of operations performed on the DataFrame."""
-        return self.history
+        """Return a copy of the history of operations performed on the DataFrame."""
+        return list(self._history)
 
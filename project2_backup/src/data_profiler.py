@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 from typing import Optional
-from copy import deepcopy
 import os
 
 # Reuse your Project 1 functions (keep their names the same in your library)
@@ -63,7 +62,9 @@ class DataProfiler:
         if not isinstance(name, str) or not name.strip():
             raise ValueError("name must be a non-empty string.")
 
-        self._df = df.copy(deep=True)
+        # Shallow copy: column buffers are shared, and under pandas
+        # Copy-on-Write neither side sees the other's later edits.
+        self._df = df.copy(deep=False)
         self._name = name.strip()
         self._report_dir = report_dir
         self._last_report_path: Optional[str] = None
@@ -77,8 +78,14 @@ class DataProfiler:
 
     @property
     def df(self):
-        """Return a defensive copy of the current working DataFrame."""
-        return self._df.copy(deep=True)
+        """Return the current working DataFrame as a shallow copy.
+
+        The copy shares column buffers with the profiler (no data is
+        duplicated); with Copy-on-Write, edits to it do not reach the
+        profiler's frame. The cleaning methods below always build new
+        frames, so the profiler never mutates a frame it has handed out.
+        """
+        return self._df.copy(deep=False)
 
     @property
     def shape(self) -> tuple[int, int]:
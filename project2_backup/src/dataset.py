@@ -8,7 +8,7 @@ from copy import deepcopy
 from src.research_data_lib import (
     normalize_header,
     rename_columns,
-    cast_row_types,
+    cast_rows,
     validate_dataset,
 )
 
@@ -47,6 +47,12 @@ class Dataset:
         "Dataset 'pilot_survey' | 2 rows, 3 columns (cleaned=True)"
     """
 
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = (
+        "_name", "_rows", "_rename_map", "_type_map", "_pii_columns",
+        "_cleaned", "_last_validation_issues", "_columns",
+    )
+
     # ---------- Initialization & encapsulation ----------
 
     def __init__(
@@ -87,6 +93,8 @@ class Dataset:
         # Derived / status flags
         self._cleaned: bool = False
         self._last_validation_issues: List[Dict] = []
+        # Sorted column names, rebuilt lazily after a method changes the keys
+        self._columns: Optional[List[str]] = None
 
     # ---------- Properties (controlled access) ----------
 
@@ -113,29 +121,31 @@ class Dataset:
     @property
     def columns(self) -> List[str]:
         """Current column names (union across all rows), sorted."""
-        cols = set()
-        for r in self._rows:
-            cols.update(r.keys())
-        return sorted(cols)
+        if self._columns is None:
+            self._columns = sorted({k for r in self._rows for k in r})
+        return list(self._columns)
 
     @property
     def last_validation_issues(self) -> List[Dict]:
         """The most recent validation issues (list of dicts)."""
-        return deepcopy(self._last_validation_issues)
+        return [dict(i) for i in self._last_validation_issues]
 
     def snapshot(self) -> List[Dict]:
-        """Return a deep copy of the current rows (read-only snapshot)."""
-        return deepcopy(self._rows)
+        """Return a copy of the current rows (read-only snapshot).
+
+        Each row dict is copied; cell values are shared, since they are
+        immutable scalars (str, int, float, bool, datetime).
+        """
+        return [dict(r) for r in self._rows]
 
     # ---------- Methods integrating Project 1 functions ----------
 
     def clean_headers(self) -> None:
         """Normalize header keys for all rows using normalize_header()."""
-        cleaned: List[Dict] = []
-        for row in self._rows:
-            new_row = {normalize_header(k): v for k, v in row.items()}
-            cleaned.append(new_row)
-        self._rows = cleaned
+        # Normalize each distinct key once, then rebuild rows with a lookup
+        keymap = {k: normalize_header(k) for k in self.columns}
+        self._rows = [{keymap[k]: v for k, v in row.items()} for row in self._rows]
+        self._columns = None
         self._cleaned = True
 
     def apply_rename_map(self, *, drop_unmapped: bool = False, normalize_targets: bool = True) -> None:
@@ -148,27 +158,35 @@ class Dataset:
         if not self._rename_map:
             # Nothing to do
             return
-        renamed: List[Dict] = []
+        # Normalize the targets once here instead of once per row
+        rename_map = self._rename_map
+        if normalize_targets:
+            rename_map = {old: normalize_header(new) if new else new
+                          for old, new in rename_map.items()}
+        # Renaming only depends on a row's keys: resolve each distinct key
+        # tuple once (each key "renamed" to itself gives new -> old), then
+        # rebuild every row from that layout
+        layouts: Dict[tuple, tuple] = {}
+        renamed = []
         for row in self._rows:
-            renamed.append(
-                rename_columns(
-                    row,
-                    self._rename_map,
-                    drop_unmapped=drop_unmapped,
-                    normalize_targets=normalize_targets,
-                )
-            )
+            keys = tuple(row)
+            layout = layouts.get(keys)
+            if layout is None:
+                layout = layouts[keys] = tuple(rename_columns(
+                    dict(zip(keys, keys)), rename_map,
+                    drop_unmapped=drop_unmapped, normalize_targets=False,
+                ).items())
+            renamed.append({new: row[old] for new, old in layout})
         self._rows = renamed
+        self._columns = None
         self._cleaned = True
 
     def cast_types(self) -> None:
-        """Cast columns to configured types across all rows using cast_row_types()."""
+        """Cast columns to configured types across all rows using cast_rows()."""
         if not self._type_map:
             return
-        casted: List[Dict] = []
-        for row in self._rows:
-            casted.append(cast_row_types(row, self._type_map))
-        self._rows = casted
+        # cast_row_types() rules, with each column's caster chosen once
+        self._rows = cast_rows(self._rows, self._type_map)
         self._cleaned = True
 
     def drop_pii(self) -> None:
@@ -185,6 +203,7 @@ class Dataset:
         for row in self._rows:
             filtered.append({k: v for k, v in row.items() if k not in self._pii_columns})
         self._rows = filtered
+        self._columns = None
         self._cleaned = True
 
     def validate(self, rules: Dict) -> List[Dict]:
@@ -198,7 +217,7 @@ class Dataset:
         """
         issues = validate_dataset(self._rows, rules)
         self._last_validation_issues = issues
-        return deepcopy(issues)
+        return [dict(i) for i in issues]
 
     # ---------- Representations ----------
 
@@ -207,19 +226,3 @@ class Dataset:
 
     def __repr__(self) -> str:
         return f"Dataset(name={self._name!r}, rows={self.n_rows}, cols={self.n_cols}, cleaned={self._cleaned})"
-
-
-#Sukhman Class
-
-from __future__ import annotations
-from typing import List, Optional
-from copy import deepcopy
-import pandas as pd
-
-# Reuse your Project 1 functions
-from src.research_data_lib import (
-    strip_whitespace,
-    merge_datasets,
-    fill_missing_values,
-    generate_data_report,
-)
@@ -1,6 +1,13 @@
 import re
+from functools import lru_cache
+
+import pandas as pd
+
+# "_" is itself non-alphanumeric, so one pass also collapses underscore runs
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
 
 # Simple 1 - Karl
+@lru_cache(maxsize=4096)
 def normalize_header(name: str) -> str:
     """Normalize a column header to snake_case (safe for CSV/SQL).
 
@@ -11,6 +18,8 @@ def normalize_header(name: str) -> str:
       - If the result is empty, return "unnamed"
       - If the name starts with a digit, prefix "col_"
 
+    Results are cached, since the same headers recur across files and runs.
+
     Args:
         name: Raw header text (e.g., "Q3 - Overall Satisfaction (1-5)")
 
@@ -32,9 +41,7 @@ def normalize_header(name: str) -> str:
     """
     if not isinstance(name, str):
         raise TypeError("normalize_header: 'name' must be a str")
-    s = name.strip().lower()
-    s = re.sub(r"[^0-9a-z]+", "_", s)         # non-alnum → _
-    s = re.sub(r"_+", "_", s).strip("_")      # collapse/truncate _
+    s = _NON_ALNUM.sub("_", name.strip().lower()).strip("_")
     if not s:
         return "unnamed"
     if s[0].isdigit():
@@ -74,60 +81,104 @@ def cast_row_types(row: dict, type_map: dict[str, str]) -> dict:
     if not isinstance(row, dict) or not isinstance(type_map, dict):
         raise TypeError("cast_row_types: 'row' and 'type_map' must be dicts")
 
-    def to_none_if_blank(x):
-        if x is None:
-            return None
-        if isinstance(x, str):
-            s = x.strip().lower()
-            if s in ("", "na", "n/a", "null"):
-                return None
+    return _cast_row(row, _make_casters(type_map))
+
+
+# Null markers in survey exports (compared stripped and lowercased)
+_NULL_TOKENS = frozenset({"", "na", "n/a", "null"})
+
+
+def _is_null(x, _tokens=_NULL_TOKENS):
+    """True for None and for "", "na", "n/a", "null" (any case or padding)."""
+    if x is None:
+        return True
+    if not isinstance(x, str):
+        return False
+    if x in _tokens:
+        return True
+    # Tokens are at most 4 characters, so longer answers skip lower()
+    s = x.strip()
+    return len(s) <= 4 and s.lower() in _tokens
+
+
+def _to_none_if_blank(x):
+    return None if _is_null(x) else x
+
+
+def _to_bool(x):
+    if isinstance(x, bool):
         return x
+    if x is None:
+        return None
+    s = str(x).strip().lower()
+    if s in ("true", "yes", "y", "1"):
+        return True
+    if s in ("false", "no", "n", "0"):
+        return False
+    raise ValueError("not a bool")
+
+
+def _to_int(x):
+    return int(float(x))  # handles "19.0"
+
+
+def _caster_for(tlabel):
+    """Function casting one non-null value for a type label, or None if the
+    label is unsupported (values are then left as they are)."""
+    if isinstance(tlabel, str) and tlabel.startswith("datetime:"):
+        fmt = tlabel.split(":", 1)[1]
+        return lambda x: datetime.strptime(str(x), fmt)
+    return {"int": _to_int, "float": float, "bool": _to_bool, "str": str}.get(tlabel)
+
 
-    def to_bool(x):
-        if isinstance(x, bool):
-            return x
-        if x is None:
-            return None
-        s = str(x).strip().lower()
-        if s in ("true", "yes", "y", "1"):
-            return True
-        if s in ("false", "no", "n", "0"):
-            return False
-        raise ValueError("not a bool")
+def _make_casters(type_map: dict[str, str]) -> list[tuple]:
+    """Pick each column's caster once: [(col, caster), ...]."""
+    return [(col, _caster_for(tlabel)) for col, tlabel in type_map.items()]
 
+
+def _cast_row(row: dict, casters: list[tuple]) -> dict:
+    """cast_row_types() body, for casters already built by _make_casters()."""
     out = dict(row)
-    for col, tlabel in type_map.items():
+    for col, cast in casters:
         if col not in out:
             continue
-        raw = to_none_if_blank(out[col])
-
-        if tlabel == "str":
-            out[col] = None if raw is None else str(raw)
-            continue
-
-        if raw is None:
-            out[col] = None
+        raw = _to_none_if_blank(out[col])
+        if raw is None or cast is None:
+            out[col] = raw
             continue
-
         try:
-            if tlabel == "int":
-                out[col] = int(float(raw))  # handles "19.0"
-            elif tlabel == "float":
-                out[col] = float(raw)
-            elif tlabel == "bool":
-                out[col] = to_bool(raw)
-            elif tlabel.startswith("datetime:"):
-                fmt = tlabel.split(":", 1)[1]
-                out[col] = datetime.strptime(str(raw), fmt)
-            else:
-                raise ValueError(f"Unsupported type label: {tlabel}")
+            out[col] = cast(raw)
         except Exception:
             # Leave value as-is on cast failure
             out[col] = raw
     return out
 
 
+def cast_rows(rows: list[dict], type_map: dict[str, str]) -> list[dict]:
+    """Cast many rows with cast_row_types() rules, choosing each column's caster once.
+
+    Args:
+        rows: List of records mapping column -> raw value.
+        type_map: Mapping column -> type label (see cast_row_types()).
+
+    Returns:
+        A list of new dicts with values cast where possible.
+
+    Examples:
+        >>> cast_rows([{'age': '19'}, {'age': 'n/a'}], {'age': 'int'})
+        [{'age': 19}, {'age': None}]
+    """
+    if not isinstance(rows, list) or not isinstance(type_map, dict):
+        raise TypeError("cast_rows: 'rows' must be a list and 'type_map' a dict")
+    casters = _make_casters(type_map)
+    return [_cast_row(r, casters) for r in rows]
+
+
 # Medium 2- Karl
+# Sentinel for rename_columns(): the key has no entry in rename_map
+_UNMAPPED = object()
+
+
 def rename_columns(
     row: dict,
     rename_map: dict[str, str],
@@ -159,31 +210,34 @@ def rename_columns(
         raise TypeError("rename_columns: 'row' and 'rename_map' must be dicts")
 
     out: dict = {}
-
-    def put_safe(k: str, v):
-        # Ensure unique keys by suffixing _2, _3, ...
-        base = k
-        idx = 2
-        while k in out:
-            k = f"{base}_{idx}"
-            idx += 1
-        out[k] = v
+    # Next suffix to try per base name. Keys are only ever added to `out`,
+    # so suffixes already found taken stay taken and need no re-probing.
+    next_suffix: dict[str, int] = {}
 
     for old_key, value in row.items():
-        if old_key in rename_map:
-            new_key = rename_map[old_key]
-            # Empty string means drop this column
-            if new_key == "":
-                continue
-            if normalize_targets:
-                # Reuse our simple normalizer from above
-                new_key = normalize_header(new_key)
-            put_safe(new_key, value)
-        else:
+        new_key = rename_map.get(old_key, _UNMAPPED)
+        if new_key is _UNMAPPED:
             # Not mapped
             if drop_unmapped:
                 continue
-            put_safe(old_key, value)
+            new_key = old_key
+        elif new_key == "":
+            # Empty string means drop this column
+            continue
+        elif normalize_targets:
+            # Reuse our simple normalizer from above (cached per name)
+            new_key = normalize_header(new_key)
+
+        if new_key in out:
+            # Ensure unique keys by suffixing _2, _3, ...
+            base = new_key
+            idx = next_suffix.get(base, 2)
+            new_key = f"{base}_{idx}"
+            while new_key in out:
+                idx += 1
+                new_key = f"{base}_{idx}"
+            next_suffix[base] = idx + 1
+        out[new_key] = value
 
     return out
 
@@ -218,38 +272,31 @@ def validate_dataset(rows: list[dict], rules: dict) -> list[dict]:
     if not isinstance(rows, list) or not isinstance(rules, dict):
         raise TypeError("validate_dataset: 'rows' must be list and 'rules' must be dict")
 
-    def is_null(x):
-        if x is None:
-            return True
-        if isinstance(x, str) and x.strip().lower() in ("", "na", "n/a", "null"):
-            return True
-        return False
-
     # Prepare type map from rules for casting
     type_map: dict[str, str] = {}
     for col, spec in rules.items():
         tlabel = spec.get("type")
         if isinstance(tlabel, str):
             type_map[col] = tlabel
+    # Compile each column's regex once instead of looking it up per row
+    patterns = {col: re.compile(spec["regex"]) for col, spec in rules.items() if "regex" in spec}
 
     issues: list[dict] = []
 
-    # First pass: optionally cast by type for validation (non-destructive)
-    casted_rows: list[dict] = []
+    # Cast by type for validation (non-destructive), one row at a time as the
+    # loop below consumes them, so no cast copy of the whole dataset is held
     if type_map:
-        try:
-            casted_rows = [cast_row_types(r, type_map) for r in rows]  # uses our medium func
-        except NameError:
-            # Fallback if cast_row_types isn't available yet
-            casted_rows = [dict(r) for r in rows]
+        casters = _make_casters(type_map)  # same rules as cast_row_types
+        casted_rows = (_cast_row(r, casters) for r in rows)
     else:
-        casted_rows = [dict(r) for r in rows]
+        casted_rows = rows  # nothing is cast and rows are only read
 
     # Track values for uniqueness checks
     unique_track: dict[str, dict] = {}
     for col, spec in rules.items():
         if spec.get("unique"):
-            unique_track[col] = {"seen": {}, "dups": set()}  # value -> first_idx, plus dup idxs
+            # value -> first_idx, plus the row idxs to report (firsts included)
+            unique_track[col] = {"seen": {}, "dups": set()}
 
     # Row-wise validation
     for idx, (raw_row, row) in enumerate(zip(rows, casted_rows)):
@@ -262,7 +309,7 @@ def validate_dataset(rows: list[dict], rules: dict) -> list[dict]:
             v = row.get(col, None)
 
             # required: must exist AND be non-null
-            if required and (not raw_present or is_null(raw_row.get(col))):
+            if required and (not raw_present or _is_null(raw_row.get(col))):
                 issues.append({
                     "row_idx": idx,
                     "column": col,
@@ -272,7 +319,7 @@ def validate_dataset(rows: list[dict], rules: dict) -> list[dict]:
                 })
                 # continue to next rule; still check others to surface more issues
             # not_null: if provided, cannot be null
-            if raw_present and not_null and is_null(raw_row.get(col)):
+            if raw_present and not_null and _is_null(raw_row.get(col)):
                 issues.append({
                     "row_idx": idx,
                     "column": col,
@@ -335,7 +382,7 @@ def validate_dataset(rows: list[dict], rules: dict) -> list[dict]:
                     })
 
             # allowed set
-            if "allowed" in spec and not is_null(v):
+            if "allowed" in spec and not _is_null(v):
                 allowed = set(spec["allowed"])
                 if v not in allowed:
                     issues.append({
@@ -344,19 +391,19 @@ def validate_dataset(rows: list[dict], rules: dict) -> list[dict]:
                     })
 
             # regex check
-            if "regex" in spec and isinstance(v, str) and not is_null(v):
-                pattern = spec["regex"]
-                if re.fullmatch(pattern, v) is None:
+            if "regex" in spec and isinstance(v, str) and not _is_null(v):
+                if patterns[col].fullmatch(v) is None:
                     issues.append({
                         "row_idx": idx, "column": col, "rule": "regex", "value": v,
                         "message": "String does not match required pattern."
                     })
 
             # collect for uniqueness
-            if spec.get("unique") and not is_null(v):
+            if spec.get("unique") and not _is_null(v):
                 track = unique_track[col]
                 if v in track["seen"]:
                     track["dups"].add(idx)
+                    track["dups"].add(track["seen"][v])  # its first occurrence
                 else:
                     track["seen"][v] = idx
 
@@ -364,12 +411,7 @@ def validate_dataset(rows: list[dict], rules: dict) -> list[dict]:
     for col, track in unique_track.items():
         if not track["dups"]:
             continue
-        # Mark first occurrences of dup values and all subsequent dups
-        first_idxs = set(track["seen"].values())
-        dup_firsts = {track["seen"][val] for val in track["seen"] if any(
-            rows[j].get(col) == val for j in track["dups"]
-        )}
-        for i in sorted(dup_firsts.union(track["dups"])):
+        for i in sorted(track["dups"]):
             issues.append({
                 "row_idx": i,
                 "column": col,
@@ -389,7 +431,9 @@ def strip_whitespace(df):
         Removes leading and trailing whitespace from all string columns in a DataFrame.
 
     Rules:
-        - Operates only on columns with dtype 'object' or 'string'.
+        - Operates only on columns with dtype 'object', 'string' or 'category'
+          (category labels are stripped once per distinct value).
+        - Non-string values in object columns (numbers, missing) are kept as-is.
         - Returns a cleaned copy of the DataFrame.
         - Does not modify the original DataFrame.
 
@@ -408,14 +452,34 @@ def strip_whitespace(df):
     import pandas as pd
     if not isinstance(df, pd.DataFrame):
         raise TypeError("Input must be a pandas DataFrame.")
-    df = df.copy()
-    for col in df.columns:
-        if df[col].dtype == "object":
-            df[col] = df[col].astype(str).str.strip()
-    return df
+    # Shallow copy is enough under Copy-on-Write: only replaced columns change
+    out = df.copy(deep=False)
+    for col in df.select_dtypes(include=["object", "string", "category"]).columns:
+        s = df[col]
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            cats = s.cat.categories
+            if cats.inferred_type != "string":
+                continue
+            stripped = cats.str.strip()
+            # Strip each distinct label once; if two labels collapse into
+            # one, rebuild the column instead.
+            out[col] = (s.cat.rename_categories(stripped) if stripped.is_unique
+                        else s.astype(object).str.strip().astype("category"))
+            continue
+        try:
+            stripped = s.str.strip()
+        except AttributeError:  # object column without a single string
+            continue
+        if s.dtype == "object":
+            # .str gives NaN for non-string cells; put those values back
+            lost = stripped.isna().to_numpy() & s.notna().to_numpy()
+            if lost.any():
+                stripped = stripped.where(~lost, s)
+        out[col] = stripped
+    return out
 
 #Sukhman - Medium Function 1
-def merge_datasets(df_list, how="outer"):
+def merge_datasets(df_list, how="outer", validate=None):
     """
     Short Description:
         Merges multiple pandas DataFrames on their shared columns.
@@ -428,6 +492,8 @@ def merge_datasets(df_list, how="outer"):
     Args:
         df_list (list[pd.DataFrame]): List of DataFrames to merge.
         how (str): Type of merge to perform ("inner", "outer", "left", "right").
+        validate (str | None): Passed to pd.merge for each step (e.g. "one_to_one")
+            so duplicate keys raise instead of silently multiplying rows.
 
     Returns:
         pd.DataFrame: A merged DataFrame.
@@ -435,6 +501,7 @@ def merge_datasets(df_list, how="outer"):
     Raises:
         ValueError: If list is empty or has no common columns.
         TypeError: If any list element is not a DataFrame.
+        pandas.errors.MergeError: If `validate` is given and the keys break it.
 
     Example:
         >>> combined = merge_datasets([survey1, survey2, survey3], how="outer")
@@ -445,16 +512,19 @@ def merge_datasets(df_list, how="outer"):
     if not all(isinstance(df, pd.DataFrame) for df in df_list):
         raise TypeError("merge_datasets: all items must be DataFrames.")
 
-    merged = df_list[0].copy()
+    # Copy-on-Write: pd.merge always builds a new frame, so no upfront copy
+    merged = df_list[0]
     for df in df_list[1:]:
-        common_cols = list(set(merged.columns) & set(df.columns))
+        # Hashed Index intersection, in the merged frame's column order, so
+        # the join keys (and an outer join's row sort) are the same every run
+        common_cols = merged.columns.intersection(df.columns, sort=False).tolist()
         if not common_cols:
             raise ValueError("merge_datasets: no common columns to merge on.")
-        merged = pd.merge(merged, df, on=common_cols, how=how)
-        merged = merged.loc[:, ~merged.columns.duplicated()]
+        merged = pd.merge(merged, df, on=common_cols, how=how, validate=validate)
+        if merged.columns.has_duplicates:
+            merged = merged.loc[:, ~merged.columns.duplicated()]
 
-    merged.reset_index(drop=True, inplace=True)
-    return merged
+    return merged.reset_index(drop=True)
 
 #Sukhman - Medium Function 2
 def fill_missing_values(df, strategy="median"):
@@ -488,19 +558,19 @@ def fill_missing_values(df, strategy="median"):
     if strategy not in ("mean", "median", "mode", "zero"):
         raise ValueError("Unsupported strategy.")
 
-    df = df.copy()
-    for col in df.select_dtypes(include=[np.number]).columns:
-        if strategy == "mean":
-            val = df[col].mean()
-        elif strategy == "median":
-            val = df[col].median()
-        elif strategy == "mode":
-            mode_vals = df[col].mode()
-            val = mode_vals[0] if not mode_vals.empty else 0
-        else:
-            val = 0
-        df[col].fillna(val, inplace=True)
-    return df
+    num = df.select_dtypes(include=[np.number])
+    # One fill value per numeric column, then a single fillna for all of them
+    if strategy == "mean":
+        fills = num.mean()
+    elif strategy == "median":
+        fills = num.median()
+    elif strategy == "mode":
+        modes = num.mode()
+        # First mode per column; 0 where a column has no values at all
+        fills = modes.iloc[0].fillna(0) if len(modes) else pd.Series(0, index=num.columns)
+    else:
+        fills = pd.Series(0, index=num.columns)
+    return df.fillna(fills)
 
 #Sukhman - Complex Function
 def generate_data_report(df, filename="data_report.txt"):
@@ -541,22 +611,23 @@ def generate_data_report(df, filename="data_report.txt"):
     lines.append(f"DATA REPORT - {now}\n" + "=" * 80 + "\n")
     lines.append(f"Rows: {len(df)}, Columns: {len(df.columns)}\n\n")
 
-    for col in df.columns:
-        series = df[col]
+    # Missing and unique counts for every column in one frame-level call each
+    missing = df.isna().sum()
+    missing_pct = (missing / len(df) * 100).round(2)
+    unique_vals = df.nunique(dropna=True)
+    for i, col in enumerate(df.columns):
+        series = df.iloc[:, i]
         dtype = str(series.dtype)
-        missing = series.isna().sum()
-        missing_pct = round((missing / len(df)) * 100, 2)
-        unique_vals = series.nunique(dropna=True)
         sample_vals = series.dropna().unique()[:5]
         lines.append(f"{col} ({dtype})\n")
-        lines.append(f"  Missing: {missing} ({missing_pct}%)\n")
-        lines.append(f"  Unique: {unique_vals}\n")
+        lines.append(f"  Missing: {missing.iat[i]} ({missing_pct.iat[i]}%)\n")
+        lines.append(f"  Unique: {unique_vals.iat[i]}\n")
         lines.append("  Sample: " + ", ".join(map(str, sample_vals)) + "\n")
         lines.append("-" * 80 + "\n")
 
     os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
     with open(filename, "w", encoding="utf-8") as f:
-        f.writelines(lines)
+        f.write("".join(lines))  # one buffered write for the whole report
 
     return filename
 
@@ -565,6 +636,8 @@ def generate_data_report(df, filename="data_report.txt"):
 #Simple 1 - Harrang
 import re
 
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+
 def validate_email(email: str) -> bool:
     """Validate an email address using a regular expression.
 
@@ -586,33 +659,74 @@ def validate_email(email: str) -> bool:
     if not isinstance(email, str):
         raise TypeError("Input must be a string.")
     
-    email_regex = r"(^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$)"
-    return bool(re.match(email_regex, email))
+    return _EMAIL_RE.match(email) is not None
 
 #Medium 1 - Harrang
-def filter_rows_by_condition(df, condition_func):
+import operator
+
+_COMPARISONS = {
+    ">": operator.gt, ">=": operator.ge,
+    "<": operator.lt, "<=": operator.le,
+    "==": operator.eq, "!=": operator.ne,
+}
+
+
+def filter_rows_by_condition(df, condition_func, engine: str = "series"):
     """Filter rows in a DataFrame based on a custom condition function.
 
+    Fast forms (evaluated on whole columns, no per-row Python calls):
+      - A tuple (column, op, value) with op in >, >=, <, <=, ==, !=,
+        e.g. ("age", ">", 30).
+      - A query string, e.g. "age > 30" (see DataFrame.query).
+    A row function is called once per row with that row as a Series.
+
+    With engine="tuples" a row function is called once per row with a
+    namedtuple from df.itertuples() instead of a Series, which skips
+    building a Series per row. Such functions must use attribute access
+    (`row.age > 30`); columns that are not valid identifiers get
+    positional names (_1, _2, ...).
+
     Args:
         df (pd.DataFrame): The DataFrame to filter.
-        condition_func (function): A function that takes a row (as a Series) and returns a boolean.
+        condition_func (function | tuple | str): A function that takes a row (as a Series)
+            and returns a boolean, or one of the fast forms above.
+        engine (str): "series" (default) or "tuples"; only affects row functions.
 
     Returns:
         pd.DataFrame: A DataFrame with rows that meet the condition.
 
     Raises:
         TypeError: If df is not a pandas DataFrame or condition_func is not callable.
+        ValueError: If a tuple condition uses an unknown operator, or engine is unknown.
+        KeyError: If a tuple condition names a missing column.
 
     Example:
         >>> filtered_df = filter_rows_by_condition(df, lambda row: row['age'] > 30)
+        >>> filtered_df = filter_rows_by_condition(df, ("age", ">", 30))
+        >>> filtered_df = filter_rows_by_condition(df, lambda row: row.age > 30, engine="tuples")
     """
     import pandas as pd
-    
+    import numpy as np
+
     if not isinstance(df, pd.DataFrame):
         raise TypeError("Input must be a pandas DataFrame.")
+    if engine not in ("series", "tuples"):
+        raise ValueError(f"Unsupported engine {engine!r}; use 'series' or 'tuples'.")
+
+    if isinstance(condition_func, tuple) and len(condition_func) == 3:
+        col, op, value = condition_func
+        if op not in _COMPARISONS:
+            raise ValueError(f"Unsupported operator {op!r}; use one of {list(_COMPARISONS)}.")
+        return df[_COMPARISONS[op](df[col], value)]
+    if isinstance(condition_func, str):
+        return df.query(condition_func)
     if not callable(condition_func):
         raise TypeError("condition_func must be a callable function.")
-    
+
+    if engine == "tuples":
+        mask = np.fromiter((bool(condition_func(row)) for row in df.itertuples(index=False)),
+                           dtype=bool, count=len(df))
+        return df[mask]
     return df[df.apply(condition_func, axis=1)]
 
 
@@ -637,7 +751,11 @@ def count_unique_values(df) -> dict:
     if not isinstance(df, pd.DataFrame):
         raise TypeError("Input must be a pandas DataFrame.")
     
-    return {col: df[col].nunique() for col in df.columns}
+    return df.nunique().to_dict()  # one call for all columns
+
+# Aggregations for which one groupby(...).agg() gives pivot_table's result
+_GROUPBY_AGGS = frozenset({"sum", "mean", "median", "count", "nunique", "min", "max",
+                           "first", "last", "std", "var", "prod"})
 
 #Complex 1 - Harrang
 def pivot_and_aggregate(df, pivot_column: str, value_column: str, agg_func: str = 'sum') -> pd.DataFrame:
@@ -666,6 +784,13 @@ def pivot_and_aggregate(df, pivot_column: str, value_column: str, agg_func: str
     if pivot_column not in df.columns or value_column not in df.columns:
         raise ValueError(f"Columns {pivot_column} or {value_column} not found in the DataFrame.")
 
+    if isinstance(agg_func, str) and agg_func in _GROUPBY_AGGS and pivot_column != value_column:
+        # One index and one value column: a plain groupby skips pivot_table's
+        # reshaping. Like pivot_table, drop groups whose result is NaN.
+        grouped = df.groupby(pivot_column, observed=True)[value_column].agg(agg_func)
+        out = grouped.to_frame(value_column).dropna(how="all")
+        if not out.empty:
+            return out
     return df.pivot_table(index=pivot_column, values=value_column, aggfunc=agg_func)
 
 
@@ -675,6 +800,8 @@ def pivot_and_aggregate(df, pivot_column: str, value_column: str, agg_func: str
 
 import string
 
+_PUNCT_RE = re.compile("[" + re.escape(string.punctuation) + "]")
+
 def remove_punctuation(df):
     """
     Removes punctuation from all string columns in a DataFrame.
@@ -694,7 +821,8 @@ def remove_punctuation(df):
 
     df = df.copy()
     for col in df.select_dtypes(include=[object, 'string']).columns:
-        df[col] = df[col].apply(lambda x: ''.join(c for c in str(x) if c not in string.punctuation))
+        # One vectorized regex pass per column; missing values stay missing
+        df[col] = df[col].astype(str).str.replace(_PUNCT_RE, "", regex=True)
     return df
 
 
@@ -1,10 +1,24 @@
+import pandas as pd
+
+# Pipeline steps hand DataFrames to each other without defensive copies, so
+# Copy-on-Write must be on. pandas >= 3.0 always uses it; older releases that
+# know the option (1.5+) need it switched on explicitly.
+if int(pd.__version__.split(".")[0]) < 3:
+    try:
+        pd.options.mode.copy_on_write = True
+    except KeyError:  # pandas < 1.5 raises OptionError (a KeyError subclass)
+        pass
+
 from .pipeline import Pipeline
-from .transformers import HeaderNormalizer, PIIRemover, TypeCaster
+from .transformers import HeaderNormalizer, PIIRemover, TypeCaster, Categorizer
 from .validators import RulesValidator, ValidationReport
 from .research_data_lib import (
     normalize_header,
+    normalize_headers,
     rename_columns,
+    rename_frame,
     cast_row_types,
+    cast_column_types,
     validate_dataset,
 )
 
@@ -13,10 +27,14 @@ __all__ = [
     "HeaderNormalizer",
     "PIIRemover",
     "TypeCaster",
+    "Categorizer",
     "RulesValidator",
     "ValidationReport",
     "normalize_header",
+    "normalize_headers",
     "rename_columns",
+    "rename_frame",
     "cast_row_types",
+    "cast_column_types",
     "validate_dataset",
 ]
\ No newline at end of file
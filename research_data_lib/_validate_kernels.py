@@ -0,0 +1,96 @@
+"""Array kernels used by RulesValidator's vectorized rule checks.
+
+Each kernel takes a 1-D NumPy array and returns the row positions that
+violate a rule, so the caller only builds issue dicts for failing rows.
+
+When numba is installed, the two-sided range check runs as one compiled
+loop; otherwise numexpr (if installed) builds its mask in one threaded pass
+on large columns. The NumPy versions below are the fallback and define the
+results.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+try:  # optional JIT for the range scan; the NumPy kernels are the fallback
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on the environment
+    njit = None
+
+try:  # optional fused mask for large columns when numba is missing
+    import numexpr
+except ImportError:  # pragma: no cover - depends on the environment
+    numexpr = None
+
+# Below this many rows numexpr's thread start-up costs more than it saves
+_NUMEXPR_MIN_SIZE = 100_000
+
+
+def below(values: np.ndarray, lo) -> np.ndarray:
+    """Positions where values < lo."""
+    return np.flatnonzero(values < lo)
+
+
+def above(values: np.ndarray, hi) -> np.ndarray:
+    """Positions where values > hi."""
+    return np.flatnonzero(values > hi)
+
+
+def out_of_range(values: np.ndarray, lo=None, hi=None) -> tuple[np.ndarray, np.ndarray]:
+    """Positions below lo and above hi (either bound may be None).
+
+    With both bounds the full column goes through a single combined mask;
+    the below/above split then only looks at the failing rows.
+    """
+    if lo is None or hi is None:
+        none = np.empty(0, dtype=np.intp)
+        return (none if lo is None else below(values, lo),
+                none if hi is None else above(values, hi))
+    fused = values.dtype in _JIT_DTYPES and _jit_bound(lo) and _jit_bound(hi)
+    if fused and _out_of_range_jit is not None:
+        return _out_of_range_jit(values, lo, hi)
+    if fused and numexpr is not None and values.size >= _NUMEXPR_MIN_SIZE:
+        # NaN fails both comparisons, so it is not flagged (as below)
+        mask = numexpr.evaluate("(values < lo) | (values > hi)",
+                                local_dict={"values": values, "lo": lo, "hi": hi})
+    else:
+        mask = (values < lo) | (values > hi)
+    bad = np.flatnonzero(mask)
+    failing = values[bad]
+    return bad[failing < lo], bad[failing > hi]
+
+
+# Array dtypes the compiled kernel is used for (one compiled version each)
+_JIT_DTYPES = (np.dtype(np.int64), np.dtype(np.float64))
+
+
+def _jit_bound(bound) -> bool:
+    """True for bounds the compiled kernels (numba/numexpr) can compare
+    without surprises (plain floats and int64-sized ints; anything else
+    takes the NumPy path)."""
+    if isinstance(bound, float):
+        return True
+    return (isinstance(bound, int) and not isinstance(bound, bool)
+            and -2**63 <= bound < 2**63)
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _out_of_range_jit(values, lo, hi):
+        """Single pass version of out_of_range() for two bounds. NaN fails
+        neither comparison, as in the NumPy kernels."""
+        low = np.empty(values.size, dtype=np.intp)
+        high = np.empty(values.size, dtype=np.intp)
+        n_low = 0
+        n_high = 0
+        for i in range(values.size):
+            v = values[i]
+            if v < lo:
+                low[n_low] = i
+                n_low += 1
+            if v > hi:
+                high[n_high] = i
+                n_high += 1
+        return low[:n_low], high[:n_high]
+else:  # pragma: no cover - depends on the environment
+    _out_of_range_jit = None
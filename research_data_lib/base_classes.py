@@ -1,7 +1,15 @@
+from __future__ import annotations
+
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Any
 
+# Wall-clock time paired with the monotonic clock at import, used to turn
+# monotonic log stamps back into clock times when history is formatted.
+_WALL_NS0 = time.time_ns()
+_MONO_NS0 = time.monotonic_ns()
+
 
 class Transformer(ABC):
     """Abstract base class for one survey-data cleaning step.
@@ -15,6 +23,10 @@ class Transformer(ABC):
     a Pipeline can invoke them polymorphically in a fixed order.
     """
 
+    # True when each output row depends only on the same input row (and the
+    # columns), so Pipeline.run may process row chunks in parallel.
+    row_local = False
+
     def __init__(self, name: str, notes: str = "") -> None:
         """Initialize shared attributes for all transformers.
 
@@ -25,7 +37,7 @@ class Transformer(ABC):
         self.name = name
         self.notes = notes
         self.created_at = datetime.now()
-        self._history: list[str] = []
+        self._history: list[tuple[int, str]] = []  # (monotonic ns, message)
 
     # === ABSTRACT INTERFACE (must be implemented by subclasses) ===
 
@@ -62,6 +74,20 @@ class Transformer(ABC):
         self._log(f"{self.name} finished")
         return out
 
+    def plan(self, columns: list[str]) -> dict | None:
+        """Describe this step as column operations for a fused Pipeline run.
+
+        Steps that only rename, drop, or cast columns can return a dict with
+        any of these keys, expressed against the incoming `columns`:
+          - 'rename': mapping old name -> new name
+          - 'drop': list of names to remove (missing names are ignored)
+          - 'cast': mapping name -> type label understood by cast_column_types
+          - 'n_jobs': threads to use for the casts (see cast_column_types)
+
+        The default returns None, meaning the step must run through `apply()`.
+        """
+        return None
+
     # === SHARED HELPERS (concrete) ===
 
     def _preflight(self, df) -> None:
@@ -72,17 +98,31 @@ class Transformer(ABC):
                 f"{self.name}: expected a DataFrame-like object with `.columns`"
             )
 
+        self._check_columns(df.columns)
+
+    def _check_columns(self, columns) -> None:
+        """Raise KeyError if any required column is absent from `columns`."""
         if self.required_columns:
-            missing = [c for c in self.required_columns if c not in df.columns]
+            missing = [c for c in self.required_columns if c not in columns]
             if missing:
                 raise KeyError(f"{self.name}: missing required columns: {missing}")
 
     def _log(self, message: str) -> None:
-        """Record a log message for this step."""
-        stamp = datetime.now().strftime("%H:%M:%S")
-        line = f"[{stamp}] {self.name}: {message}"
-        self._history.append(line)
+        """Record a log message for this step.
+
+        Only a monotonic timestamp is taken here; formatting is deferred to
+        format_history() so logging stays cheap on hot paths.
+        """
+        self._history.append((time.monotonic_ns(), message))
+
+    def format_history(self, start: int = 0) -> list[str]:
+        """Render log entries from index `start` as "[HH:MM:SS] name: message"."""
+        lines = []
+        for mono_ns, message in self._history[start:]:
+            wall = datetime.fromtimestamp((_WALL_NS0 + mono_ns - _MONO_NS0) / 1e9)
+            lines.append(f"[{wall.strftime('%H:%M:%S')}] {self.name}: {message}")
+        return lines
 
     def history(self) -> list[str]:
-        """Return a copy of the internal history log."""
-        return list(self._history)
+        """Return a copy of the history log as formatted lines."""
+        return self.format_history()
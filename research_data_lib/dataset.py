@@ -1,24 +1,48 @@
 # dataset.py
 
 from __future__ import annotations
-from typing import List, Dict, Optional, Set
-from copy import deepcopy
+from typing import Dict, Iterator, List, Optional, Set
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+import operator
+import os
+
+import numpy as np
+import pandas as pd
 
 # Reuse Project 1 functions 
 from .research_data_lib import (
-    normalize_header,
+    normalize_headers,
     rename_columns,
-    cast_row_types,
+    _cast_series,
+    _cast_value,
+    _caster_for,
+    _parse_type_spec,
     validate_dataset,
 )
+from .validators import RulesValidator
+
+# Marks a cell whose row did not have that column at all (as opposed to None).
+_MISSING = object()
+
+
+def _object_array(values, n: int) -> np.ndarray:
+    """Build a 1-D object array without numpy unpacking nested values."""
+    return np.fromiter(values, dtype=object, count=n)
+
+
+def _present(arr: np.ndarray) -> np.ndarray:
+    """Boolean mask of cells that are not _MISSING."""
+    # map() with the C-level operator.is_not avoids a Python frame per cell
+    return np.fromiter(map(operator.is_not, arr, repeat(_MISSING)), dtype=bool, count=len(arr))
 
 
 
 class Dataset:
     """Represents a research dataset with utilities for cleaning and validation.
 
-    This class encapsulates tabular data (list of row dicts) and exposes
-    methods that integrate Project 1 functions to:
+    This class encapsulates tabular data and exposes methods that integrate
+    Project 1 functions to:
       - normalize headers
       - rename columns
       - cast column types
@@ -26,6 +50,10 @@ class Dataset:
 
     Attributes are encapsulated (private) with read-only properties where appropriate.
 
+    Rows are passed in as a list of dicts, but stored column-wise (one object
+    array per column), so cleaning and casting touch each column once instead
+    of every row dict. Iterating a Dataset yields row dicts on demand.
+
     Example:
         >>> rows = [
         ...     {"Q1": "19", "Q2": "Yes", "Email Address": "a@b.com", "joined": "2024-10-01"},
@@ -34,8 +62,8 @@ class Dataset:
         >>> ds = Dataset(rows, name="pilot_survey",
         ...              rename_map={"Q1": "age", "Q2": "consent", "Email Address": ""},  # drop PII
         ...              type_map={"age": "int", "consent": "bool", "joined": "datetime:%Y-%m-%d"})
-        >>> ds.clean_headers()           # normalize source keys (optional but recommended)
         >>> ds.apply_rename_map()        # rename + drop columns based on mapping
+        >>> ds.clean_headers()           # normalize remaining keys (optional but recommended)
         >>> ds.cast_types()              # cast columns using type_map
         >>> issues = ds.validate({
         ...     "age": {"type": "int", "min": 0, "max": 120, "required": True},
@@ -48,6 +76,12 @@ class Dataset:
         "Dataset 'pilot_survey' | 2 rows, 3 columns (cleaned=True)"
     """
 
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = (
+        "_name", "_n_rows", "_cols", "_ragged", "_layouts", "_columns_cache", "_frame_cache",
+        "_rename_map", "_type_map", "_pii_columns", "_cleaned", "_last_validation_issues",
+    )
+
     # ---------- Initialization & encapsulation ----------
 
     def __init__(
@@ -71,14 +105,50 @@ class Dataset:
         Raises:
             ValueError: If rows is empty or not a list of dicts; if name is blank.
         """
-        if not isinstance(rows, list) or not rows or not all(isinstance(r, dict) for r in rows):
+        if not isinstance(rows, list) or not rows:
             raise ValueError("rows must be a non-empty list of dictionaries")
         if not isinstance(name, str) or not name.strip():
             raise ValueError("name must be a non-empty string")
 
         self._name: str = name.strip()
-        # Store a deep copy to protect internal state
-        self._rows: List[Dict] = deepcopy(rows)
+        # Columnar storage: column -> object array with one cell per row.
+        # Cells for keys a row doesn't have hold _MISSING.
+        self._n_rows: int = len(rows)
+        # Each row's key layout (its keys, in its own order), stored once per
+        # distinct layout: renames and header collisions resolve per layout
+        layout_ids: Dict[tuple, int] = {}
+        row_layouts = []
+        for r in rows:
+            # Row types are checked in the same pass that collects the keys
+            if not isinstance(r, dict):
+                raise ValueError("rows must be a non-empty list of dictionaries")
+            layout = tuple(r)
+            g = layout_ids.get(layout)
+            if g is None:
+                g = layout_ids[layout] = len(layout_ids)
+            row_layouts.append(g)
+        keys = list(dict.fromkeys(k for layout in layout_ids for k in layout))
+        # True if some row lacks a key
+        self._ragged: bool = any(len(layout) < len(keys) for layout in layout_ids)
+        # None when every row has the same layout, i.e. the column order;
+        # otherwise (layout id per row, layouts)
+        self._layouts: Optional[tuple] = None
+        if len(layout_ids) > 1:
+            self._layouts = (np.array(row_layouts, dtype=np.intp), list(layout_ids))
+        if self._ragged or len(keys) < 2:
+            self._cols: Dict[str, np.ndarray] = {
+                k: _object_array((r.get(k, _MISSING) for r in rows), self._n_rows)
+                for k in keys
+            }
+        else:
+            # Every row has every key: one C-level itemgetter call per row,
+            # then zip transposes the row tuples into columns
+            columns = zip(*map(operator.itemgetter(*keys), rows))
+            self._cols = {k: _object_array(c, self._n_rows) for k, c in zip(keys, columns)}
+        # Sorted column names; reset to None whenever the set of keys changes
+        self._columns_cache: Optional[List[str]] = None
+        # DataFrame view of the columns; reset to None whenever any cell changes
+        self._frame_cache: Optional[pd.DataFrame] = None
 
         # Optional configuration for convenience
         self._rename_map: Dict[str, str] = dict(rename_map or {})
@@ -104,40 +174,68 @@ class Dataset:
     @property
     def n_rows(self) -> int:
         """Number of rows."""
-        return len(self._rows)
+        return self._n_rows
 
     @property
     def n_cols(self) -> int:
         """Number of columns (based on union of keys across rows)."""
-        return len(self.columns)
+        return len(self._cols)
 
     @property
     def columns(self) -> List[str]:
         """Current column names (union across all rows), sorted."""
-        cols = set()
-        for r in self._rows:
-            cols.update(r.keys())
-        return sorted(cols)
+        if self._columns_cache is None:
+            self._columns_cache = sorted(self._cols)
+        return list(self._columns_cache)
 
     @property
     def last_validation_issues(self) -> List[Dict]:
         """The most recent validation issues (list of dicts)."""
-        return deepcopy(self._last_validation_issues)
+        # Issue values are scalars, so copying each dict isolates the caller
+        return [dict(i) for i in self._last_validation_issues]
 
     def snapshot(self) -> List[Dict]:
-        """Return a deep copy of the current rows (read-only snapshot)."""
-        return deepcopy(self._rows)
+        """Return a copy of the current rows (read-only snapshot).
+
+        Row dicts are built fresh from the columns, so no further copying is
+        needed; cell values themselves are shared (they are expected to be
+        scalars such as str, int, float, bool or datetime).
+        """
+        return list(self)
+
+    def __iter__(self) -> Iterator[Dict]:
+        """Yield each row as a dict, built lazily from the columns."""
+        if self._layouts is None:
+            if not self._cols:
+                yield from ({} for _ in range(self._n_rows))
+                return
+            # Every row has every key, in column order: zip the columns
+            keys = list(self._cols)
+            for values in zip(*self._cols.values()):
+                yield dict(zip(keys, values))
+            return
+        ids, layouts = self._layouts
+        cols = self._cols
+        for i, g in enumerate(ids.tolist()):
+            yield {k: cols[k][i] for k in layouts[g]}
 
     # ---------- Methods integrating Project 1 functions ----------
 
     def clean_headers(self) -> None:
         """Normalize header keys for all rows using normalize_header()."""
-        cleaned: List[Dict] = []
-        for row in self._rows:
-            new_row = {normalize_header(k): v for k, v in row.items()}
-            cleaned.append(new_row)
-        self._rows = cleaned
+        # Each distinct key is normalized once, however many rows there are
+        key_map = dict(zip(self._cols, normalize_headers(self._cols)))
         self._cleaned = True
+        if all(k == new_k for k, new_k in key_map.items()):
+            return
+        if self._layouts is not None:
+            # As in a per-row {normalize_header(k): v} rebuild, the later of
+            # two colliding keys wins within each row's own key layout
+            self._relayout(lambda layout: {key_map[k]: k for k in layout}.items())
+        else:
+            self._cols = {key_map[k]: arr for k, arr in self._cols.items()}
+        self._columns_cache = None
+        self._frame_cache = None
 
     def apply_rename_map(self, *, drop_unmapped: bool = False, normalize_targets: bool = True) -> None:
         """Rename/drop columns across rows using rename_columns() and this dataset's rename_map.
@@ -149,29 +247,122 @@ class Dataset:
         if not self._rename_map:
             # Nothing to do
             return
-        renamed: List[Dict] = []
-        for row in self._rows:
-            renamed.append(
-                rename_columns(
-                    row,
-                    self._rename_map,
-                    drop_unmapped=drop_unmapped,
-                    normalize_targets=normalize_targets,
-                )
-            )
-        self._rows = renamed
         self._cleaned = True
+        if not drop_unmapped and self._rename_map.keys().isdisjoint(self._cols):
+            # No mapped column is present: the key set would come back unchanged
+            return
+        if self._layouts is not None:
+            # Collision suffixes depend on which keys a row has (and their
+            # order), so each distinct key layout is renamed on its own
+            self._relayout(lambda layout: rename_columns(
+                dict(zip(layout, layout)),
+                self._rename_map,
+                drop_unmapped=drop_unmapped,
+                normalize_targets=normalize_targets,
+            ).items())
+        else:
+            # rename_columns only looks at keys, so the column dict renames as one "row"
+            self._cols = rename_columns(
+                self._cols,
+                self._rename_map,
+                drop_unmapped=drop_unmapped,
+                normalize_targets=normalize_targets,
+            )
+        self._columns_cache = None
+        self._frame_cache = None
 
-    def cast_types(self) -> None:
-        """Cast columns to configured types across all rows using cast_row_types()."""
+    def _relayout(self, resolve) -> None:
+        """Re-key the rows one distinct key layout at a time.
+
+        `resolve(layout)` gets a layout's keys (in row order) and returns
+        (new key, old key) pairs, as re-keying one such row dict would.
+        """
+        ids, layouts = self._layouts
+        # Row positions of each layout; layouts are numbered by first row,
+        # so new columns are still created in row order
+        groups = np.split(np.argsort(ids, kind="stable"),
+                          np.cumsum(np.bincount(ids, minlength=len(layouts)))[:-1])
+        cols: Dict[str, np.ndarray] = {}
+        new_layouts = []
+        for layout, rows in zip(layouts, groups):
+            pairs = list(resolve(list(layout)))
+            new_layouts.append(tuple(new for new, _ in pairs))
+            for new, old in pairs:
+                if new not in cols:
+                    cols[new] = np.full(self._n_rows, _MISSING, dtype=object)
+                cols[new][rows] = self._cols[old][rows]
+        self._set_layouts(cols, ids, new_layouts)
+
+    def _set_layouts(self, cols: Dict[str, np.ndarray], ids: np.ndarray, layouts: list) -> None:
+        """Store re-keyed columns with their row layouts (see __init__)."""
+        self._cols = cols
+        self._ragged = any(len(layout) < len(cols) for layout in layouts)
+        if len(set(layouts)) == 1:
+            # One layout left: it is the column order, as in __init__
+            self._cols = {k: cols[k] for k in layouts[0]}
+            self._layouts = None
+        else:
+            self._layouts = (ids, layouts)
+
+    def cast_types(self, n_jobs: int = 1) -> None:
+        """Cast columns to configured types, one whole column at a time.
+
+        Follows cast_row_types() semantics: null tokens become None and
+        values that fail to cast are left unchanged.
+
+        Args:
+            n_jobs: Number of threads used to cast columns concurrently
+                (-1 = one per CPU), as in cast_column_types(); 1 casts serially.
+        """
         if not self._type_map:
             return
-        casted: List[Dict] = []
-        for row in self._rows:
-            casted.append(cast_row_types(row, self._type_map))
-        self._rows = casted
+        todo = [(col, tlabel) for col, tlabel in self._type_map.items() if col in self._cols]
+        if n_jobs == -1:
+            n_jobs = os.cpu_count() or 1
+        if n_jobs > 1 and len(todo) > 1:
+            with ThreadPoolExecutor(max_workers=min(n_jobs, len(todo))) as pool:
+                results = list(pool.map(lambda ct: self._cast_column(*ct), todo))
+        else:
+            results = [self._cast_column(col, tlabel) for col, tlabel in todo]
+        for (col, _), values in zip(todo, results):
+            self._cols[col] = values
+        self._frame_cache = None
         self._cleaned = True
 
+    def _cast_column(self, col: str, tlabel: str) -> np.ndarray:
+        """Return column `col` cast with `tlabel` as a new object array."""
+        arr = self._cols[col]
+        present = _present(arr) if self._ragged else None
+        cells = arr if present is None else arr[present]
+        # pandas reads NaN/NA/NaT cells as missing, but cast_row_types casts
+        # them like any other value (float NaN stays NaN, 'str' gives 'nan')
+        odd = pd.isna(cells)
+        if odd.any():
+            odd &= np.fromiter((v is not None for v in cells), dtype=bool, count=len(cells))
+        casted = _cast_series(pd.Series(cells, dtype=object), tlabel)
+        if casted.dtype.kind == "M":
+            # Plain datetime objects, as cast_row_types produces
+            values = casted.array.to_pydatetime().astype(object)
+            values[casted.isna().to_numpy()] = None
+        else:
+            values = casted.astype(object).where(casted.notna(), None).to_numpy(dtype=object)
+            if _parse_type_spec(tlabel)[0] == "datetime":
+                # Mixed column (some cells failed): convert the parsed ones
+                values = _object_array(
+                    (v.to_pydatetime() if isinstance(v, pd.Timestamp) else v for v in values),
+                    len(values),
+                )
+        if odd.any():
+            cast = _caster_for(tlabel)
+            values = values.copy()  # may be a read-only view of `casted`
+            for i in np.flatnonzero(odd):
+                values[i] = _cast_value(cells[i], cast)
+        if present is None:
+            return values
+        out = arr.copy()
+        out[present] = values
+        return out
+
     def drop_pii(self) -> None:
         """Drop configured PII columns (if any) from all rows.
 
@@ -182,10 +373,17 @@ class Dataset:
         """
         if not self._pii_columns:
             return
-        filtered: List[Dict] = []
-        for row in self._rows:
-            filtered.append({k: v for k, v in row.items() if k not in self._pii_columns})
-        self._rows = filtered
+        # Columnar storage: dropping a column is one dict deletion
+        present = self._pii_columns.intersection(self._cols)
+        for col in present:
+            del self._cols[col]
+        if present and self._layouts is not None:
+            ids, layouts = self._layouts
+            self._set_layouts(self._cols, ids,
+                              [tuple(k for k in layout if k not in present) for layout in layouts])
+        if present:
+            self._columns_cache = None
+            self._frame_cache = None
         self._cleaned = True
 
     def validate(self, rules: Dict) -> List[Dict]:
@@ -197,9 +395,41 @@ class Dataset:
         Returns:
             List of issue dicts (also stored in `last_validation_issues`).
         """
-        issues = validate_dataset(self._rows, rules)
+        if not self._ragged or all(_present(arr).all() for arr in self._cols.values()):
+            issues = RulesValidator().check_records(self._frame(), rules)
+        else:
+            # Ragged rows: "missing column" must stay distinct from None
+            issues = validate_dataset(list(self), rules)
         self._last_validation_issues = issues
-        return deepcopy(issues)
+        return [dict(i) for i in issues]
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the current rows as a DataFrame.
+
+        The frame is built once from the columns and reused until a cleaning
+        method changes the data, so repeated calls cost a shallow copy.
+        All-number columns get a numeric dtype; everything else stays object,
+        and cells missing from ragged rows come out as None.
+        """
+        return self._frame().copy(deep=False)
+
+    def _frame(self) -> pd.DataFrame:
+        """Columns as a DataFrame; all-int or all-float columns get a numeric
+        dtype so RulesValidator can check them without building row dicts.
+        Columns mixing ints and floats stay object: as a float column, 5
+        would be checked as the text '5.0'."""
+        if self._frame_cache is not None:
+            return self._frame_cache
+        data = {}
+        for k, arr in self._cols.items():
+            if self._ragged:
+                arr = np.where(_present(arr), arr, None)
+            if pd.api.types.infer_dtype(arr, skipna=False) in ("integer", "floating"):
+                data[k] = pd.to_numeric(arr)
+            else:
+                data[k] = pd.Series(arr, dtype=object)
+        self._frame_cache = pd.DataFrame(data, index=range(self._n_rows))
+        return self._frame_cache
 
     # ---------- Representations ----------
 
@@ -208,19 +438,3 @@ class Dataset:
 
     def __repr__(self) -> str:
         return f"Dataset(name={self._name!r}, rows={self.n_rows}, cols={self.n_cols}, cleaned={self._cleaned})"
-
-
-#Sukhman Class
-
-from __future__ import annotations
-from typing import List, Optional
-from copy import deepcopy
-import pandas as pd
-
-# Reuse Project 1 functions
-from research_data_lib import (
-    strip_whitespace,
-    merge_datasets,
-    fill_missing_values,
-    generate_data_report,
-)
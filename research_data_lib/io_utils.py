@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 import json
 
 import pandas as pd
 
+try:  # optional fast JSON encoder; the stdlib json module is the fallback
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
 from .validators import ValidationReport
 
 
@@ -21,37 +27,218 @@ def _ensure_parent_dir(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
-def load_raw_csv(path: str | Path) -> pd.DataFrame:
+def read_csv_header(path: str | Path) -> List[str]:
+    """
+    Return the column names of a CSV without reading any data rows.
+
+    Raises:
+        FileNotFoundError: if the file does not exist.
+        ValueError: if the header cannot be parsed.
+    """
+    p = Path(path)
+    if not p.exists():
+        raise FileNotFoundError(f"Input CSV not found: {p}")
+    try:
+        return list(pd.read_csv(p, nrows=0).columns)
+    except Exception as e:
+        raise ValueError(f"Failed to read CSV header at {p}: {e}") from e
+
+
+def load_raw_csv(
+    path: str | Path,
+    *,
+    keep_cols: List[str] | None = None,
+    dtypes: Dict[str, Any] | None = None,
+    chunksize: int | None = None,
+    dtype_backend: str | None = None,
+    engine: str | None = None,
+) -> pd.DataFrame | Iterator[pd.DataFrame]:
     """
     Load a raw survey CSV into a DataFrame with basic error handling.
 
+    `keep_cols` and `dtypes` are forwarded to pandas as `usecols=` and
+    `dtype=`: columns not listed are never parsed, and columns with an
+    explicit dtype skip type inference.
+
+    `dtype_backend` is forwarded to read_csv as well: "pyarrow" stores text
+    in Arrow string arrays (requires pyarrow), "numpy_nullable" uses
+    pandas' nullable dtypes. None keeps the pandas default.
+
+    `engine` selects the read_csv parser; "pyarrow" parses with Arrow's
+    multithreaded reader (requires pyarrow). None keeps the pandas default.
+
+    Whole-file loads are cached by path, modification time and options, so
+    reading an unchanged file again skips parsing. Each call gets its own
+    shallow copy of the cached frame (Copy-on-Write keeps them apart).
+
+    If `chunksize` is given, return an iterator of DataFrames with at most
+    `chunksize` rows each instead, so large files never sit in memory at
+    once. Chunks are read as text (dtype=str) so every chunk gets the same
+    column dtypes; typing is left to the TypeCaster step.
+
+    A path ending in ".parquet" (e.g. written by save_cleaned_parquet) is
+    read with pd.read_parquet instead: stored dtypes come back as written,
+    with no parsing or inference. `engine` is ignored and `chunksize` is
+    not supported for Parquet.
+
     Raises:
         FileNotFoundError: if the file does not exist.
-        ValueError: if the file cannot be parsed as CSV or is empty.
+        ImportError: if engine or dtype_backend is "pyarrow", or the file
+            is Parquet, and pyarrow is not installed.
+        ValueError: if the file cannot be parsed as CSV or is empty
+            (raised while iterating when streaming), or if chunksize is
+            given for a Parquet file.
     """
     p = Path(path)
     if not p.exists():
         raise FileNotFoundError(f"Input CSV not found: {p}")
 
+    if chunksize is not None:
+        if p.suffix == ".parquet":
+            raise ValueError("chunksize is not supported for Parquet files")
+        return _iter_csv_chunks(p, chunksize, keep_cols, dtype_backend)
+
+    stat = p.stat()
     try:
-        df = pd.read_csv(p)
+        df = _read_csv_cached(
+            str(p.resolve()),
+            stat.st_mtime_ns,
+            stat.st_size,
+            tuple(keep_cols) if keep_cols is not None else None,
+            tuple(dtypes.items()) if dtypes else None,
+            dtype_backend,
+            engine,
+        )
+    except ImportError:
+        raise
     except Exception as e:
         raise ValueError(f"Failed to read CSV at {p}: {e}") from e
 
-    if df.empty:
+    if df.shape[0] == 0:
         raise ValueError(f"CSV at {p} is empty or has no data rows")
 
-    return df
+    return df.copy(deep=False)
 
 
-def save_cleaned_csv(df: pd.DataFrame, path: str | Path) -> Path:
+@lru_cache(maxsize=4)
+def _read_csv_cached(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    keep_cols: tuple | None,
+    dtypes: tuple | None,
+    dtype_backend: str | None,
+    engine: str | None,
+) -> pd.DataFrame:
+    """Parse the CSV at `path` (see load_raw_csv). mtime_ns and size are
+    only part of the cache key, so an edited file is read again."""
+    options: Dict[str, Any] = {}
+    if dtype_backend:
+        options["dtype_backend"] = dtype_backend
+    if path.endswith(".parquet"):
+        df = pd.read_parquet(
+            path, columns=list(keep_cols) if keep_cols is not None else None, **options
+        )
+        return df.astype(dict(dtypes)) if dtypes else df
+    if engine:
+        options["engine"] = engine
+    return pd.read_csv(
+        path,
+        usecols=list(keep_cols) if keep_cols is not None else None,
+        dtype=dict(dtypes) if dtypes else None,
+        **options,
+    )
+
+
+def _iter_csv_chunks(
+    p: Path,
+    chunksize: int,
+    keep_cols: List[str] | None = None,
+    dtype_backend: str | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Yield non-empty chunks of the CSV at `p` (see load_raw_csv)."""
+    backend = {"dtype_backend": dtype_backend} if dtype_backend else {}
+    try:
+        reader = pd.read_csv(p, chunksize=chunksize, usecols=keep_cols, dtype=str, **backend)
+        n_rows = 0
+        for chunk in reader:
+            n_rows += len(chunk)
+            yield chunk
+    except pd.errors.ParserError as e:
+        raise ValueError(f"Failed to read CSV at {p}: {e}") from e
+    except pd.errors.EmptyDataError as e:
+        raise ValueError(f"CSV at {p} is empty or has no data rows") from e
+
+    if n_rows == 0:
+        raise ValueError(f"CSV at {p} is empty or has no data rows")
+
+
+def save_cleaned_csv(
+    df: pd.DataFrame,
+    path: str | Path,
+    *,
+    append: bool = False,
+    engine: str | None = None,
+) -> Path:
     """
     Save the cleaned survey data to CSV (no index).
+
+    With append=True, rows are added to an existing file without repeating
+    the header (used when writing streamed chunks).
+
+    `engine="pyarrow"` writes through Arrow's CSV writer (requires pyarrow),
+    which formats columns in C instead of pandas' Python-level writer. It
+    quotes every text value, so the bytes differ from the pandas output but
+    the file reads back the same. None keeps pandas' to_csv.
+
+    A path ending in ".parquet" is written as Parquet instead (see
+    save_cleaned_parquet), which load_raw_csv reads back without parsing.
     Returns the Path to the written file.
+
+    Raises:
+        ImportError: if engine is "pyarrow", or the path is Parquet, and
+            pyarrow is not installed.
+        ValueError: if engine is not None or "pyarrow", or append=True is
+            used with a Parquet path.
     """
+    if engine not in (None, "pyarrow"):
+        raise ValueError(f"Unknown CSV engine: {engine!r}")
     p = Path(path)
+    if p.suffix == ".parquet":
+        if append:
+            raise ValueError("append=True is not supported for Parquet files")
+        return save_cleaned_parquet(df, p)
     _ensure_parent_dir(p)
-    df.to_csv(p, index=False)
+    if engine == "pyarrow":
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+        except ImportError as e:
+            raise ImportError("engine='pyarrow' requires pyarrow (pip install pyarrow)") from e
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with p.open("ab" if append else "wb") as f:
+            pacsv.write_csv(table, f, write_options=pacsv.WriteOptions(include_header=not append))
+        return p
+    df.to_csv(p, index=False, mode="a" if append else "w", header=not append)
+    return p
+
+
+def save_cleaned_parquet(df: pd.DataFrame, path: str | Path) -> Path:
+    """
+    Save the cleaned survey data to Parquet (zstd-compressed, no index).
+
+    Category columns (see Categorizer) are stored dictionary-encoded.
+    Returns the Path to the written file.
+
+    Raises:
+        ImportError: if pyarrow is not installed.
+    """
+    p = Path(path)
+    _ensure_parent_dir(p)
+    try:
+        df.to_parquet(p, engine="pyarrow", compression="zstd", index=False)
+    except ImportError as e:
+        raise ImportError("Writing Parquet requires pyarrow (pip install pyarrow)") from e
     return p
 
 
@@ -59,11 +246,14 @@ def save_validation_report(report: ValidationReport, path: str | Path) -> Path:
     """
     Save a ValidationReport as a Markdown/text file.
     Returns the Path to the written file.
+
+    Table rows are written as they are formatted, so a large report is
+    never held in memory as one string.
     """
     p = Path(path)
     _ensure_parent_dir(p)
-    text = report.to_markdown()
-    p.write_text(text, encoding="utf-8")
+    with p.open("w", encoding="utf-8") as f:
+        f.writelines(report.iter_markdown())
     return p
 
 
@@ -89,10 +279,30 @@ def save_state(
         "config": config,
         "history": history,
     }
-    p.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    p.write_bytes(_dumps_json(state))
     return p
 
 
+def _dumps_json(obj: Any) -> bytes:
+    """Encode `obj` as indented UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # e.g. non-str dict keys, which json.dumps converts
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _loads_json(raw: bytes) -> Any:
+    """Decode UTF-8 JSON bytes, using orjson when installed.
+
+    Both decoders raise json.JSONDecodeError (orjson's error subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def load_state(path: str | Path) -> Dict[str, Any]:
     """
     Load a JSON state file created by save_state.
@@ -109,8 +319,7 @@ def load_state(path: str | Path) -> Dict[str, Any]:
         raise FileNotFoundError(f"State file not found: {p}")
 
     try:
-        raw = p.read_text(encoding="utf-8")
-        state = json.loads(raw)
+        state = _loads_json(p.read_bytes())
     except json.JSONDecodeError as e:
         raise StateFileError(f"State file {p} contains invalid JSON: {e}") from e
 
@@ -1,11 +1,211 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+from .research_data_lib import cast_column_types
+from .transformers import _drop_columns
+
+# Smaller frames run in one piece: splitting costs more than it saves
+_PARALLEL_MIN_ROWS = 100_000
+
+
+@dataclass
+class PipelinePlan:
+    """Net column operations of a run of fusable pipeline steps.
+
+    Produced by `Pipeline.compile()`. Applying it drops, renames and casts in
+    one pass instead of materializing a DataFrame after every step.
+
+    Attributes:
+        drop: Original column names to remove.
+        rename: Mapping original name -> final name.
+        cast: Mapping final name -> type label (see cast_column_types).
+        n_steps: How many leading pipeline steps this plan replaces.
+        n_jobs: Threads used for the casts (largest value any step asked for).
+    """
+    drop: list = field(default_factory=list)
+    rename: dict = field(default_factory=dict)
+    cast: dict = field(default_factory=dict)
+    n_steps: int = 0
+    n_jobs: int = 1
+
+    def apply(self, df):
+        out = _drop_columns(df, self.drop) if self.drop else df
+        if self.rename:
+            out = out.rename(columns=self.rename)
+        if self.cast:
+            out = cast_column_types(out, self.cast, n_jobs=self.n_jobs)
+        return out
+
+
 class Pipeline:
     def __init__(self, steps):
         self.steps = steps
         self.history = []
+        # (column names, plan) from the last fused run; see _plan_for()
+        self._plan = None
+
+    def add_step(self, step):
+        """Append a step to the pipeline and drop the memoized plan."""
+        self.steps.append(step)
+        self._plan = None
+
+    def _plan_for(self, df) -> PipelinePlan:
+        """Return the compiled plan for df, reusing the last one when df has
+        the same columns (the plan depends only on names and step configs).
+
+        Steps are assumed not to be reconfigured in place between runs; use
+        add_step() to change the pipeline.
+        """
+        key = tuple(df.columns) if hasattr(df, "columns") else None
+        if self._plan is None or self._plan[0] != key:
+            self._plan = (key, self.compile(df))
+        return self._plan[1]
+
+    def compile(self, df) -> PipelinePlan:
+        """Fuse the leading steps that support `Transformer.plan()`.
+
+        Walks the steps in order, tracking what each original column is called
+        and whether it survives, and stops at the first step that cannot be
+        expressed as a plan (or that would cast an already-cast column, or
+        give a cast column's name to a second column).
+
+        Raises:
+            TypeError: If df has no `.columns`.
+            KeyError: If a fused step's required columns would be missing.
+        """
+        if not hasattr(df, "columns"):
+            raise TypeError("Pipeline: expected a DataFrame-like object with `.columns`")
+
+        originals = list(df.columns)
+        names = list(originals)            # current name of each original column
+        alive = [True] * len(originals)
+        casts: dict[int, str] = {}         # original position -> type label
+        n_steps = 0
+        n_jobs = 1
 
-    def run(self, df):
-        out = df.copy()
         for step in self.steps:
+            current = [n for n, keep in zip(names, alive) if keep]
+            op = step.plan(current)
+            if op is None:
+                break
+            cast = op.get("cast", {})
+            if cast:
+                positions = {n: i for i, n in enumerate(names) if alive[i]}
+                if any(positions.get(c) in casts for c in cast):
+                    break
+            step._check_columns(current)
+
+            rename = op.get("rename", {})
+            drop = set(op.get("drop", ()))
+            new_names = list(names)
+            new_alive = list(alive)
+            for i, n in enumerate(names):
+                if not alive[i]:
+                    continue
+                if n in drop:
+                    new_alive[i] = False
+                else:
+                    new_names[i] = rename.get(n, n)
+            if casts or cast:
+                # Casts are applied by final name, so two columns ending up
+                # with the same name (e.g. Age and age after HeaderNormalizer)
+                # could not be told apart
+                final = [n for n, keep in zip(new_names, new_alive) if keep]
+                if len(set(final)) < len(final):
+                    break
+            names, alive = new_names, new_alive
+            if cast:
+                # One pass over the columns, not one per cast entry (wide frames)
+                for i, n in enumerate(names):
+                    if alive[i] and n in cast:
+                        casts[i] = cast[n]
+            step_jobs = op.get("n_jobs", 1)
+            n_jobs = max(n_jobs, (os.cpu_count() or 1) if step_jobs == -1 else step_jobs)
+            n_steps += 1
+
+        return PipelinePlan(
+            drop=list(dict.fromkeys(o for o, keep in zip(originals, alive) if not keep)),
+            rename={o: n for o, n, keep in zip(originals, names, alive) if keep and o != n},
+            cast={names[i]: tlabel for i, tlabel in casts.items() if alive[i]},
+            n_steps=n_steps,
+            n_jobs=n_jobs,
+        )
+
+    def run(self, df, fused: bool = True, n_jobs: int = 1):
+        """Run all steps on df and return the cleaned DataFrame.
+
+        With fused=True (default) the leading rename/drop/cast steps are
+        applied through one compiled PipelinePlan; remaining steps, or all of
+        them when fused=False, run one by one through `apply()`. The plan is
+        compiled on the first run and reused while the columns stay the same.
+
+        With n_jobs > 1 (-1 = one per CPU), a frame of at least 100,000 rows
+        whose steps are all `row_local` is split into that many row chunks,
+        run in threads and concatenated back in order. If the chunks come out
+        with different dtypes (e.g. a cast failed in only one of them), the
+        frame is run again in one piece so the result matches n_jobs=1.
+        """
+        if n_jobs == -1:
+            n_jobs = os.cpu_count() or 1
+        if (n_jobs > 1 and hasattr(df, "iloc") and len(df) >= _PARALLEL_MIN_ROWS
+                and all(step.row_local for step in self.steps)):
+            out = self._run_chunked(df, fused, n_jobs)
+            if out is not None:
+                return out
+        return self._run_serial(df, fused)
+
+    def _run_serial(self, df, fused: bool, record: bool = True):
+        """Run the steps on df in one piece (see run()). With record=False
+        nothing is added to self.history (the steps still log)."""
+        n_fused = 0
+        # Steps never mutate their input (Copy-on-Write), so no upfront copy.
+        out = df
+        if fused:
+            plan = self._plan_for(df)
+            out = plan.apply(out)
+            n_fused = plan.n_steps
+            if record:
+                for step in self.steps[:n_fused]:
+                    n_before = len(step._history)
+                    step._log(f"{step.name} finished")
+                    self.history.extend(step.format_history(n_before))
+        for step in self.steps[n_fused:]:
+            # Only record what this run logged, so repeated runs (e.g. one per
+            # streamed chunk) don't re-append each step's earlier entries.
+            n_before = len(step._history)
             out = step.apply(out)
-            self.history.extend(step.history())
+            if record:
+                self.history.extend(step.format_history(n_before))
         return out
+
+    def _run_chunked(self, df, fused: bool, n_jobs: int):
+        """Run row chunks of df in threads and concatenate them, or return
+        None when their columns or dtypes disagree (see run()).
+
+        The chunks' own log entries are discarded; each step then logs once
+        for the whole frame, as in a serial run.
+        """
+        bounds = [len(df) * k // n_jobs for k in range(n_jobs + 1)]
+        chunks = [df.iloc[start:stop] for start, stop in zip(bounds, bounds[1:])]
+        if fused:
+            self._plan_for(df)  # compile once; the chunks share its columns
+        marks = [len(step._history) for step in self.steps]
+        try:
+            with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+                outs = list(pool.map(lambda c: self._run_serial(c, fused, record=False), chunks))
+        finally:
+            for step, n in zip(self.steps, marks):
+                del step._history[n:]
+
+        first = outs[0]
+        if not all(o.columns.equals(first.columns) and o.dtypes.equals(first.dtypes)
+                   for o in outs[1:]):
+            return None
+        for step in self.steps:
+            n_before = len(step._history)
+            step._log(f"{step.name} finished")
+            self.history.extend(step.format_history(n_before))
+        return pd.concat(outs)
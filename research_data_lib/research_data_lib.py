@@ -1,9 +1,23 @@
+import operator
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
+# Non-alphanumeric runs (including existing underscores) collapse to one "_"
+_HEADER_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+# Shared by validate_email() and validate_email_column()
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+
+
 # Simple 1 - Karl
+# Sized above the column count of wide exports: a full-width header list
+# cycling through a smaller LRU cache would miss on every name.
+@lru_cache(maxsize=1 << 16)
 def normalize_header(name: str) -> str:
     """Normalize a column header to snake_case (safe for CSV/SQL).
 
@@ -14,6 +28,8 @@ def normalize_header(name: str) -> str:
       - If the result is empty, return "unnamed"
       - If the name starts with a digit, prefix "col_"
 
+    Results are cached, since the same headers recur across files and runs.
+
     Args:
         name: Raw header text (e.g., "Q3 - Overall Satisfaction (1-5)")
 
@@ -35,9 +51,7 @@ def normalize_header(name: str) -> str:
     """
     if not isinstance(name, str):
         raise TypeError("normalize_header: 'name' must be a str")
-    s = name.strip().lower()
-    s = re.sub(r"[^0-9a-z]+", "_", s)         # non-alnum → _
-    s = re.sub(r"_+", "_", s).strip("_")      # collapse/truncate _
+    s = _HEADER_NON_ALNUM.sub("_", name.strip().lower()).strip("_")
     if not s:
         return "unnamed"
     if s[0].isdigit():
@@ -45,9 +59,42 @@ def normalize_header(name: str) -> str:
     return s
 
 
+def normalize_headers(names) -> list[str]:
+    """Normalize an iterable of column headers with normalize_header().
+
+    Args:
+        names: Iterable of raw header strings (e.g., ``df.columns``).
+
+    Returns:
+        A list of normalized header strings, in the same order.
+
+    Examples:
+        >>> normalize_headers(["Q1 - Age", "Email Address"])
+        ['q1_age', 'email_address']
+    """
+    return [normalize_header(n) for n in names]
+
+
 
 from datetime import datetime
 
+
+@lru_cache(maxsize=128)
+def _parse_type_spec(spec: str) -> tuple:
+    """Split a type label into (kind, fmt), e.g. 'datetime:%Y-%m-%d' ->
+    ('datetime', '%Y-%m-%d') and 'int' -> ('int', None). Cached per label."""
+    if not isinstance(spec, str) or ":" not in spec:
+        return spec, None
+    kind, fmt = spec.split(":", 1)
+    return kind, fmt
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime(raw: str, fmt: str) -> datetime:
+    """datetime.strptime, cached: survey exports repeat the same dates a lot."""
+    return datetime.strptime(raw, fmt)
+
+
 # Medium 1 - Karl
 def cast_row_types(row: dict, type_map: dict[str, str]) -> dict:
     """Cast a row's values to configured types (int, float, bool, str, datetime:<fmt>).
@@ -77,60 +124,357 @@ def cast_row_types(row: dict, type_map: dict[str, str]) -> dict:
     if not isinstance(row, dict) or not isinstance(type_map, dict):
         raise TypeError("cast_row_types: 'row' and 'type_map' must be dicts")
 
-    def to_none_if_blank(x):
-        if x is None:
-            return None
-        if isinstance(x, str):
-            s = x.strip().lower()
-            if s in ("", "na", "n/a", "null"):
-                return None
+    return _cast_row(row, _make_casters(type_map))
+
+
+# Null markers in survey exports (compared stripped and lowercased)
+_NULL_TOKENS = frozenset({"", "na", "n/a", "null"})
+
+
+def _is_null(x, _tokens=_NULL_TOKENS):
+    """True for None and for "", "na", "n/a", "null" (any case or padding)."""
+    if x is None:
+        return True
+    if not isinstance(x, str):
+        return False
+    if x in _tokens:
+        return True
+    # Tokens are at most 4 characters, so longer answers skip lower()
+    s = x.strip()
+    return len(s) <= 4 and s.lower() in _tokens
+
+
+def _to_none_if_blank(x):
+    return None if _is_null(x) else x
+
+
+def _to_bool(x):
+    if isinstance(x, bool):
         return x
+    if x is None:
+        return None
+    s = str(x).strip().lower()
+    if s in ("true", "yes", "y", "1"):
+        return True
+    if s in ("false", "no", "n", "0"):
+        return False
+    raise ValueError("not a bool")
+
+
+def _to_int(x):
+    return int(float(x))  # handles "19.0"
 
-    def to_bool(x):
-        if isinstance(x, bool):
-            return x
-        if x is None:
+
+def _caster_for(tlabel):
+    """Function casting one non-null value for a type label, or None if the
+    label is unsupported (values are then left as they are)."""
+    kind, fmt = _parse_type_spec(tlabel)
+    if kind == "datetime":
+        if fmt is None:
             return None
-        s = str(x).strip().lower()
-        if s in ("true", "yes", "y", "1"):
-            return True
-        if s in ("false", "no", "n", "0"):
-            return False
-        raise ValueError("not a bool")
+        return lambda x: _parse_datetime(str(x), fmt)
+    return {"int": _to_int, "float": float, "bool": _to_bool, "str": str}.get(kind)
+
+
+def _make_casters(type_map: dict[str, str]) -> list[tuple]:
+    """Pick each column's caster once: [(col, caster), ...]."""
+    return [(col, _caster_for(tlabel)) for col, tlabel in type_map.items()]
+
+
+def _cast_value(raw, cast):
+    """Cast one cell the way cast_row_types() does, with a caster from _caster_for()."""
+    raw = _to_none_if_blank(raw)
+    if raw is None or cast is None:
+        return raw
+    try:
+        return cast(raw)
+    except Exception:
+        # Leave value as-is on cast failure
+        return raw
+
 
+def _cast_row(row: dict, casters: list[tuple]) -> dict:
+    """cast_row_types() body, for casters already built by _make_casters()."""
     out = dict(row)
-    for col, tlabel in type_map.items():
-        if col not in out:
-            continue
-        raw = to_none_if_blank(out[col])
+    for col, cast in casters:
+        if col in out:
+            out[col] = _cast_value(out[col], cast)
+    return out
 
-        if tlabel == "str":
-            out[col] = None if raw is None else str(raw)
-            continue
 
-        if raw is None:
-            out[col] = None
-            continue
+def _cast_values(values: list, cast) -> list:
+    """_cast_value() over one column's values, casting each distinct value once.
 
+    Survey columns repeat a handful of answers, so most cells are a dict
+    hit. Keys include the type, so that e.g. 1, 1.0 and True stay apart.
+    """
+    done: dict = {}
+    out = []
+    for raw in values:
+        key = (raw.__class__, raw)
         try:
-            if tlabel == "int":
-                out[col] = int(float(raw))  # handles "19.0"
-            elif tlabel == "float":
-                out[col] = float(raw)
-            elif tlabel == "bool":
-                out[col] = to_bool(raw)
-            elif tlabel.startswith("datetime:"):
-                fmt = tlabel.split(":", 1)[1]
-                out[col] = datetime.strptime(str(raw), fmt)
-            else:
-                raise ValueError(f"Unsupported type label: {tlabel}")
-        except Exception:
-            # Leave value as-is on cast failure
-            out[col] = raw
+            v = done[key]
+        except KeyError:
+            v = done[key] = _cast_value(raw, cast)
+        except TypeError:  # unhashable cell
+            v = _cast_value(raw, cast)
+        out.append(v)
     return out
 
 
+def cast_rows(rows: list[dict], type_map: dict[str, str]) -> list[dict]:
+    """Cast many rows with cast_row_types() rules, choosing each column's caster once.
+
+    Args:
+        rows: List of records mapping column -> raw value.
+        type_map: Mapping column -> type label (see cast_row_types()).
+
+    Returns:
+        A list of new dicts with values cast where possible.
+
+    Examples:
+        >>> cast_rows([{'age': '19'}, {'age': 'n/a'}], {'age': 'int'})
+        [{'age': 19}, {'age': None}]
+    """
+    if not isinstance(rows, list) or not isinstance(type_map, dict):
+        raise TypeError("cast_rows: 'rows' must be a list and 'type_map' a dict")
+    casters = _make_casters(type_map)
+    return [_cast_row(r, casters) for r in rows]
+
+
+# Vectorized companion to cast_row_types (used by TypeCaster)
+_TRUE_TOKENS = ["true", "yes", "y", "1"]
+_FALSE_TOKENS = ["false", "no", "n", "0"]
+# Text float() parses as NaN (compared stripped and lowercased)
+_NAN_TOKENS = ["nan", "+nan", "-nan"]
+
+
+def cast_column_types(df: DataFrame, type_map: dict[str, str], n_jobs: int = 1) -> DataFrame:
+    """Cast whole DataFrame columns to configured types (int, float, bool, str, datetime:<fmt>).
+
+    Column-at-a-time version of cast_row_types(): each configured column is
+    converted with a single pandas operation instead of one Python call per cell.
+
+    Rules (as in cast_row_types):
+      - Only casts columns listed in type_map that exist in df.
+      - Treats empty strings and 'na'/'n/a'/'null' as missing.
+      - For int/float: bools become 1/0 (1.0/0.0); "nan" text is NaN for float.
+      - For bool: true/yes/y/1 -> True, false/no/n/0 -> False (case-insensitive).
+      - For datetime:<fmt>: parses with the provided format.
+      - Cells that fail to cast keep their original value; the column is then
+        left as object dtype so the mix of cast and raw values survives.
+
+    Differences from cast_row_types:
+      - Cells pandas already holds as missing (NaN, NaT, None, pd.NA) are
+        treated as missing for every label. cast_row_types casts a float NaN
+        like any other value ('str' gives 'nan', 'float' keeps NaN, and 'int'
+        or 'bool' leave it as a failed cast).
+      - Missing cells come out as the column dtype's missing value: NaN in a
+        float64 column, <NA> in Int64/boolean columns and NaT for datetimes;
+        None only in object columns (mixed results or 'str').
+
+    Args:
+        df: Input DataFrame (not modified).
+        type_map: Mapping column -> type label, e.g., 'int', 'float', 'bool',
+                  'str', or 'datetime:%Y-%m-%d'.
+        n_jobs: Number of threads used to cast columns concurrently (-1 = one
+                per CPU). Columns are independent and pandas' parsers release
+                the GIL, so this helps on wide tables; 1 casts serially.
+
+    Returns:
+        A new DataFrame with the configured columns cast where possible.
+
+    Raises:
+        TypeError: If df is not a DataFrame or type_map is not a dict.
+
+    Examples:
+        >>> df = pd.DataFrame({'age': ['19', '21'], 'consent': ['Yes', 'no']})
+        >>> out = cast_column_types(df, {'age': 'int', 'consent': 'bool'})
+        >>> out['age'].tolist(), out['consent'].tolist()
+        ([19, 21], [True, False])
+    """
+    if not isinstance(df, pd.DataFrame) or not isinstance(type_map, dict):
+        raise TypeError("cast_column_types: 'df' must be a DataFrame and 'type_map' a dict")
+
+    todo = [(col, df[col], tlabel) for col, tlabel in type_map.items() if col in df.columns]
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs > 1 and len(todo) > 1:
+        with ThreadPoolExecutor(max_workers=min(n_jobs, len(todo))) as pool:
+            results = list(pool.map(lambda cst: _cast_series(cst[1], cst[2]), todo))
+    else:
+        results = [_cast_series(s, tlabel) for _, s, tlabel in todo]
+    # Set only the columns that changed on a shallow copy: every other
+    # column keeps sharing its buffer with df (Copy-on-Write keeps df intact).
+    # isetitem replaces the column by position, skipping the label lookup.
+    out = df.copy(deep=False)
+    for (col, s, _), casted in zip(todo, results):
+        if casted is not s:
+            out.isetitem(out.columns.get_loc(col), casted)
+    return out
+
+
+def _cast_series(s: pd.Series, tlabel: str) -> pd.Series:
+    """Cast one column according to a cast_row_types() type label."""
+    kind, fmt = _parse_type_spec(tlabel)
+    if kind in ("int", "float", "bool", "str") or (kind == "datetime" and fmt):
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            if pd.api.types.is_string_dtype(s.cat.categories):
+                return _cast_categorical(s, tlabel)
+        elif s.dtype == object or pd.api.types.is_string_dtype(s):
+            # Text answers repeat (Yes/No, Likert scales): hash the column
+            # once and cast each distinct answer instead of every cell.
+            # All-str uniques also rule out factorize merging 1 with True.
+            try:
+                codes, uniques = pd.factorize(s)
+            except TypeError:  # unhashable cells
+                uniques = ()
+            if 0 < len(uniques) and 2 * len(uniques) < len(s) and all(
+                    isinstance(u, str) for u in uniques):
+                cat = pd.Categorical.from_codes(codes, uniques)
+                return _cast_categorical(pd.Series(cat, index=s.index, name=s.name), tlabel)
+    if kind in ("int", "float"):
+        # cast_row_types turns bools into numbers: int(float(True)) == 1
+        if pd.api.types.is_bool_dtype(s):
+            s = s.astype("Int64" if s.hasnans else "int64")
+        elif s.dtype == object:
+            is_bool = np.fromiter((isinstance(v, (bool, np.bool_)) for v in s),
+                                  dtype=bool, count=len(s))
+            if is_bool.any():
+                s = s.copy()
+                s[is_bool] = [int(v) for v in s[is_bool]]
+    # Columns already stored as the target type need no parsing or null
+    # checks (int(float(x)) leaves ints within +-2**53 unchanged)
+    if not isinstance(s.dtype, pd.api.extensions.ExtensionDtype):
+        if kind == "float" and s.dtype == np.float64:
+            return s
+        if kind == "int" and s.dtype.kind in "iu" and (
+                len(s) == 0 or (s.min() >= -2**53 and s.max() <= 2**53)):
+            return s.astype("int64")
+
+    numeric_input = pd.api.types.is_numeric_dtype(s) and not pd.api.types.is_bool_dtype(s)
+    if numeric_input and kind in ("int", "float"):
+        text = None
+        null = s.isna()
+    else:
+        # Text already in a string dtype (the pandas 3 default for text
+        # columns, Arrow-backed when pyarrow is installed) is used as is
+        raw = s if isinstance(s.dtype, pd.StringDtype) else s.astype("string")
+        text = raw.str.strip()
+        null = (text.isna() | text.str.lower().isin(_NULL_TOKENS)).fillna(True).astype(bool)
+
+    if kind == "str":
+        out = s.astype("string").astype(object)
+        out[null] = None
+        return out
+
+    if kind in ("int", "float"):
+        values = s if text is None else _parse_floats(text)
+        values = values.astype("float64")
+        if kind == "int":
+            values = np.trunc(values)  # int(float("19.9")) == 19
+            failed = ~null & ~np.isfinite(values)
+            ints = values.where(~null & ~failed, 0)
+            # From 2**53 on, the vectorized parse may round differently from
+            # float(), and from 2**63 on int64 overflows: cast those few cells
+            # with int(float(x)) like cast_row_types
+            big = ints.abs() >= 2.0**53
+            exact = [_cast_value(v, _to_int) for v in s[big]] if big.any() else []
+            fits = all(-2**63 <= v < 2**63 for v in exact)
+            ints = ints.where(~big, 0).astype("int64")
+            if exact and fits:
+                ints[big] = exact
+            if not failed.any() and fits:
+                return ints.astype("Int64").mask(null) if null.any() else ints
+            converted = ints.astype(object)
+            if exact and not fits:
+                converted[big] = exact  # Python ints beyond int64
+        else:
+            failed = ~null & values.isna()
+            if text is not None:
+                # float("nan") succeeds, so "nan" text is a cast NaN, not a failure
+                failed &= ~text.str.lower().isin(_NAN_TOKENS).fillna(False).astype(bool)
+            if not failed.any():
+                return values
+            converted = values.astype(object)
+    elif kind == "bool":
+        if pd.api.types.is_bool_dtype(s) and not null.any():
+            return s
+        lowered = text.str.lower()
+        is_true = lowered.isin(_TRUE_TOKENS).fillna(False).astype(bool)
+        is_false = lowered.isin(_FALSE_TOKENS).fillna(False).astype(bool)
+        failed = ~null & ~is_true & ~is_false
+        if not failed.any():
+            if null.any():
+                return is_true.astype("boolean").mask(null)
+            return is_true
+        converted = is_true.astype(object)
+    elif kind == "datetime" and fmt is not None:
+        # strptime gets the unstripped text in cast_row_types, so padded
+        # dates only parse if the format allows for the padding
+        values = pd.to_datetime(raw, format=fmt, errors="coerce", cache=True)
+        failed = ~null & values.isna()
+        if not failed.any():
+            return values
+        converted = values.astype(object)
+    else:
+        # Unsupported labels: as in cast_row_types, null tokens still become
+        # None and every other value is left untouched
+        if not null.any():
+            return s
+        out = s.astype(object)
+        out[null] = None
+        return out
+
+    out = s.astype(object)
+    ok = ~null & ~failed
+    out[ok] = converted[ok]
+    out[null] = None
+    return out
+
+
+
+def _parse_floats(text: pd.Series) -> pd.Series:
+    """float() of each stripped text cell, NaN where that would fail.
+
+    to_numeric alone can be an ulp off float() for long decimals, so the
+    cells it parses are read again with astype, which rounds exactly.
+    """
+    try:
+        return text.astype("float64")
+    except (TypeError, ValueError):  # blanks, null tokens or bad answers
+        pass
+    values = pd.to_numeric(text, errors="coerce").astype("float64")
+    parsed = values.notna().to_numpy()
+    if parsed.any():
+        try:
+            exact = text[parsed].astype("float64")
+        except (TypeError, ValueError):
+            exact = [_cast_value(x, float) for x in text[parsed]]
+        values[parsed] = exact
+    return values
+
+
+def _cast_categorical(s: pd.Series, tlabel: str) -> pd.Series:
+    """_cast_series() for a column of text categories, casting each label once.
+
+    Only labels that occur are cast (plus one missing value if the column
+    has any), so the result dtype is what casting every cell would give.
+    """
+    s = s.cat.remove_unused_categories()
+    codes = s.cat.codes.to_numpy()
+    labels = list(s.cat.categories)
+    if (codes == -1).any():
+        labels.append(None)
+        codes = np.where(codes == -1, len(labels) - 1, codes)
+    casted = _cast_series(pd.Series(labels, dtype=object), tlabel)
+    return casted.take(codes).set_axis(s.index).rename(s.name)
+
 # Medium 2- Karl
+# Sentinel for rename_columns(): the key has no entry in rename_map
+_UNMAPPED = object()
+
+
 def rename_columns(
     row: dict,
     rename_map: dict[str, str],
@@ -162,40 +506,148 @@ def rename_columns(
         raise TypeError("rename_columns: 'row' and 'rename_map' must be dicts")
 
     out: dict = {}
-
-    def put_safe(k: str, v):
-        # Ensure unique keys by suffixing _2, _3, ...
-        base = k
-        idx = 2
-        while k in out:
-            k = f"{base}_{idx}"
-            idx += 1
-        out[k] = v
+    # Next suffix to try per base name. Keys are only ever added to `out`,
+    # so suffixes already found taken stay taken and need no re-probing.
+    next_suffix: dict[str, int] = {}
 
     for old_key, value in row.items():
-        if old_key in rename_map:
-            new_key = rename_map[old_key]
-            # Empty string means drop this column
-            if new_key == "":
-                continue
-            if normalize_targets:
-                # Reuse our simple normalizer from above
-                new_key = normalize_header(new_key)
-            put_safe(new_key, value)
-        else:
+        new_key = rename_map.get(old_key, _UNMAPPED)
+        if new_key is _UNMAPPED:
             # Not mapped
             if drop_unmapped:
                 continue
-            put_safe(old_key, value)
+            new_key = old_key
+        elif new_key == "":
+            # Empty string means drop this column
+            continue
+        elif normalize_targets:
+            # Reuse our simple normalizer from above (cached per name)
+            new_key = normalize_header(new_key)
+
+        if new_key in out:
+            # Ensure unique keys by suffixing _2, _3, ...
+            base = new_key
+            idx = next_suffix.get(base, 2)
+            new_key = f"{base}_{idx}"
+            while new_key in out:
+                idx += 1
+                new_key = f"{base}_{idx}"
+            next_suffix[base] = idx + 1
+        out[new_key] = value
 
     return out
 
+
+def rename_frame(
+    df: pd.DataFrame,
+    rename_map: dict[str, str],
+    *,
+    drop_unmapped: bool = False,
+    normalize_targets: bool = True,
+) -> pd.DataFrame:
+    """Rename columns of a whole DataFrame with the same rules as rename_columns().
+
+    Renaming is a schema operation, so the new header is resolved once from
+    the column labels and applied in one step instead of rebuilding every row.
+
+    Args:
+        df: Input DataFrame (not modified). Column labels must be unique.
+        rename_map: Mapping of old_name -> new_name (use "" to drop a column).
+        drop_unmapped: If True, drop columns not present in rename_map.
+        normalize_targets: If True, normalize target names via normalize_header().
+
+    Returns:
+        A new DataFrame with renamed (and possibly dropped) columns.
+
+    Raises:
+        TypeError: If df is not a DataFrame or rename_map is not a dict.
+        ValueError: If df has duplicate column labels.
+
+    Example:
+        >>> df = pd.DataFrame({"Q1": [19], "Name": ["Ana"], "Age": [20]})
+        >>> list(rename_frame(df, {"Q1": "Age", "Name": ""}).columns)
+        ['age', 'Age']
+    """
+    if not isinstance(df, pd.DataFrame) or not isinstance(rename_map, dict):
+        raise TypeError("rename_frame: 'df' must be a DataFrame and 'rename_map' a dict")
+    if not df.columns.is_unique:
+        raise ValueError("rename_frame: column labels must be unique")
+
+    # Each label "renamed" as a one-row record gives new name -> old position
+    cols = df.columns
+    layout = rename_columns(
+        dict(zip(cols, range(len(cols)))), rename_map,
+        drop_unmapped=drop_unmapped, normalize_targets=normalize_targets,
+    )
+    positions = list(layout.values())
+    out = df if positions == list(range(len(cols))) else df.iloc[:, positions]
+    return out.set_axis(list(layout), axis=1)
+
 # Complex 1 - Karl
 import re
 from datetime import datetime
 
-def validate_dataset(rows: list[dict], rules: dict) -> list[dict]:
-    """Validate a dataset (list of rows) against column rules.
+# validate_dataset's post-cast type checks: the classes each label accepts
+_TYPE_CLASSES = {
+    "int": (int,),
+    "float": (float, int),
+    "bool": (bool,),
+    "str": (str, type(None)),
+}
+
+
+def _type_classes(tlabel):
+    """Classes a 'type' rule accepts, or None if the label imposes no check."""
+    if not isinstance(tlabel, str):
+        return None
+    if tlabel.startswith("datetime:"):
+        return (datetime,)
+    # Unknown labels pass: they are already left uncast by cast_row_types
+    return _TYPE_CLASSES.get(tlabel)
+
+
+def _failing_positions(values: list, fails) -> list[int]:
+    """Positions i where fails(values[i]) is true, calling it once per distinct value.
+
+    Equal values (e.g. 1 and True) share one result, so `fails` must treat
+    them alike. Columns with unhashable cells are checked cell by cell.
+    """
+    try:
+        distinct = set(values)
+    except TypeError:
+        return [i for i, v in enumerate(values) if fails(v)]
+    bad = {v for v in distinct if fails(v)}
+    if not bad:
+        return []
+    return [i for i, v in enumerate(values) if v in bad]
+
+
+# Order validate_dataset reports a cell's issues in (unique issues come last)
+_RULE_RANK = {"required": 0, "not_null": 1, "type": 2, "min": 3, "max": 4,
+              "len_min": 5, "len_max": 6, "allowed": 7, "regex": 8}
+
+
+def _rule_column(data, col: str) -> tuple[list, list]:
+    """validate_dataset's view of one column: (has key per row, raw value per row).
+
+    A DataFrame is read column-wise with no row dicts built; nullable
+    columns give None for <NA>, as DataFrame.to_dict(orient="records") does.
+    """
+    if isinstance(data, pd.DataFrame):
+        n = len(data)
+        if col not in data.columns:
+            return [False] * n, [None] * n
+        s = data[col]
+        if isinstance(s, pd.DataFrame):
+            raise ValueError(f"validate_dataset: duplicate column label {col!r}")
+        if isinstance(s.dtype, pd.api.extensions.ExtensionDtype) and s.dtype.na_value is pd.NA:
+            s = s.astype(object).where(s.notna(), None)
+        return [True] * n, s.tolist()
+    return [col in r for r in data], [r.get(col) for r in data]
+
+
+def validate_dataset(rows: list[dict] | pd.DataFrame, rules: dict) -> list[dict]:
+    """Validate a dataset (list of rows, or a DataFrame) against column rules.
 
     Supported rule keys per column:
       - required: bool                # column must exist and be non-null
@@ -209,6 +661,11 @@ def validate_dataset(rows: list[dict], rules: dict) -> list[dict]:
       - regex: str                    # pattern the (string) value must match
       - unique: bool                  # values must be unique across rows (non-null)
 
+    A DataFrame is checked as if it were df.to_dict(orient="records"), with
+    row_idx the row's position, but its columns are read directly instead of
+    being expanded into one dict per row. Rule columns must not have
+    duplicate labels (ValueError).
+
     Returns:
         List of issues: 
         [{ 'row_idx': int, 'column': str, 'rule': str, 'value': any, 'message': str }, ...]
@@ -216,17 +673,14 @@ def validate_dataset(rows: list[dict], rules: dict) -> list[dict]:
     Notes:
         - Uses cast_row_types() when a 'type' rule is provided to interpret values.
         - Treats "", "na", "n/a", "null" (case-insensitive) as null.
-        - For uniqueness, nulls are ignored.
+        - For uniqueness, nulls are ignored; every row holding a duplicated
+          value is reported, including its first occurrence.
+        - min/max, len_min/len_max and unique are checked a whole column at a
+          time; issues are still returned row by row in rule order, followed by
+          unique issues.
     """
-    if not isinstance(rows, list) or not isinstance(rules, dict):
-        raise TypeError("validate_dataset: 'rows' must be list and 'rules' must be dict")
-
-    def is_null(x):
-        if x is None:
-            return True
-        if isinstance(x, str) and x.strip().lower() in ("", "na", "n/a", "null"):
-            return True
-        return False
+    if not isinstance(rows, (list, pd.DataFrame)) or not isinstance(rules, dict):
+        raise TypeError("validate_dataset: 'rows' must be list or DataFrame and 'rules' must be dict")
 
     # Prepare type map from rules for casting
     type_map: dict[str, str] = {}
@@ -234,154 +688,142 @@ def validate_dataset(rows: list[dict], rules: dict) -> list[dict]:
         tlabel = spec.get("type")
         if isinstance(tlabel, str):
             type_map[col] = tlabel
+    # Compile each column's regex once instead of looking it up per row
+    patterns = {col: re.compile(spec["regex"]) for col, spec in rules.items() if "regex" in spec}
 
-    issues: list[dict] = []
-
-    # First pass: optionally cast by type for validation (non-destructive)
-    casted_rows: list[dict] = []
-    if type_map:
-        try:
-            casted_rows = [cast_row_types(r, type_map) for r in rows]  # uses our medium func
-        except NameError:
-            # Fallback if cast_row_types isn't available yet
-            casted_rows = [dict(r) for r in rows]
-    else:
-        casted_rows = [dict(r) for r in rows]
+    # Casting for validation (non-destructive): same rules as cast_row_types,
+    # with each column's caster chosen once
+    casters = dict(_make_casters(type_map))
 
-    # Track values for uniqueness checks
-    unique_track: dict[str, dict] = {}
+    # Column-wise validation: each rule column is pulled out of the rows once
+    issues: list[dict] = []
+    unique_issues: list[dict] = []
     for col, spec in rules.items():
-        if spec.get("unique"):
-            unique_track[col] = {"seen": {}, "dups": set()}  # value -> first_idx, plus dup idxs
-
-    # Row-wise validation
-    for idx, (raw_row, row) in enumerate(zip(rows, casted_rows)):
-        for col, spec in rules.items():
-            val_present = col in row
-            raw_present = col in raw_row
-            required = bool(spec.get("required", False))
-            not_null = bool(spec.get("not_null", False))
-            tlabel = spec.get("type")
-            v = row.get(col, None)
+        present, raw_vals = _rule_column(rows, col)
+        vals = _cast_values(raw_vals, casters[col]) if col in casters else raw_vals
+        tlabel = spec.get("type")
 
+        # Per-cell rules, one rule at a time over the whole column: each rule
+        # is evaluated once per distinct value, and only failing rows get an
+        # issue dict (the sort at the end puts them back in row order)
+        if spec.get("required", False) or spec.get("not_null", False):
+            # Rows without the column read as None, so they are in `null` too
+            null = _failing_positions(raw_vals, _is_null)
             # required: must exist AND be non-null
-            if required and (not raw_present or is_null(raw_row.get(col))):
-                issues.append({
-                    "row_idx": idx,
-                    "column": col,
-                    "rule": "required",
-                    "value": raw_row.get(col) if raw_present else None,
-                    "message": "Required column missing or null."
-                })
-                # continue to next rule; still check others to surface more issues
+            if spec.get("required", False):
+                for i in null:
+                    issues.append({
+                        "row_idx": i,
+                        "column": col,
+                        "rule": "required",
+                        "value": raw_vals[i],
+                        "message": "Required column missing or null."
+                    })
             # not_null: if provided, cannot be null
-            if raw_present and not_null and is_null(raw_row.get(col)):
-                issues.append({
-                    "row_idx": idx,
-                    "column": col,
-                    "rule": "not_null",
-                    "value": raw_row.get(col),
-                    "message": "Value cannot be null."
-                })
-
-            if not val_present:
-                continue  # nothing else to validate
-
-            # type check (post-cast)
-            if isinstance(tlabel, str):
-                ok = True
-                if tlabel == "int":
-                    ok = isinstance(v, int)
-                elif tlabel == "float":
-                    ok = isinstance(v, float) or isinstance(v, int)
-                elif tlabel == "bool":
-                    ok = isinstance(v, bool)
-                elif tlabel == "str":
-                    ok = (v is None) or isinstance(v, str)
-                elif tlabel.startswith("datetime:"):
-                    ok = isinstance(v, datetime)
-                else:
-                    ok = True  # unknown type label already flagged in cast_row_types
-                if not ok:
+            if spec.get("not_null", False):
+                for i in null:
+                    if present[i]:
+                        issues.append({
+                            "row_idx": i,
+                            "column": col,
+                            "rule": "not_null",
+                            "value": raw_vals[i],
+                            "message": "Value cannot be null."
+                        })
+
+        # type check (post-cast); rows without the column are not checked
+        ok_types = _type_classes(tlabel)
+        if ok_types is not None:
+            bad_types = {c for c in set(map(type, vals)) if not issubclass(c, ok_types)}
+            for i, v in enumerate(vals if bad_types else ()):
+                if type(v) in bad_types and present[i]:
                     issues.append({
-                        "row_idx": idx,
+                        "row_idx": i,
                         "column": col,
                         "rule": "type",
-                        "value": raw_row.get(col),
+                        "value": raw_vals[i],
                         "message": f"Expected {tlabel}."
                     })
 
-            # numeric range checks
-            if isinstance(v, (int, float)):
-                if "min" in spec and v < spec["min"]:
-                    issues.append({
-                        "row_idx": idx, "column": col, "rule": "min", "value": v,
-                        "message": f"Value {v} < min {spec['min']}."
-                    })
-                if "max" in spec and v > spec["max"]:
-                    issues.append({
-                        "row_idx": idx, "column": col, "rule": "max", "value": v,
-                        "message": f"Value {v} > max {spec['max']}."
-                    })
+        # allowed set (missing cells read as None, which is never flagged)
+        if "allowed" in spec:
+            allowed = set(spec["allowed"])
+            for i in _failing_positions(vals, lambda v: v not in allowed and not _is_null(v)):
+                v = vals[i]
+                issues.append({
+                    "row_idx": i, "column": col, "rule": "allowed", "value": v,
+                    "message": f"Value {v!r} not in allowed set ({len(allowed)} items)."
+                })
 
-            # string length checks
-            if isinstance(v, str):
-                if "len_min" in spec and len(v) < spec["len_min"]:
-                    issues.append({
-                        "row_idx": idx, "column": col, "rule": "len_min", "value": v,
-                        "message": f"Length {len(v)} < len_min {spec['len_min']}."
-                    })
-                if "len_max" in spec and len(v) > spec["len_max"]:
-                    issues.append({
-                        "row_idx": idx, "column": col, "rule": "len_max", "value": v,
-                        "message": f"Length {len(v)} > len_max {spec['len_max']}."
-                    })
+        # regex check
+        pattern = patterns.get(col)
+        if pattern is not None:
+            def no_match(v):
+                return isinstance(v, str) and pattern.fullmatch(v) is None and not _is_null(v)
+            for i in _failing_positions(vals, no_match):
+                v = vals[i]
+                issues.append({
+                    "row_idx": i, "column": col, "rule": "regex", "value": v,
+                    "message": "String does not match required pattern."
+                })
 
-            # allowed set
-            if "allowed" in spec and not is_null(v):
-                allowed = set(spec["allowed"])
-                if v not in allowed:
+        # Whole-column passes: numeric ranges, string lengths, then uniqueness
+        has_range = "min" in spec or "max" in spec
+        has_len = "len_min" in spec or "len_max" in spec
+        if not has_range and not has_len and not spec.get("unique"):
+            continue
+        # Plain-Python type scans: Series.map would add pandas' per-call
+        # overhead on top of the same per-cell lambda
+        values = pd.Series(vals, dtype=object)
+
+        if has_range:
+            positions = np.flatnonzero(np.fromiter(
+                (isinstance(x, (int, float)) for x in vals), dtype=bool, count=len(vals)))
+            nums = pd.to_numeric(values.iloc[positions]).to_numpy() if len(positions) else np.array([])
+            for rule, bound, op, sign in (("min", spec.get("min"), np.less, "<"),
+                                          ("max", spec.get("max"), np.greater, ">")):
+                if rule not in spec:
+                    continue
+                for i in positions[op(nums, bound)]:
+                    v = vals[i]
                     issues.append({
-                        "row_idx": idx, "column": col, "rule": "allowed", "value": v,
-                        "message": f"Value {v!r} not in allowed set ({len(allowed)} items)."
+                        "row_idx": int(i), "column": col, "rule": rule, "value": v,
+                        "message": f"Value {v} {sign} {rule} {bound}."
                     })
 
-            # regex check
-            if "regex" in spec and isinstance(v, str) and not is_null(v):
-                pattern = spec["regex"]
-                if re.fullmatch(pattern, v) is None:
+        if has_len:
+            positions = np.flatnonzero(np.fromiter(
+                (isinstance(x, str) for x in vals), dtype=bool, count=len(vals)))
+            lengths = np.fromiter((len(vals[i]) for i in positions), dtype=np.int64,
+                                  count=len(positions))
+            for rule, op, sign in (("len_min", np.less, "<"), ("len_max", np.greater, ">")):
+                if rule not in spec:
+                    continue
+                for k in np.flatnonzero(op(lengths, spec[rule])):
+                    i = positions[k]
+                    v = vals[i]
                     issues.append({
-                        "row_idx": idx, "column": col, "rule": "regex", "value": v,
-                        "message": "String does not match required pattern."
+                        "row_idx": int(i), "column": col, "rule": rule, "value": v,
+                        "message": f"Length {len(v)} {sign} {rule} {spec[rule]}."
                     })
 
-            # collect for uniqueness
-            if spec.get("unique") and not is_null(v):
-                track = unique_track[col]
-                if v in track["seen"]:
-                    track["dups"].add(idx)
-                else:
-                    track["seen"][v] = idx
-
-    # After scanning rows, emit uniqueness issues
-    for col, track in unique_track.items():
-        if not track["dups"]:
-            continue
-        # Mark first occurrences of dup values and all subsequent dups
-        first_idxs = set(track["seen"].values())
-        dup_firsts = {track["seen"][val] for val in track["seen"] if any(
-            rows[j].get(col) == val for j in track["dups"]
-        )}
-        for i in sorted(dup_firsts.union(track["dups"])):
-            issues.append({
-                "row_idx": i,
-                "column": col,
-                "rule": "unique",
-                "value": rows[i].get(col),
-                "message": "Duplicate value violates uniqueness."
-            })
+        if spec.get("unique"):
+            non_null = ~values.map(_is_null).to_numpy(dtype=bool)
+            dup = np.zeros(len(values), dtype=bool)
+            dup[non_null] = values[non_null].duplicated(keep=False).to_numpy()
+            for i in np.flatnonzero(dup):
+                unique_issues.append({
+                    "row_idx": int(i),
+                    "column": col,
+                    "rule": "unique",
+                    "value": raw_vals[i],
+                    "message": "Duplicate value violates uniqueness."
+                })
 
-    return issues
+    # Back to row order: by row, then rule column, then each column's rule order
+    col_rank = {c: k for k, c in enumerate(rules)}
+    issues.sort(key=lambda d: (d["row_idx"], col_rank[d["column"]], _RULE_RANK[d["rule"]]))
+    return issues + unique_issues
 
 
 
@@ -392,7 +834,9 @@ def strip_whitespace(df):
         Removes leading and trailing whitespace from all string columns in a DataFrame.
 
     Rules:
-        - Operates only on columns with dtype 'object' or 'string'.
+        - Operates only on columns with dtype 'object', 'string' or 'category'
+          (category labels are stripped once per distinct value).
+        - Non-string values in object columns (numbers, missing) are kept as-is.
         - Returns a cleaned copy of the DataFrame.
         - Does not modify the original DataFrame.
 
@@ -408,17 +852,36 @@ def strip_whitespace(df):
     Example:
         >>> clean_df = strip_whitespace(raw_df)
     """
-    import pandas as pd
     if not isinstance(df, pd.DataFrame):
         raise TypeError("Input must be a pandas DataFrame.")
-    df = df.copy()
-    for col in df.columns:
-        if df[col].dtype == "object":
-            df[col] = df[col].astype(str).str.strip()
-    return df
+    # Shallow copy is enough under Copy-on-Write: only replaced columns change
+    out = df.copy(deep=False)
+    for col in df.select_dtypes(include=["object", "string", "category"]).columns:
+        s = df[col]
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            cats = s.cat.categories
+            if cats.inferred_type != "string":
+                continue
+            stripped = cats.str.strip()
+            # Strip each distinct label once; if two labels collapse into
+            # one, rebuild the column instead.
+            out[col] = (s.cat.rename_categories(stripped) if stripped.is_unique
+                        else s.astype(object).str.strip().astype("category"))
+            continue
+        try:
+            stripped = s.str.strip()
+        except AttributeError:  # object column without a single string
+            continue
+        if s.dtype == "object":
+            # .str gives NaN for non-string cells; put those values back
+            lost = stripped.isna().to_numpy() & s.notna().to_numpy()
+            if lost.any():
+                stripped = stripped.where(~lost, s)
+        out[col] = stripped
+    return out
 
 #Sukhman - Medium Function 1
-def merge_datasets(df_list, how="outer"):
+def merge_datasets(df_list, how="outer", validate=None):
     """
     Short Description:
         Merges multiple pandas DataFrames on their shared columns.
@@ -431,6 +894,8 @@ def merge_datasets(df_list, how="outer"):
     Args:
         df_list (list[pd.DataFrame]): List of DataFrames to merge.
         how (str): Type of merge to perform ("inner", "outer", "left", "right").
+        validate (str | None): Passed to pd.merge for each step (e.g. "one_to_one")
+            so duplicate keys raise instead of silently multiplying rows.
 
     Returns:
         pd.DataFrame: A merged DataFrame.
@@ -438,26 +903,29 @@ def merge_datasets(df_list, how="outer"):
     Raises:
         ValueError: If list is empty or has no common columns.
         TypeError: If any list element is not a DataFrame.
+        pandas.errors.MergeError: If `validate` is given and the keys break it.
 
     Example:
         >>> combined = merge_datasets([survey1, survey2, survey3], how="outer")
     """
-    import pandas as pd
     if not df_list:
         raise ValueError("merge_datasets: empty list provided.")
     if not all(isinstance(df, pd.DataFrame) for df in df_list):
         raise TypeError("merge_datasets: all items must be DataFrames.")
 
-    merged = df_list[0].copy()
+    # Copy-on-Write: pd.merge always builds a new frame, so no upfront copy
+    merged = df_list[0]
     for df in df_list[1:]:
-        common_cols = list(set(merged.columns) & set(df.columns))
+        # Hashed Index intersection, in the merged frame's column order, so
+        # the join keys (and an outer join's row sort) are the same every run
+        common_cols = merged.columns.intersection(df.columns, sort=False).tolist()
         if not common_cols:
             raise ValueError("merge_datasets: no common columns to merge on.")
-        merged = pd.merge(merged, df, on=common_cols, how=how)
-        merged = merged.loc[:, ~merged.columns.duplicated()]
+        merged = pd.merge(merged, df, on=common_cols, how=how, validate=validate)
+        if merged.columns.has_duplicates:
+            merged = merged.loc[:, ~merged.columns.duplicated()]
 
-    merged.reset_index(drop=True, inplace=True)
-    return merged
+    return merged.reset_index(drop=True)
 
 #Sukhman - Medium Function 2
 def fill_missing_values(df, strategy="median"):
@@ -484,26 +952,24 @@ def fill_missing_values(df, strategy="median"):
     Example:
         >>> clean_df = fill_missing_values(df, strategy="mean")
     """
-    import pandas as pd
-    import numpy as np
     if not isinstance(df, pd.DataFrame):
         raise TypeError("Input must be a DataFrame.")
     if strategy not in ("mean", "median", "mode", "zero"):
         raise ValueError("Unsupported strategy.")
 
-    df = df.copy()
-    for col in df.select_dtypes(include=[np.number]).columns:
-        if strategy == "mean":
-            val = df[col].mean()
-        elif strategy == "median":
-            val = df[col].median()
-        elif strategy == "mode":
-            mode_vals = df[col].mode()
-            val = mode_vals[0] if not mode_vals.empty else 0
-        else:
-            val = 0
-        df[col].fillna(val, inplace=True)
-    return df
+    num = df.select_dtypes(include=[np.number])
+    # One fill value per numeric column, then a single fillna for all of them
+    if strategy == "mean":
+        fills = num.mean()
+    elif strategy == "median":
+        fills = num.median()
+    elif strategy == "mode":
+        modes = num.mode()
+        # First mode per column; 0 where a column has no values at all
+        fills = modes.iloc[0].fillna(0) if len(modes) else pd.Series(0, index=num.columns)
+    else:
+        fills = pd.Series(0, index=num.columns)
+    return df.fillna(fills)
 
 #Sukhman - Complex Function
 def generate_data_report(df, filename="data_report.txt"):
@@ -530,9 +996,6 @@ def generate_data_report(df, filename="data_report.txt"):
     Example:
         >>> report_path = generate_data_report(clean_df, "outputs/report.txt")
     """
-    import pandas as pd
-    import numpy as np
-    import datetime, os
 
     if not isinstance(df, pd.DataFrame):
         raise TypeError("df must be a DataFrame.")
@@ -540,26 +1003,27 @@ def generate_data_report(df, filename="data_report.txt"):
         raise ValueError("Cannot generate report on empty DataFrame.")
 
     lines = []
-    now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     lines.append(f"DATA REPORT - {now}\n" + "=" * 80 + "\n")
     lines.append(f"Rows: {len(df)}, Columns: {len(df.columns)}\n\n")
 
-    for col in df.columns:
-        series = df[col]
+    # Missing and unique counts for every column in one frame-level call each
+    missing = df.isna().sum()
+    missing_pct = (missing / len(df) * 100).round(2)
+    unique_vals = df.nunique(dropna=True)
+    for i, col in enumerate(df.columns):
+        series = df.iloc[:, i]
         dtype = str(series.dtype)
-        missing = series.isna().sum()
-        missing_pct = round((missing / len(df)) * 100, 2)
-        unique_vals = series.nunique(dropna=True)
         sample_vals = series.dropna().unique()[:5]
         lines.append(f"{col} ({dtype})\n")
-        lines.append(f"  Missing: {missing} ({missing_pct}%)\n")
-        lines.append(f"  Unique: {unique_vals}\n")
+        lines.append(f"  Missing: {missing.iat[i]} ({missing_pct.iat[i]}%)\n")
+        lines.append(f"  Unique: {unique_vals.iat[i]}\n")
         lines.append("  Sample: " + ", ".join(map(str, sample_vals)) + "\n")
         lines.append("-" * 80 + "\n")
 
     os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
     with open(filename, "w", encoding="utf-8") as f:
-        f.writelines(lines)
+        f.write("".join(lines))  # one buffered write for the whole report
 
     return filename
 
@@ -589,33 +1053,100 @@ def validate_email(email: str) -> bool:
     if not isinstance(email, str):
         raise TypeError("Input must be a string.")
     
-    email_regex = r"(^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$)"
-    return bool(re.match(email_regex, email))
+    return bool(_EMAIL_RE.match(email))
+
+
+def validate_email_column(emails: pd.Series) -> pd.Series:
+    """Validate a whole column of email addresses in one regex pass.
+
+    Uses the same pattern as validate_email(), but runs it over the Series
+    with `str.match` instead of one Python call per value.
+
+    Args:
+        emails (pd.Series): Email addresses to validate.
+
+    Returns:
+        pd.Series: Boolean Series, True where the email is valid. Missing
+        and non-string values are False.
+
+    Raises:
+        TypeError: If emails is not a pandas Series.
+
+    Examples:
+        >>> validate_email_column(pd.Series(["test@example.com", "invalid-email", None])).tolist()
+        [True, False, False]
+    """
+    if not isinstance(emails, pd.Series):
+        raise TypeError("emails must be a pandas Series.")
+
+    if not (pd.api.types.is_object_dtype(emails) or pd.api.types.is_string_dtype(emails)):
+        # e.g. an all-numeric column: nothing in it can be an email
+        return pd.Series(False, index=emails.index)
+
+    return emails.str.match(_EMAIL_RE, na=False).astype(bool)
 
 #Medium 1 - Harrang
-def filter_rows_by_condition(df, condition_func):
+_COMPARISONS = {
+    ">": operator.gt, ">=": operator.ge,
+    "<": operator.lt, "<=": operator.le,
+    "==": operator.eq, "!=": operator.ne,
+}
+
+
+def filter_rows_by_condition(df, condition_func, engine: str = "series"):
     """Filter rows in a DataFrame based on a custom condition function.
 
+    Fast forms (evaluated on whole columns, no per-row Python calls):
+      - A tuple (column, op, value) with op in >, >=, <, <=, ==, !=,
+        e.g. ("age", ">", 30).
+      - A query string, e.g. "age > 30" (see DataFrame.query).
+    A row function is called once per row with that row as a Series.
+
+    With engine="tuples" a row function is called once per row with a
+    namedtuple from df.itertuples() instead of a Series, which skips
+    building a Series per row. Such functions must use attribute access
+    (`row.age > 30`); columns that are not valid identifiers get
+    positional names (_1, _2, ...).
+
     Args:
         df (pd.DataFrame): The DataFrame to filter.
-        condition_func (function): A function that takes a row (as a Series) and returns a boolean.
+        condition_func (function | tuple | str): A function that takes a row (as a Series)
+            and returns a boolean, or one of the fast forms above.
+        engine (str): "series" (default) or "tuples"; only affects row functions.
 
     Returns:
         pd.DataFrame: A DataFrame with rows that meet the condition.
 
     Raises:
         TypeError: If df is not a pandas DataFrame or condition_func is not callable.
+        ValueError: If a tuple condition uses an unknown operator, or engine is unknown.
+        KeyError: If a tuple condition names a missing column.
 
     Example:
         >>> filtered_df = filter_rows_by_condition(df, lambda row: row['age'] > 30)
+        >>> filtered_df = filter_rows_by_condition(df, ("age", ">", 30))
+        >>> filtered_df = filter_rows_by_condition(df, lambda row: row.age > 30, engine="tuples")
     """
-    import pandas as pd
-    
+
     if not isinstance(df, pd.DataFrame):
         raise TypeError("Input must be a pandas DataFrame.")
+    if engine not in ("series", "tuples"):
+        raise ValueError(f"Unsupported engine {engine!r}; use 'series' or 'tuples'.")
+
+    if isinstance(condition_func, tuple) and len(condition_func) == 3:
+        col, op, value = condition_func
+        if op not in _COMPARISONS:
+            raise ValueError(f"Unsupported operator {op!r}; use one of {list(_COMPARISONS)}.")
+        return df[_COMPARISONS[op](df[col], value)]
+    if isinstance(condition_func, str):
+        return df.query(condition_func)
     if not callable(condition_func):
         raise TypeError("condition_func must be a callable function.")
-    
+
+    if engine == "tuples":
+        mask = np.fromiter((bool(condition_func(row)) for row in df.itertuples(index=False)),
+                           dtype=bool, count=len(df))
+        return df[mask]
     return df[df.apply(condition_func, axis=1)]
 
 
@@ -635,12 +1166,15 @@ def count_unique_values(df) -> dict:
     Example:
         >>> unique_counts = count_unique_values(df)
     """
-    import pandas as pd
     
     if not isinstance(df, pd.DataFrame):
         raise TypeError("Input must be a pandas DataFrame.")
     
-    return {col: df[col].nunique() for col in df.columns}
+    return df.nunique().to_dict()  # one call for all columns
+
+# Aggregations for which one groupby(...).agg() gives pivot_table's result
+_GROUPBY_AGGS = frozenset({"sum", "mean", "median", "count", "nunique", "min", "max",
+                           "first", "last", "std", "var", "prod"})
 
 #Complex 1 - Harrang
 def pivot_and_aggregate(df, pivot_column: str, value_column: str, agg_func: str = 'sum') -> pd.DataFrame:
@@ -662,13 +1196,19 @@ def pivot_and_aggregate(df, pivot_column: str, value_column: str, agg_func: str
     Example:
         >>> pivot_df = pivot_and_aggregate(df, 'category', 'sales', 'mean')
     """
-    import pandas as pd
 
     if not isinstance(df, pd.DataFrame):
         raise TypeError("Input must be a pandas DataFrame.")
     if pivot_column not in df.columns or value_column not in df.columns:
         raise ValueError(f"Columns {pivot_column} or {value_column} not found in the DataFrame.")
 
+    if isinstance(agg_func, str) and agg_func in _GROUPBY_AGGS and pivot_column != value_column:
+        # One index and one value column: a plain groupby skips pivot_table's
+        # reshaping. Like pivot_table, drop groups whose result is NaN.
+        grouped = df.groupby(pivot_column, observed=True)[value_column].agg(agg_func)
+        out = grouped.to_frame(value_column).dropna(how="all")
+        if not out.empty:
+            return out
     return df.pivot_table(index=pivot_column, values=value_column, aggfunc=agg_func)
 
 
@@ -678,6 +1218,8 @@ def pivot_and_aggregate(df, pivot_column: str, value_column: str, agg_func: str
 
 import string
 
+_PUNCT_RE = re.compile("[" + re.escape(string.punctuation) + "]")
+
 def remove_punctuation(df):
     """
     Removes punctuation from all string columns in a DataFrame.
@@ -691,13 +1233,13 @@ def remove_punctuation(df):
     Raises:
         TypeError: If input is not a DataFrame.
     """
-    import pandas as pd
     if not isinstance(df, pd.DataFrame):
         raise TypeError("Input must be a pandas DataFrame.")
 
     df = df.copy()
     for col in df.select_dtypes(include=[object, 'string']).columns:
-        df[col] = df[col].apply(lambda x: ''.join(c for c in str(x) if c not in string.punctuation))
+        # One vectorized regex pass per column; missing values stay missing
+        df[col] = df[col].astype(str).str.replace(_PUNCT_RE, "", regex=True)
     return df
 
 
@@ -717,7 +1259,6 @@ def handle_outliers(df, threshold=1.5):
         TypeError: If input is not a DataFrame.
         ValueError: If threshold is not a positive number.
     """
-    import pandas as pd
     if not isinstance(df, pd.DataFrame):
         raise TypeError("Input must be a pandas DataFrame.")
     if not isinstance(threshold, (int, float)) or threshold <= 0:
@@ -751,7 +1292,6 @@ def split_multi_response(df, column_name, delimiter=","):
         TypeError: If input is not a DataFrame.
         ValueError: If column_name is not found in the DataFrame.
     """
-    import pandas as pd
     if not isinstance(df, pd.DataFrame):
         raise TypeError("Input must be a pandas DataFrame.")
     if column_name not in df.columns:
@@ -783,9 +1323,6 @@ def generate_data_profile(df, report_file="data_profile_report.txt"):
         TypeError: If input is not a DataFrame.
         ValueError: If DataFrame is empty.
     """
-    import pandas as pd
-    import numpy as np
-    import os
     import matplotlib.pyplot as plt
     from collections import Counter
 
@@ -1,10 +1,12 @@
 #Karl 
+import numpy as np
 import pandas as pd
 from .base_classes import Transformer
-from .research_data_lib import normalize_header, cast_row_types
+from .research_data_lib import normalize_header, normalize_headers, cast_row_types, cast_column_types
 
 
 class HeaderNormalizer(Transformer):
+    row_local = True
     def __init__(self):
         super().__init__("HeaderNormalizer")
 
@@ -12,27 +14,78 @@ class HeaderNormalizer(Transformer):
     def required_columns(self): return []
 
     def _apply(self, df):
-        new_cols = {c: normalize_header(c) for c in df.columns}
-        return df.rename(columns=new_cols)
+        # normalize_header is cached per name; headers that are already
+        # normalized (e.g. later chunks of the same file) skip the rename
+        new_cols = normalize_headers(df.columns)
+        if new_cols == df.columns.tolist():
+            return df
+        return df.set_axis(new_cols, axis=1)
+
+    def plan(self, columns):
+        return {"rename": dict(zip(columns, normalize_headers(columns)))}
     
+def _drop_columns(df, columns):
+    """df without `columns`, sharing the remaining data instead of copying it.
+
+    DataFrame.drop() copies every block it takes columns out of. Slices of
+    the kept column runs are views, so they are joined side by side instead
+    (Copy-on-Write still protects both frames). Returns df itself when none
+    of `columns` is present.
+    """
+    columns = list(columns)
+    if not columns:
+        return df
+    keep = ~df.columns.isin(columns)
+    if keep.all():
+        return df
+    edges = np.flatnonzero(np.diff(np.r_[0, keep.astype(np.int8), 0]))
+    parts = [df.iloc[:, start:stop] for start, stop in zip(edges[::2], edges[1::2])]
+    if not parts:
+        return df.iloc[:, :0]
+    return parts[0] if len(parts) == 1 else pd.concat(parts, axis=1)
+
+
 #Harrang:
 class PIIRemover(Transformer):
+    row_local = True
     def __init__(self, columns):
         super().__init__("PIIRemover")
         self.columns = columns
     @property
     def required_columns(self): return []
-    def _apply(self, df): return df.drop(columns=self.columns, errors="ignore")
+    def _apply(self, df):
+        # One drop for all present PII columns; a no-op when none are present
+        return _drop_columns(df, self.columns)
+    def plan(self, columns): return {"drop": list(self.columns)}
 
 class TypeCaster(Transformer):
-    def __init__(self, type_map):
+    row_local = True
+    def __init__(self, type_map, n_jobs=1):
         super().__init__("TypeCaster")
         self.type_map = type_map
+        self.n_jobs = n_jobs  # threads for casting columns (see cast_column_types)
     @property
     def required_columns(self): return list(self.type_map.keys())
+    def _apply(self, df): return cast_column_types(df, self.type_map, n_jobs=self.n_jobs)
+    def plan(self, columns): return {"cast": dict(self.type_map), "n_jobs": self.n_jobs}
+
+
+class Categorizer(Transformer):
+    """Store low-cardinality text columns (Likert scales, Yes/No, ...) as
+    `category`, i.e. small integer codes plus one copy of each label.
+
+    A column is converted when its share of distinct values is below
+    `threshold`.
+    """
+    def __init__(self, threshold=0.5):
+        super().__init__("Categorizer")
+        self.threshold = threshold
+    @property
+    def required_columns(self): return []
     def _apply(self, df):
-        rows = df.to_dict(orient="records")
-        from research_data_lib import cast_row_types
-        casted = [cast_row_types(r, self.type_map) for r in rows]
-        import pandas as pd
-        return pd.DataFrame(casted)
+        if len(df) == 0:
+            return df
+        text_cols = df.select_dtypes(include=["object", "string"]).columns
+        to_cat = {c: "category" for c in text_cols
+                  if df[c].nunique() / len(df) < self.threshold}
+        return df.astype(to_cat) if to_cat else df
@@ -1,9 +1,14 @@
 from dataclasses import dataclass
 from typing import List, Dict
+
+import numpy as np
+from pandas.api.extensions import ExtensionDtype
+
+from . import _validate_kernels as kernels
 from .research_data_lib import validate_dataset
 
 
-@dataclass
+@dataclass(slots=True)  # no per-issue __dict__; reports can hold many issues
 class ValidationIssue:
     row_idx: int
     column: str
@@ -14,18 +19,102 @@ class ValidationIssue:
 @dataclass
 class ValidationReport:
     issues: List[ValidationIssue]
+    rules_configured: bool = True
     @property
     def is_valid(self): return not self.issues
-    def to_markdown(self):
-        if not self.issues: return "All checks passed ✅"
-        lines = ["|Row|Column|Rule|Value|Message|","|--|--|--|--|--|"]
+    def to_markdown(self): return "".join(self.iter_markdown())
+    def iter_markdown(self):
+        """Yield the to_markdown() text in pieces (one per table row)."""
+        if not self.rules_configured:
+            yield "No validation rules configured."
+            return
+        if not self.issues:
+            yield "All checks passed ✅"
+            return
+        yield "|Row|Column|Rule|Value|Message|\n|--|--|--|--|--|"
         for i in self.issues:
-            lines.append(f"|{i.row_idx}|{i.column}|{i.rule}|{i.value}|{i.message}|")
-        return "\n".join(lines)
+            yield f"\n|{i.row_idx}|{i.column}|{i.rule}|{i.value}|{i.message}|"
+
+# Rule keys the numeric fast path understands; anything else goes row-wise.
+_NUMERIC_RULE_KEYS = {"type", "min", "max", "required", "not_null"}
+
+
+def _numeric_values(s, spec):
+    """Return the values validate_dataset would range-check for column `s`,
+    or None if the column needs the row-wise validator.
+
+    Only null-free, finite int/float columns qualify: there required/not_null
+    cannot fail and an 'int'/'float' type check always passes (after the same
+    truncation or float conversion cast_row_types applies). Plain float64 columns may
+    also hold NaN/inf unless the type is 'int': validate_dataset treats NaN as
+    a float rather than a null, and NaN fails neither range comparison.
+    """
+    if set(spec) - _NUMERIC_RULE_KEYS or spec.get("type") not in (None, "int", "float"):
+        return None
+    if s.dtype.kind not in "iuf":
+        return None
+    if (s.dtype.kind == "f" and spec.get("type") != "int"
+            and not isinstance(s.dtype, ExtensionDtype)):
+        return s.to_numpy()
+    if s.isna().any():
+        return None
+    values = s.to_numpy()
+    if s.dtype.kind == "f":
+        if not np.isfinite(values).all():
+            return None
+        if spec.get("type") == "int":
+            values = np.trunc(values).astype(np.int64)
+    elif spec.get("type") == "float":
+        # float(5) == 5.0: issues report the cast value, as validate_dataset does
+        values = values.astype(np.float64)
+    return values
+
 
 class RulesValidator:
+    @staticmethod
+    def empty_report() -> ValidationReport:
+        """Report for a run with no rules configured (no data is scanned)."""
+        return ValidationReport([], rules_configured=False)
+
     def check(self, df, rules: Dict) -> ValidationReport:
-        rows = df.to_dict(orient="records")
-        raw = validate_dataset(rows, rules)
-        issues = [ValidationIssue(**d) for d in raw]
-        return ValidationReport(issues)
+        if not rules:
+            return self.empty_report()
+        return ValidationReport([ValidationIssue(**d) for d in self.check_records(df, rules)])
+
+    def check_records(self, df, rules: Dict) -> List[Dict]:
+        """Same issues as check(), as plain dicts in validate_dataset's format.
+
+        For callers that want dicts anyway: no ValidationIssue objects are
+        built (and none converted back with dataclasses.asdict).
+        """
+        if not rules:
+            return []
+        fast = {}
+        for col, spec in rules.items():
+            if col in df.columns:
+                values = _numeric_values(df[col], spec)
+                if values is not None:
+                    fast[col] = values
+        slow = {c: spec for c, spec in rules.items() if c not in fast}
+
+        # validate_dataset reads the frame's columns directly (no row dicts)
+        raw = validate_dataset(df, slow) if slow else []
+        for col, values in fast.items():
+            spec = rules[col]
+            low, high = kernels.out_of_range(values, spec.get("min"), spec.get("max"))
+            for i in low:
+                v = values[i].item()
+                raw.append({"row_idx": int(i), "column": col, "rule": "min", "value": v,
+                            "message": f"Value {v} < min {spec['min']}."})
+            for i in high:
+                v = values[i].item()
+                raw.append({"row_idx": int(i), "column": col, "rule": "max", "value": v,
+                            "message": f"Value {v} > max {spec['max']}."})
+
+        if fast:
+            # Restore validate_dataset's order: row by row in rule order,
+            # then the uniqueness issues.
+            col_rank = {c: k for k, c in enumerate(rules)}
+            raw.sort(key=lambda d: (True, 0, 0) if d["rule"] == "unique"
+                     else (False, d["row_idx"], col_rank[d["column"]]))
+        return raw
@@ -1,5 +1,6 @@
 # test_io_and_state.py
 
+import importlib.util
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -9,6 +10,7 @@ import pandas as pd
 from research_data_lib.io_utils import (
     load_raw_csv,
     save_cleaned_csv,
+    save_cleaned_parquet,
     save_state,
     load_state,
     save_validation_report,
@@ -35,6 +37,34 @@ class TestIOUtils(unittest.TestCase):
             self.assertEqual(len(loaded), 2)
             self.assertListEqual(list(loaded.columns), ["Name", "Age"])
 
+    def test_load_raw_csv_keep_cols_and_dtypes(self):
+        """load_raw_csv only parses keep_cols and applies explicit dtypes."""
+        with TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir) / "raw.csv"
+            pd.DataFrame(
+                {
+                    "Email": ["a@umd.edu", "b@umd.edu"],
+                    "Age": [21, 19],
+                }
+            ).to_csv(tmp_path, index=False)
+
+            loaded = load_raw_csv(tmp_path, keep_cols=["Age"], dtypes={"Age": str})
+            self.assertListEqual(list(loaded.columns), ["Age"])
+            self.assertListEqual(loaded["Age"].tolist(), ["21", "19"])
+
+    def test_load_raw_csv_rereads_changed_file(self):
+        """Repeated loads are independent copies, and edits to the file are seen."""
+        with TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir) / "raw.csv"
+            pd.DataFrame({"Age": [21, 19]}).to_csv(tmp_path, index=False)
+
+            first = load_raw_csv(tmp_path)
+            first.loc[0, "Age"] = 99
+            self.assertListEqual(load_raw_csv(tmp_path)["Age"].tolist(), [21, 19])
+
+            pd.DataFrame({"Age": [21, 19, 30]}).to_csv(tmp_path, index=False)
+            self.assertEqual(len(load_raw_csv(tmp_path)), 3)
+
     def test_load_raw_csv_missing_file(self):
         """load_raw_csv raises FileNotFoundError for a missing file."""
         with TemporaryDirectory() as tmpdir:
@@ -55,6 +85,54 @@ class TestIOUtils(unittest.TestCase):
             self.assertEqual(len(reloaded), 3)
             self.assertListEqual(list(reloaded["col"]), [1, 2, 3])
 
+    def test_save_cleaned_csv_rejects_unknown_engine(self):
+        """save_cleaned_csv only knows the pandas and pyarrow writers."""
+        with TemporaryDirectory() as tmpdir:
+            with self.assertRaises(ValueError):
+                save_cleaned_csv(pd.DataFrame({"col": [1]}), Path(tmpdir) / "x.csv", engine="c")
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow not installed")
+    def test_save_cleaned_csv_pyarrow_engine_roundtrip(self):
+        """The pyarrow writer produces a CSV that reads back like the pandas one."""
+        with TemporaryDirectory() as tmpdir:
+            out_path = Path(tmpdir) / "cleaned.csv"
+            df = pd.DataFrame({"name": ["Alice", "Bob"], "age": [19, 21]})
+
+            save_cleaned_csv(df, out_path, engine="pyarrow")
+            save_cleaned_csv(df, out_path, append=True, engine="pyarrow")
+
+            reloaded = pd.read_csv(out_path)
+            self.assertListEqual(list(reloaded.columns), ["name", "age"])
+            self.assertListEqual(reloaded["age"].tolist(), [19, 21, 19, 21])
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow not installed")
+    def test_parquet_path_roundtrips_through_csv_helpers(self):
+        """A .parquet path is written and reloaded as Parquet, keeping dtypes."""
+        with TemporaryDirectory() as tmpdir:
+            out_path = Path(tmpdir) / "cleaned.parquet"
+            df = pd.DataFrame({"consent": pd.Categorical(["Yes", "No"]), "age": [19, 21]})
+
+            save_cleaned_csv(df, out_path)
+            reloaded = load_raw_csv(out_path, keep_cols=["age"])
+
+            self.assertListEqual(list(reloaded.columns), ["age"])
+            self.assertListEqual(reloaded["age"].tolist(), [19, 21])
+            with self.assertRaises(ValueError):
+                save_cleaned_csv(df, out_path, append=True)
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow not installed")
+    def test_save_cleaned_parquet_roundtrip(self):
+        """save_cleaned_parquet writes a Parquet file that keeps category dtype."""
+        with TemporaryDirectory() as tmpdir:
+            out_path = Path(tmpdir) / "cleaned.parquet"
+            df = pd.DataFrame({"consent": pd.Categorical(["Yes", "No", "Yes"]), "age": [1, 2, 3]})
+
+            written_path = save_cleaned_parquet(df, out_path)
+
+            reloaded = pd.read_parquet(written_path)
+            self.assertEqual(reloaded["consent"].dtype, "category")
+            self.assertListEqual(reloaded["age"].tolist(), [1, 2, 3])
+
     def test_save_and_load_state_roundtrip(self):
         """save_state + load_state round-trips config and history."""
         with TemporaryDirectory() as tmpdir:
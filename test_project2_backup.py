@@ -0,0 +1,117 @@
+# test_project2_backup.py
+
+import sys
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+# The Project 2 classes import each other as `src.*`
+sys.path.insert(0, str(Path(__file__).resolve().parent / "project2_backup"))
+
+from src.DataPipeline_class import DataPipeline
+from src.data_analysis import DataAnalysis
+
+
+class TestDataPipelineMerges(unittest.TestCase):
+    def test_flush_merges_appends_staged_frames_in_one_concat(self):
+        """Staged frames without keys are appended as rows, in staging order."""
+        pipe = DataPipeline(pd.DataFrame({"id": [1], "age": [19]}), name="batch")
+        pipe.stage_merge(pd.DataFrame({"id": [2], "age": [21]}))
+        pipe.stage_merge(pd.DataFrame({"id": [3], "age": [23]}))
+
+        pipe.flush_merges()
+
+        self.assertListEqual(pipe.df["id"].tolist(), [1, 2, 3])
+        self.assertListEqual(pipe.df.index.tolist(), [0, 1, 2])
+        self.assertListEqual(pipe.history, ["concat(2 datasets)"])
+
+        # Nothing staged: flushing again changes nothing
+        pipe.flush_merges()
+        self.assertEqual(len(pipe.df), 3)
+        self.assertEqual(len(pipe.history), 1)
+
+    def test_flush_merges_joins_staged_frames_on_keys(self):
+        """With `on`, all staged frames are joined to the dataset in one merge."""
+        pipe = DataPipeline(pd.DataFrame({"id": [1, 2, 3], "age": [19, 21, 23]}), name="batch")
+        pipe.stage_merge(pd.DataFrame({"id": [1], "major": ["INST"]}))
+        pipe.stage_merge(pd.DataFrame({"id": [3], "major": ["CMSC"]}))
+
+        pipe.flush_merges(on=["id"], how="left", validate="one_to_one")
+
+        self.assertEqual(pipe.df.loc[0, "major"], "INST")
+        self.assertTrue(pd.isna(pipe.df.loc[1, "major"]))
+        self.assertEqual(pipe.df.loc[2, "major"], "CMSC")
+        self.assertListEqual(pipe.history, ["merge(2 datasets, on=['id'], how=left)"])
+
+    def test_stage_merge_rejects_non_frames(self):
+        """Only DataFrames can be staged."""
+        pipe = DataPipeline(pd.DataFrame({"id": [1]}), name="batch")
+
+        with self.assertRaises(TypeError):
+            pipe.stage_merge([{"id": 2}])
+
+
+class TestDataPipelineDtypes(unittest.TestCase):
+    def test_optimize_dtypes_then_strip_text_keeps_values(self):
+        """Repeated answers become category, the rest string; stripping still works."""
+        df = pd.DataFrame({
+            "consent": [" Yes", "No ", " Yes", "No ", " Yes", "No "],
+            "comment": [" a", "b ", " c", "d ", " e", "f "],
+            "age": [19, 21, 23, 25, 27, 29],
+        })
+        pipe = DataPipeline(df, name="batch")
+
+        pipe.optimize_dtypes()
+        self.assertIsInstance(pipe.df["consent"].dtype, pd.CategoricalDtype)
+        self.assertIsInstance(pipe.df["comment"].dtype, pd.StringDtype)
+        self.assertEqual(pipe.df["age"].dtype, df["age"].dtype)
+
+        pipe.strip_text()
+        self.assertListEqual(sorted(pipe.df["consent"].cat.categories), ["No", "Yes"])
+        self.assertListEqual(pipe.df["consent"].tolist(), ["Yes", "No"] * 3)
+        self.assertListEqual(pipe.df["comment"].tolist(), list("abcdef"))
+        self.assertListEqual(pipe.history, ["optimize_dtypes(0.5)", "strip_whitespace"])
+
+
+class TestDataPipelineCleaning(unittest.TestCase):
+    def test_strip_text_and_fill_missing_skip_passes_with_nothing_to_do(self):
+        """No-op passes keep the same frame but are still logged; merges re-arm strip."""
+        pipe = DataPipeline(pd.DataFrame({"major": [" INST"], "age": [19.0]}), name="batch")
+
+        pipe.strip_text()
+        stripped = pipe._df
+        pipe.strip_text()
+        pipe.fill_missing()
+        self.assertIs(pipe._df, stripped)
+        self.assertListEqual(pipe.df["major"].tolist(), ["INST"])
+
+        pipe.stage_merge(pd.DataFrame({"major": ["CMSC "], "age": [float("nan")]}))
+        pipe.flush_merges()
+        pipe.strip_text()
+        pipe.fill_missing(strategy="zero")
+        self.assertListEqual(pipe.df["major"].tolist(), ["INST", "CMSC"])
+        self.assertListEqual(pipe.df["age"].tolist(), [19.0, 0.0])
+        self.assertListEqual(pipe.history, [
+            "strip_whitespace", "strip_whitespace", "fill_missing_values(median)",
+            "concat(1 datasets)", "strip_whitespace", "fill_missing_values(zero)",
+        ])
+
+
+class TestDataAnalysisPivot(unittest.TestCase):
+    def test_pivot_and_aggregate_reuses_result_without_sharing_edits(self):
+        """Repeat pivots come from the cache; a caller's edits never reach it."""
+        df = pd.DataFrame({"major": ["INST", "CMSC", "INST"], "age": [19, 21, 23]})
+        analysis = DataAnalysis(df)
+
+        first = analysis.pivot_and_aggregate("major", "age", "sum")
+        first.loc[first.index[0], first.columns[0]] = -1
+        second = analysis.pivot_and_aggregate("major", "age", "sum")
+
+        self.assertEqual(len(analysis._pivot_cache), 1)
+        self.assertListEqual(second.to_numpy().ravel().tolist(), [21, 42])
+        self.assertListEqual(analysis._history, ["pivot_and_aggregate(major, age, sum)"] * 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
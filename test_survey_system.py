@@ -1,9 +1,25 @@
 import unittest
+from unittest import mock
+import numpy as np
 import pandas as pd
 
-from research_data_lib.transformers import HeaderNormalizer, PIIRemover, TypeCaster
+from research_data_lib.transformers import HeaderNormalizer, PIIRemover, TypeCaster, Categorizer
 from research_data_lib.pipeline import Pipeline
 from research_data_lib.validators import RulesValidator, ValidationReport
+from research_data_lib.dataset import Dataset
+from research_data_lib.research_data_lib import (
+    cast_row_types,
+    fill_missing_values,
+    filter_rows_by_condition,
+    merge_datasets,
+    normalize_header,
+    pivot_and_aggregate,
+    remove_punctuation,
+    rename_columns,
+    rename_frame,
+    strip_whitespace,
+    validate_dataset,
+)
 
 
 
@@ -26,6 +42,42 @@ class TestHeaderNormalizer(unittest.TestCase):
         self.assertListEqual(out["q1_age"].tolist(), [19, 21])
         self.assertListEqual(out["email_address"].tolist(), ["a@umd.edu", "b@umd.edu"])
 
+    def test_header_normalizer_skips_already_normalized_headers(self):
+        """A frame whose headers are already snake_case is passed through as-is."""
+        df = pd.DataFrame({"q1_age": [19], "email_address": ["a@umd.edu"]})
+
+        self.assertIs(HeaderNormalizer().apply(df), df)
+
+    def test_normalize_header_collapses_underscore_runs(self):
+        """Underscores in the input join the surrounding run in the single regex pass."""
+        self.assertEqual(normalize_header("a__b"), "a_b")
+        self.assertEqual(normalize_header("__Q1 _-_ Age__"), "q1_age")
+        self.assertEqual(normalize_header("___"), "unnamed")
+
+    def test_normalize_header_is_memoized(self):
+        """Repeated headers should be served from normalize_header's cache."""
+        normalize_header.cache_clear()
+        HeaderNormalizer().apply(pd.DataFrame(columns=["Q1 - Age", "Email Address"]))
+        HeaderNormalizer().apply(pd.DataFrame(columns=["Q1 - Age", "Email Address"]))
+
+        info = normalize_header.cache_info()
+        self.assertEqual(info.misses, 2)
+        self.assertEqual(info.hits, 2)
+
+
+    def test_rename_frame_matches_rename_columns(self):
+        """A frame-level rename should give each row the header rename_columns gives it."""
+        df = pd.DataFrame({"Q1": [19, 21], "Name": ["Ana", "Ben"], "age": [20, 22], "x": [1, 2]})
+        rename_map = {"Q1": "Age", "Name": "", "x": "AGE"}
+
+        out = rename_frame(df, rename_map)
+
+        expected = [rename_columns(row, rename_map) for row in df.to_dict("records")]
+        self.assertListEqual(out.to_dict("records"), expected)
+        self.assertListEqual(list(df.columns), ["Q1", "Name", "age", "x"])
+        with self.assertRaises(ValueError):
+            rename_frame(pd.DataFrame([[1, 2]], columns=["a", "a"]), {})
+
 
 class TestPIIRemover(unittest.TestCase):
     def test_pii_remover_drops_columns(self):
@@ -45,7 +97,25 @@ class TestPIIRemover(unittest.TestCase):
 
         # Non-PII column should remain
         self.assertIn("age", out.columns)
-        self.assertListEqual(out["age"].tolist(), [20, 21])
+        np.testing.assert_array_equal(out["age"].to_numpy(), np.array([20, 21]))
+
+    def test_pii_remover_without_matching_columns_returns_input(self):
+        """No PII column present (or none configured) means no new frame."""
+        df = pd.DataFrame({"age": [20, 21], "score": [3.0, 4.0]})
+
+        self.assertIs(PIIRemover(columns=["email"]).apply(df), df)
+        self.assertIs(PIIRemover(columns=[]).apply(df), df)
+
+    def test_pii_remover_shares_kept_columns_without_leaking_edits(self):
+        """Dropping PII should not copy the kept data, and edits stay local."""
+        df = pd.DataFrame({"age": [20.0, 21.0], "email": [1.0, 2.0], "score": [3.0, 4.0]})
+
+        out = PIIRemover(columns=["email"]).apply(df)
+
+        self.assertListEqual(list(out.columns), ["age", "score"])
+        self.assertTrue(np.shares_memory(out["score"].to_numpy(), df["score"].to_numpy()))
+        out.loc[0, "score"] = 99.0
+        self.assertEqual(df.loc[0, "score"], 3.0)
 
 
 class TestTypeCaster(unittest.TestCase):
@@ -59,14 +129,276 @@ class TestTypeCaster(unittest.TestCase):
         step = TypeCaster(type_map={"age": "int", "consent": "bool"})
         out = step.apply(df)
 
-        # age should be integer-typed
+        # age should be integer-typed; compared as arrays (no Python lists)
         self.assertIn(out["age"].dtype.kind, ("i", "u"))
+        np.testing.assert_array_equal(out["age"].to_numpy(), np.array([19, 21], dtype=np.int64), strict=True)
+
+        # consent should be a plain bool column matching the inputs
+        np.testing.assert_array_equal(out["consent"].to_numpy(), np.array([True, False]), strict=True)
+
+    def test_type_caster_keeps_uncastable_values(self):
+        """Blank tokens become missing; values that fail to cast are kept as-is."""
+        df = pd.DataFrame({
+            "age": ["19", "n/a", "abc"],
+            "joined": ["2024-10-01", "", "2024-10-03"],
+        })
+
+        step = TypeCaster(type_map={"age": "int", "joined": "datetime:%Y-%m-%d"})
+        out = step.apply(df)
+
+        self.assertListEqual(out["age"].tolist(), [19, None, "abc"])
+        self.assertEqual(out.loc[0, "joined"], pd.Timestamp(2024, 10, 1))
+        self.assertTrue(pd.isna(out.loc[1, "joined"]))
+
+    def test_type_caster_unknown_label_only_clears_null_tokens(self):
+        """An unsupported label should blank null tokens like cast_row_types does."""
+        df = pd.DataFrame({"note": ["ok", "n/a", " keep "]})
+
+        out = TypeCaster(type_map={"note": "decimal"}).apply(df)
+
+        self.assertListEqual(out["note"].tolist(), ["ok", None, " keep "])
+
+    def test_type_caster_threads_match_serial(self):
+        """Casting with several threads should give the same frame as serial casting."""
+        df = pd.DataFrame({
+            "age": ["19", "21", "x"],
+            "score": ["3.5", "", "4"],
+            "consent": ["Yes", "no", "y"],
+        })
+        type_map = {"age": "int", "score": "float", "consent": "bool"}
+
+        serial = TypeCaster(type_map=type_map).apply(df)
+        threaded = TypeCaster(type_map=type_map, n_jobs=3).apply(df)
+
+        pd.testing.assert_frame_equal(serial, threaded)
+
+    def test_type_caster_casts_bools_and_nan_text_like_cast_row_types(self):
+        """Bools become numbers and "nan" text parses as float, per cell rules."""
+        df = pd.DataFrame({"a": [True, "3", "nan"], "b": [True, "3.5", " nan"]}, dtype=object)
+        type_map = {"a": "int", "b": "float"}
+
+        out = TypeCaster(type_map=type_map).apply(df)
+
+        self.assertListEqual(out["a"].tolist(),
+                             [cast_row_types({"a": v}, type_map)["a"] for v in df["a"]])
+        self.assertListEqual(out["b"].tolist()[:2], [1.0, 3.5])
+        self.assertTrue(np.isnan(out["b"].iloc[2]))
+
+    def test_type_caster_casts_ints_beyond_int64_like_cast_row_types(self):
+        """Values past 2**63 become Python ints, with or without a blank cell."""
+        for ids in (["12345678901234567890", "5"], ["12345678901234567890", "", "5"]):
+            df = pd.DataFrame({"id": ids})
+
+            out = TypeCaster(type_map={"id": "int"}).apply(df)
+
+            self.assertListEqual(out["id"].tolist(),
+                                 [cast_row_types({"id": v}, {"id": "int"})["id"] for v in ids])
+            self.assertEqual(out["id"].iloc[0], 12345678901234567168)
+
+    def test_type_caster_leaves_padded_dates_like_cast_row_types(self):
+        """Dates are parsed unstripped, as strptime sees them per row."""
+        rows = [{"d": " 2024-10-01"}, {"d": "2024-10-01"}, {"d": "2024-10-02"}]
+        out = TypeCaster(type_map={"d": "datetime:%Y-%m-%d"}).apply(pd.DataFrame(rows))
+
+        expected = [cast_row_types(r, {"d": "datetime:%Y-%m-%d"})["d"] for r in rows]
+        self.assertEqual(out["d"].tolist(), expected)
+        self.assertEqual(out["d"].iloc[0], " 2024-10-01")
+
+    def test_type_caster_parses_long_decimals_like_float(self):
+        """Float casts round long decimals exactly as float() does."""
+        for scores in (["-208748.25250378798", "994497.6894162479"],
+                       ["-208748.25250378798", "n/a", "994497.6894162479"]):
+            out = TypeCaster(type_map={"score": "float"}).apply(pd.DataFrame({"score": scores}))
+
+            self.assertEqual(out["score"].iloc[0], float(scores[0]))
+            self.assertEqual(out["score"].iloc[-1], float(scores[-1]))
+
+    def test_type_caster_keeps_mixed_repeated_answers_apart(self):
+        """Repeated answers are cast once each, without mixing up 1 and True."""
+        df = pd.DataFrame({"consent": ["Yes", "no", "Yes", None, "no", "Yes", 1, True]})
+
+        out = TypeCaster(type_map={"consent": "str"}).apply(df)
+
+        self.assertListEqual(out["consent"].tolist(),
+                             ["Yes", "no", "Yes", None, "no", "Yes", "1", "True"])
+
+    def test_type_caster_shares_untouched_columns(self):
+        """Only cast columns are replaced; the rest keep their buffers."""
+        df = pd.DataFrame({"age": ["19", "21"], "score": [3.0, 4.0], 7: [1.0, 2.0]})
+
+        out = TypeCaster(type_map={"age": "int", "score": "float", 7: "float"}).apply(df)
+
         self.assertListEqual(out["age"].tolist(), [19, 21])
+        self.assertTrue(np.shares_memory(out["score"].to_numpy(), df["score"].to_numpy()))
+        self.assertTrue(np.shares_memory(out[7].to_numpy(), df[7].to_numpy()))
+        self.assertListEqual(df["age"].tolist(), ["19", "21"])
+
+    def test_type_caster_casts_category_columns_like_text(self):
+        """A category column (e.g. from Categorizer) casts the same as its text."""
+        df = pd.DataFrame({
+            "consent": ["Yes", "no", None, "Yes"],
+            "age": ["19", "x", "19", "n/a"],
+        }, index=[3, 2, 1, 0])
+        type_map = {"consent": "bool", "age": "int"}
+
+        from_text = TypeCaster(type_map=type_map).apply(df)
+        from_cat = TypeCaster(type_map=type_map).apply(df.astype("category"))
+
+        pd.testing.assert_frame_equal(from_cat, from_text)
+
+
+class TestCategorizer(unittest.TestCase):
+    def test_categorizer_converts_low_cardinality_text(self):
+        """Categorizer should convert repetitive text columns only."""
+        df = pd.DataFrame({
+            "consent": ["Yes", "No", "Yes", "Yes", "No", "Yes"],
+            "comment": ["a", "b", "c", "d", "e", "f"],
+            "age": [19, 20, 19, 21, 19, 20],
+        })
+
+        out = Categorizer(threshold=0.5).apply(df)
+
+        self.assertEqual(out["consent"].dtype, "category")
+        self.assertListEqual(out["consent"].tolist(), df["consent"].tolist())
+        self.assertNotEqual(out["comment"].dtype, "category")
+        self.assertEqual(out["age"].dtype, "int64")
+
+
+class TestStripWhitespace(unittest.TestCase):
+    def test_strip_whitespace_handles_object_and_string_dtypes(self):
+        """strip_whitespace should clean both object and string-dtype columns."""
+        df = pd.DataFrame({
+            "name": pd.Series([" Alice ", "Bob "], dtype=object),
+            "city": pd.Series(["  NYC", None], dtype="string"),
+            "score": [1, 2],
+        })
+
+        out = strip_whitespace(df)
+
+        self.assertListEqual(out["name"].tolist(), ["Alice", "Bob"])
+        self.assertEqual(out.loc[0, "city"], "NYC")
+        self.assertTrue(pd.isna(out.loc[1, "city"]))
+        self.assertListEqual(df["name"].tolist(), [" Alice ", "Bob "])
+
+    def test_strip_whitespace_leaves_non_strings_in_object_columns(self):
+        """Numbers and missing values in an object column should not be turned into text."""
+        df = pd.DataFrame({"answer": pd.Series([" yes ", 3, None, 2.5], dtype=object)})
+
+        out = strip_whitespace(df)
+
+        self.assertListEqual(out["answer"].tolist()[:2], ["yes", 3])
+        self.assertIsNone(out.loc[2, "answer"])
+        self.assertEqual(out.loc[3, "answer"], 2.5)
+
+        # An object column holding no strings at all is left as it is
+        df = pd.DataFrame({"age": pd.Series([19.0, None], dtype=object)})
+        pd.testing.assert_frame_equal(strip_whitespace(df), df)
+
+    def test_strip_whitespace_strips_category_labels(self):
+        """Category columns stay categorical, with labels stripped (and merged if equal)."""
+        df = pd.DataFrame({"consent": pd.Categorical([" Yes", "No ", "Yes", " Yes"])})
+
+        out = strip_whitespace(df)
+
+        self.assertEqual(out["consent"].dtype, "category")
+        self.assertListEqual(out["consent"].tolist(), ["Yes", "No", "Yes", "Yes"])
+
+
+class TestRemovePunctuation(unittest.TestCase):
+    def test_remove_punctuation_strips_text_and_keeps_missing(self):
+        """remove_punctuation should clean text columns and leave numbers and missing values alone."""
+        df = pd.DataFrame({
+            "comment": ["Great!", "So-so...", None],
+            "score": [10, 999, 5],
+        })
+
+        out = remove_punctuation(df)
+
+        self.assertListEqual(out["comment"].tolist()[:2], ["Great", "Soso"])
+        self.assertTrue(pd.isna(out.loc[2, "comment"]))
+        self.assertListEqual(out["score"].tolist(), [10, 999, 5])
+
+
+class TestFillMissingValues(unittest.TestCase):
+    def test_fill_missing_values_fills_numeric_columns_only(self):
+        """Each numeric column gets its own fill value; text and the input frame are untouched."""
+        df = pd.DataFrame({
+            "age": [20.0, None, 30.0],
+            "score": [None, 4.0, 4.0],
+            "name": ["a", None, "c"],
+        })
+
+        median = fill_missing_values(df, strategy="median")
+        mode = fill_missing_values(df, strategy="mode")
+
+        self.assertListEqual(median["age"].tolist(), [20.0, 25.0, 30.0])
+        self.assertListEqual(median["score"].tolist(), [4.0, 4.0, 4.0])
+        self.assertListEqual(mode["age"].tolist(), [20.0, 20.0, 30.0])
+        self.assertTrue(pd.isna(median.loc[1, "name"]))
+        self.assertTrue(pd.isna(df.loc[1, "age"]))
+
+
+class TestMergeDatasets(unittest.TestCase):
+    def test_merge_datasets_joins_on_shared_columns_and_validates_keys(self):
+        """merge_datasets should join on shared columns and honour validate=."""
+        left = pd.DataFrame({"id": [1, 2], "age": [19, 21]})
+        right = pd.DataFrame({"id": [2, 3], "major": ["INST", "CMSC"]})
+
+        out = merge_datasets([left, right], how="outer")
+
+        self.assertListEqual(out["id"].tolist(), [1, 2, 3])
+        self.assertListEqual(out.index.tolist(), [0, 1, 2])
+        self.assertEqual(out.loc[1, "major"], "INST")
+
+        dupes = pd.DataFrame({"id": [2, 2], "major": ["INST", "CMSC"]})
+        with self.assertRaises(pd.errors.MergeError):
+            merge_datasets([left, dupes], validate="one_to_one")
+
+
+class TestFilterRows(unittest.TestCase):
+    def test_filter_rows_tuples_engine_matches_series_rows(self):
+        """engine="tuples" should keep the same rows as a per-row Series function."""
+        df = pd.DataFrame({"age": [25, 31, 40], "major": ["INST", "CMSC", "INST"]})
+
+        by_series = filter_rows_by_condition(
+            df, lambda row: row["age"] > 30 and row["major"] == "INST")
+        by_tuples = filter_rows_by_condition(
+            df, lambda row: row.age > 30 and row.major == "INST", engine="tuples")
+
+        pd.testing.assert_frame_equal(by_tuples, by_series)
+        self.assertListEqual(by_tuples.index.tolist(), [2])
+        with self.assertRaises(ValueError):
+            filter_rows_by_condition(df, lambda row: True, engine="numba")
+
+    def test_filter_rows_calls_row_functions_per_row(self):
+        """Row functions only ever see single rows, never the whole DataFrame."""
+        df = pd.DataFrame({"age": [25, 31, 40]})
+        seen = []
+
+        def older_than_average(row):
+            seen.append(type(row))
+            return row["age"] > row["age"].mean()  # a row's mean is its own age
+
+        out = filter_rows_by_condition(df, older_than_average)
+
+        self.assertTrue(out.empty)
+        self.assertListEqual(seen, [pd.Series] * 3)
 
-        # consent should be boolean and all values True/False
-        self.assertTrue(out["consent"].isin([True, False]).all())
-        # And the logical casting should match the inputs
-        self.assertListEqual(out["consent"].tolist(), [True, False])
+
+class TestPivotAndAggregate(unittest.TestCase):
+    def test_pivot_and_aggregate_matches_pivot_table(self):
+        """The groupby path should give pivot_table's result, all-NaN groups dropped."""
+        df = pd.DataFrame({
+            "major": ["INST", "CMSC", "INST", "MATH"],
+            "score": [80.0, 90.0, 70.0, float("nan")],
+        })
+
+        for agg in ("mean", "sum", "count"):
+            out = pivot_and_aggregate(df, "major", "score", agg)
+            pd.testing.assert_frame_equal(
+                out, df.pivot_table(index="major", values="score", aggfunc=agg))
+        self.assertListEqual(pivot_and_aggregate(df, "major", "score", "mean").index.tolist(),
+                             ["CMSC", "INST"])
 
 
 class TestValidation(unittest.TestCase):
@@ -101,6 +433,110 @@ class TestValidation(unittest.TestCase):
         self.assertIn("All checks passed", md)
 
 
+    def test_validation_reports_numeric_range_issues_in_row_order(self):
+        """Range issues on numeric columns come back row by row, in rule order."""
+        df = pd.DataFrame({
+            "age": [-1, 30, 150],
+            "score": [5.5, 50.0, 101.0],
+        })
+        rules = {
+            "age": {"type": "int", "min": 0, "max": 120},
+            "score": {"type": "float", "min": 10, "max": 100},
+        }
+
+        report = RulesValidator().check(df, rules)
+
+        got = [(i.row_idx, i.column, i.rule, i.value) for i in report.issues]
+        self.assertListEqual(got, [
+            (0, "age", "min", -1),
+            (0, "score", "min", 5.5),
+            (2, "age", "max", 150),
+            (2, "score", "max", 101.0),
+        ])
+
+    def test_validation_int_column_with_float_type_reports_floats(self):
+        """An int column checked as 'float' reports cast values, like validate_dataset."""
+        df = pd.DataFrame({"score": [5, 50, 101]})
+        rules = {"score": {"type": "float", "min": 10, "max": 100}}
+
+        report = RulesValidator().check(df, rules)
+
+        got = [(i.row_idx, i.rule, repr(i.value), i.message) for i in report.issues]
+        self.assertListEqual(got, [(0, "min", "5.0", "Value 5.0 < min 10."),
+                                   (2, "max", "101.0", "Value 101.0 > max 100.")])
+
+    def test_validation_range_checks_skip_nan_floats(self):
+        """NaN in a float column is not null and never fails min/max."""
+        df = pd.DataFrame({"score": [5.5, float("nan"), 101.0]})
+        rules = {"score": {"type": "float", "min": 10, "max": 100, "required": True}}
+
+        report = RulesValidator().check(df, rules)
+
+        self.assertListEqual([(i.row_idx, i.rule) for i in report.issues],
+                             [(0, "min"), (2, "max")])
+
+
+    def test_validate_dataset_casts_repeated_values_per_cell(self):
+        """Repeated answers share one cast, but every bad cell is still reported."""
+        rows = [{"age": "5"}, {"age": "x"}, {"age": "5"}, {"age": "x"}, {"age": 0.0}]
+
+        issues = validate_dataset(rows, {"age": {"type": "float", "min": 1}})
+
+        self.assertListEqual([(i["row_idx"], i["rule"]) for i in issues],
+                             [(1, "type"), (3, "type"), (4, "min")])
+
+    def test_validate_dataset_accepts_a_dataframe(self):
+        """A frame is validated like its records, including <NA> as null."""
+        df = pd.DataFrame({
+            "age": pd.array([19, None, 150], dtype="Int64"),
+            "email": ["a@umd.edu", "b", "a@umd.edu"],
+        })
+        rules = {
+            "age": {"type": "int", "required": True, "max": 120},
+            "email": {"regex": r".+@.+", "unique": True},
+            "name": {"required": True},
+        }
+
+        issues = validate_dataset(df, rules)
+
+        self.assertListEqual(issues, validate_dataset(df.to_dict("records"), rules))
+        self.assertIn((1, "age", "required"),
+                      [(i["row_idx"], i["column"], i["rule"]) for i in issues])
+
+    def test_validation_flags_every_duplicate_of_a_unique_value(self):
+        """unique should flag all rows sharing a value, including the first."""
+        df = pd.DataFrame({"student_id": ["7", "8", "7", "9"]})
+        rules = {"student_id": {"type": "int", "unique": True}}
+
+        report = RulesValidator().check(df, rules)
+
+        self.assertListEqual([(i.row_idx, i.rule) for i in report.issues],
+                             [(0, "unique"), (2, "unique")])
+
+    def test_validation_treats_nullable_missing_values_as_null(self):
+        """<NA> in nullable columns should be reported like None."""
+        df = pd.DataFrame({
+            "age": pd.array([19, None], dtype="Int64"),
+            "city": pd.Series(["NYC", None], dtype="string"),
+        })
+        rules = {"age": {"type": "int", "not_null": True}, "city": {"required": True}}
+
+        report = RulesValidator().check(df, rules)
+
+        self.assertListEqual([(i.row_idx, i.column, i.rule, i.value) for i in report.issues],
+                             [(1, "age", "not_null", None), (1, "age", "type", None),
+                              (1, "city", "required", None)])
+
+    def test_validation_without_rules_returns_empty_report(self):
+        """check() with no rules should say so instead of claiming success."""
+        df = pd.DataFrame({"age": [25, 30]})
+
+        report = RulesValidator().check(df, {})
+
+        self.assertTrue(report.is_valid)
+        self.assertEqual(report.to_markdown(), "No validation rules configured.")
+
+
 class TestPipeline(unittest.TestCase):
     def test_pipeline_runs_all_steps_in_order(self):
         """
@@ -129,6 +565,211 @@ class TestPipeline(unittest.TestCase):
         # Data still intact in remaining column
         self.assertListEqual(out["q1_age"].tolist(), [19])
 
+    def test_pipeline_compile_fuses_steps(self):
+        """compile() should merge rename/drop/cast steps into a single plan."""
+        df = pd.DataFrame({
+            "Q1 - Age": ["19", "21"],
+            "Email Address": ["a@umd.edu", "b@umd.edu"],
+            "Q2 - Consent": ["Yes", "no"],
+        })
+
+        pipe = Pipeline([
+            HeaderNormalizer(),
+            PIIRemover(columns=["email_address"]),
+            TypeCaster(type_map={"q1_age": "int", "q2_consent": "bool"}),
+        ])
+        plan = pipe.compile(df)
+
+        self.assertEqual(plan.n_steps, 3)
+        self.assertListEqual(plan.drop, ["Email Address"])
+        self.assertDictEqual(plan.rename, {"Q1 - Age": "q1_age", "Q2 - Consent": "q2_consent"})
+        self.assertDictEqual(plan.cast, {"q1_age": "int", "q2_consent": "bool"})
+
+        # Fused and step-by-step execution must agree
+        pd.testing.assert_frame_equal(pipe.run(df), pipe.run(df, fused=False))
+
+        # A cast column renamed onto another column's name ends the fused run
+        df = pd.DataFrame({"Age": ["19", "21"], "age": ["20", "x"]})
+        pipe = Pipeline([TypeCaster(type_map={"Age": "int"}), HeaderNormalizer()])
+        plan = pipe.compile(df)
+
+        self.assertEqual(plan.n_steps, 1)
+        self.assertDictEqual(plan.cast, {"Age": "int"})
+        pd.testing.assert_frame_equal(pipe.run(df), pipe.run(df, fused=False))
+
+        # ...and a dropped cast column's name does not carry its cast over
+        df = pd.DataFrame({"X": ["1", "x"], "x": ["2", ""]})
+        pipe = Pipeline([TypeCaster(type_map={"x": "str"}), PIIRemover(columns=["x"]),
+                         HeaderNormalizer()])
+
+        self.assertDictEqual(pipe.compile(df).cast, {})
+        pd.testing.assert_frame_equal(pipe.run(df), pipe.run(df, fused=False))
+
+    def test_pipeline_reuses_plan_until_steps_change(self):
+        """run() should compile once per column layout; add_step() resets it."""
+        df = pd.DataFrame({"Q1 - Age": ["19"], "Email Address": ["a@umd.edu"]})
+        pipe = Pipeline([HeaderNormalizer()])
+
+        pipe.run(df)
+        plan = pipe._plan_for(df)
+        pipe.run(df)
+        self.assertIs(pipe._plan_for(df), plan)
+
+        pipe.add_step(PIIRemover(columns=["email_address"]))
+        out = pipe.run(df)
+        self.assertIsNot(pipe._plan_for(df), plan)
+        self.assertListEqual(list(out.columns), ["q1_age"])
+
+    def test_pipeline_row_chunks_match_serial_run(self):
+        """n_jobs splits large frames by rows without changing the result."""
+        df = pd.DataFrame({
+            "Q1 - Age": ["19", "21", "20", "22", "23", "24"],
+            "Email Address": ["a@umd.edu"] * 6,
+        }, index=[5, 4, 3, 2, 1, 0])
+        bad = df.assign(**{"Q1 - Age": ["19", "21", "20", "22", "23", "x"]})
+        pipe = Pipeline([
+            HeaderNormalizer(),
+            PIIRemover(columns=["email_address"]),
+            TypeCaster(type_map={"q1_age": "int"}),
+        ])
+
+        with mock.patch("research_data_lib.pipeline._PARALLEL_MIN_ROWS", 0):
+            for frame in (df, bad):  # "x" leaves only the last chunk as object
+                for fused in (True, False):
+                    pd.testing.assert_frame_equal(pipe.run(frame, fused=fused, n_jobs=3),
+                                                  pipe.run(frame, fused=fused))
+            pipe.history.clear()
+            pipe.run(df, n_jobs=3)
+        self.assertEqual(len(pipe.history), 3)  # one entry per step, not per chunk
+
+    def test_shallow_copies_do_not_leak_edits(self):
+        """With Copy-on-Write on, edits to a shallow copy never reach the original."""
+        df = pd.DataFrame({"age": [19, 21]})
+        view = df.copy(deep=False)
+        view.loc[0, "age"] = 99
+        self.assertEqual(df.loc[0, "age"], 19)
+
+    def test_pipeline_does_not_modify_input(self):
+        """Pipeline.run should leave the caller's DataFrame untouched."""
+        df = pd.DataFrame({
+            "Q1 - Age": ["19", "21"],
+            "Email Address": ["a@umd.edu", "b@umd.edu"]
+        })
+
+        pipe = Pipeline([
+            HeaderNormalizer(),
+            PIIRemover(columns=["email_address"]),
+            TypeCaster(type_map={"q1_age": "int"}),
+        ])
+        pipe.run(df)
+
+        self.assertListEqual(list(df.columns), ["Q1 - Age", "Email Address"])
+        self.assertListEqual(df["Q1 - Age"].tolist(), ["19", "21"])
+
+
+class TestDataset(unittest.TestCase):
+    def test_dataset_renames_ragged_rows_like_per_row_rename(self):
+        """Colliding renames and headers resolve within each row's own keys."""
+        rows = [{"joined": "1", "Age": "1"}, {"joined": "NA", "Q1": ""}, {"q1": "2", "Q1": "3"}]
+        rename_map = {"Q1": "x", "Age": "x"}
+
+        ds = Dataset(rows, name="ragged", rename_map=rename_map)
+        ds.apply_rename_map()
+        expected = [rename_columns(r, rename_map) for r in rows]
+        self.assertListEqual(ds.snapshot(), expected)
+        self.assertDictEqual(ds.snapshot()[1], {"joined": "NA", "x": ""})
+
+        ds = Dataset([{"q1": "a", "z": 1}, {"Q1": "b", "q1": "c"}, {"q1": "d", "Q1": "e"}], name="headers")
+        ds.clean_headers()
+        self.assertListEqual(ds.snapshot(), [{"q1": "a", "z": 1}, {"q1": "c"}, {"q1": "e"}])
+
+    def test_dataset_casts_nan_cells_like_cast_row_types(self):
+        """A NaN cell is cast like any other value, not treated as missing."""
+        ds = Dataset([{"age": float("nan")}, {"age": "3"}], name="nan", type_map={"age": "int"})
+        ds.cast_types()
+
+        issues = ds.validate({"age": {"type": "int", "required": True}})
+
+        self.assertListEqual([(i["row_idx"], i["rule"]) for i in issues], [(0, "type")])
+
+    def test_dataset_validates_mixed_int_float_cells_like_validate_dataset(self):
+        """An int next to floats is checked as the int it is, not as 5.0."""
+        rows = [{"code": 5}, {"code": 2.5}]
+        rules = {"code": {"type": "str", "regex": r"\d+"}}
+
+        issues = Dataset(rows, name="mixed").validate(rules)
+
+        self.assertListEqual(issues, validate_dataset(rows, rules))
+        self.assertListEqual([i["row_idx"] for i in issues], [1])
+
+    def test_dataset_cleans_casts_and_iterates_rows(self):
+        """Dataset should clean column-wise and still hand back row dicts."""
+        rows = [
+            {"Q1": "19", "Q2": "Yes", "Email Address": "a@b.com"},
+            {"Q1": "n/a", "Q2": "No"},
+        ]
+        ds = Dataset(rows, name="pilot",
+                     rename_map={"Q1": "age", "Q2": "consent", "Email Address": ""},
+                     type_map={"age": "int", "consent": "bool"})
+        ds.apply_rename_map()
+        ds.cast_types()
+
+        self.assertListEqual(list(ds), [
+            {"age": 19, "consent": True},
+            {"age": None, "consent": False},
+        ])
+        issues = ds.validate({"age": {"type": "int", "required": True}})
+        self.assertListEqual([(i["row_idx"], i["rule"]) for i in issues],
+                             [(1, "required"), (1, "type")])
+        self.assertEqual(str(ds), "Dataset 'pilot' | 2 rows, 2 columns (cleaned=True)")
+
+    def test_dataset_cast_threads_match_serial(self):
+        """cast_types(n_jobs=...) should give the same rows as a serial cast."""
+        rows = [
+            {"age": "19", "score": "3.5", "consent": "Yes"},
+            {"age": "x", "score": "", "consent": "no"},
+            {"age": "21", "consent": "maybe"},
+        ]
+        type_map = {"age": "int", "score": "float", "consent": "bool"}
+        serial = Dataset(rows, name="serial", type_map=type_map)
+        threaded = Dataset(rows, name="threaded", type_map=type_map)
+
+        serial.cast_types()
+        threaded.cast_types(n_jobs=3)
+
+        self.assertListEqual(threaded.snapshot(), serial.snapshot())
+
+    def test_dataset_rejects_non_dict_rows(self):
+        """A row that is not a dict should be rejected wherever it appears."""
+        with self.assertRaises(ValueError):
+            Dataset([{"age": "19"}, ["20"], {"age": "21"}], name="pilot")
+
+    def test_dataset_columns_follow_renames_and_drops(self):
+        """Cached column names should be refreshed after key-changing steps."""
+        ds = Dataset([{"Q1": "19", "Email": "a@b.com"}], name="pilot",
+                     rename_map={"Q1": "Age"}, pii_columns={"Email"})
+        self.assertListEqual(ds.columns, ["Email", "Q1"])
+
+        ds.apply_rename_map()
+        self.assertListEqual(ds.columns, ["Email", "age"])
+        ds.drop_pii()
+        self.assertListEqual(ds.columns, ["age"])
+        self.assertEqual(ds.n_cols, 1)
+
+    def test_dataset_to_frame_tracks_casts(self):
+        """to_frame() should reflect the latest cast and fill ragged gaps with None."""
+        ds = Dataset([{"age": "19", "note": "hi"}, {"age": "21"}], name="pilot",
+                     type_map={"age": "int"})
+        before = ds.to_frame()
+        self.assertListEqual(before["age"].tolist(), ["19", "21"])
+        self.assertListEqual(before["note"].tolist(), ["hi", None])
+
+        ds.cast_types()
+        after = ds.to_frame()
+        self.assertEqual(after["age"].dtype.kind, "i")
+        self.assertListEqual(after["age"].tolist(), [19, 21])
+        self.assertListEqual(before["age"].tolist(), ["19", "21"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -84,6 +84,28 @@ class TestSystemWorkflow(unittest.TestCase):
             self.assertTrue(cleaned_path.exists())
             self.assertTrue(report_path.exists())
 
+    def test_run_workflow_streaming_matches_full_load(self):
+        """
+        System test:
+
+        - Run the workflow once in memory and once streamed in 1-row chunks
+        - The cleaned CSVs should contain the same data
+        """
+        with TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+
+            input_csv = tmpdir / "raw.csv"
+            self._make_sample_csv(input_csv)
+
+            self.assertEqual(run_workflow(input_csv, tmpdir / "full", state_path=None), 0)
+            exit_code = run_workflow(input_csv, tmpdir / "stream", state_path=None, chunksize=1)
+            self.assertEqual(exit_code, 0)
+
+            full = pd.read_csv(tmpdir / "full" / "cleaned_survey.csv")
+            streamed = pd.read_csv(tmpdir / "stream" / "cleaned_survey.csv")
+            pd.testing.assert_frame_equal(full, streamed)
+            self.assertNotIn("email", streamed.columns)
+
     def test_run_workflow_missing_input_file(self):
         """
         System test: